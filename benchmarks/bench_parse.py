@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""
+Sentences per second through the built-in fast parser and through pynmea2,
+over a recorded corpus (a raw NMEA log or an I2C capture from example 3)
+or, without one, a built-in sample epoch.
+
+    python benchmarks/bench_parse.py [corpus]
+"""
+
+from __future__ import print_function
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pynmea2
+import qwiic_titan_gps
+
+def _sentence(body):
+    return '${}*{:02X}\r\n'.format(body, qwiic_titan_gps._nmea_checksum(body.encode()))
+
+SAMPLE = ''.join(_sentence(body) for body in (
+    'GPGGA,123519.00,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,',
+    'GPRMC,123519.00,A,4807.038,N,01131.000,E,022.4,084.4,230394,003.1,W',
+    'GPGSA,A,3,04,05,,09,12,,,24,,,,,2.5,1.3,2.1',
+    'GPVTG,054.7,T,034.4,M,005.5,N,010.2,K',
+    'GPGSV,2,1,08,01,40,083,46,02,17,308,41,12,07,344,39,14,22,228,45',
+    'GPGSV,2,2,08,15,40,083,46,16,17,308,,17,07,344,39,18,22,228,45',
+)).encode() * 500
+
+def load_corpus(path):
+
+    # Frame the corpus the way the driver would, through a replayed device.
+    driver = qwiic_titan_gps.ReplayI2CDriver.from_file(path) if path else \
+        qwiic_titan_gps.ReplayI2CDriver(SAMPLE)
+    framer = qwiic_titan_gps.NmeaFramer()
+    sentences = []
+    while not driver.finished:
+        sentences.extend(framer.feed(bytes(driver.readBlock(0x10, 0, 255))))
+    return sentences
+
+def rate(func, sentences, repeat=3):
+
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(sentences)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return len(sentences) / best
+
+def fast(sentences):
+    for sentence in sentences:
+        qwiic_titan_gps.parse_nmea(sentence, fast=True)
+
+def slow(sentences):
+    for sentence in sentences:
+        try:
+            pynmea2.parse(sentence)
+        except pynmea2.ParseError:
+            pass
+
+def merge(fast_parser):
+
+    def run(sentences):
+        gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=qwiic_titan_gps.ReplayI2CDriver(b''))
+        gps.fast_parser = fast_parser
+        gps.parse_sentences(sentences)
+    return run
+
+def main(path):
+
+    sentences = load_corpus(path)
+    print("corpus: {} sentences".format(len(sentences)))
+    print("parse only         fast: {:9.0f}/s  pynmea2: {:9.0f}/s".format(
+        rate(fast, sentences), rate(slow, sentences)))
+    print("parse_sentences    fast: {:9.0f}/s  pynmea2: {:9.0f}/s".format(
+        rate(merge(True), sentences), rate(merge(False), sentences)))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of one get_raw_data() poll: the original list and string
+concatenation read path against the preallocated buffer. Reports the time
+and the peak memory allocated (tracemalloc) per poll.
+
+    python benchmarks/bench_read.py [polls]
+"""
+
+from __future__ import print_function
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import qwiic_titan_gps
+
+def _sentence(body):
+    return '${}*{:02X}\r\n'.format(body, qwiic_titan_gps._nmea_checksum(body.encode()))
+
+EPOCH = ''.join(_sentence(body) for body in (
+    'GPGGA,123519.00,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,',
+    'GPRMC,123519.00,A,4807.038,N,01131.000,E,022.4,084.4,230394,003.1,W',
+    'GPGSA,A,3,04,05,,09,12,,,24,,,,,2.5,1.3,2.1',
+    'GPVTG,054.7,T,034.4,M,005.5,N,010.2,K',
+)).encode()
+
+def legacy_get_raw_data(driver, address, max_gps=255, max_i2c=32):
+
+    # get_raw_data() as it was before the rewrite.
+    raw_sentences = ""
+    buffer_tracker = max_gps
+    raw_data = []
+
+    while buffer_tracker != 0:
+        if buffer_tracker > max_i2c:
+            raw_data.extend(driver.readBlock(address, 0x00, max_i2c))
+            buffer_tracker = buffer_tracker - max_i2c
+            if raw_data[0] == 0x0A:
+                break
+        elif buffer_tracker < max_i2c:
+            raw_data.extend(driver.readBlock(address, 0x00, buffer_tracker))
+            buffer_tracker = 0
+            if raw_data[0] == 0x0A:
+                break
+
+        for raw_bytes in raw_data:
+            raw_sentences = raw_sentences + chr(raw_bytes)
+
+    return raw_sentences
+
+def peak_allocated(func, polls):
+
+    # Mean of the highest memory traced during each call, above what was
+    # allocated before it.
+    func()
+    tracemalloc.start()
+    total = 0
+    for _ in range(polls):
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.stop()
+            tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        func()
+        total += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+    return total / polls
+
+def main(polls):
+
+    legacy_driver = qwiic_titan_gps.ReplayI2CDriver(EPOCH * 4, loop=True)
+    legacy_poll = lambda: legacy_get_raw_data(legacy_driver, 0x10)
+    legacy = timeit.timeit(legacy_poll, number=polls)
+    legacy_bytes = peak_allocated(legacy_poll, min(polls, 1000))
+
+    gps = qwiic_titan_gps.QwiicTitanGps(
+        i2c_driver=qwiic_titan_gps.ReplayI2CDriver(EPOCH * 4, loop=True))
+    gps.use_rdwr = False
+    current = timeit.timeit(gps.get_raw_data, number=polls)
+    current_bytes = peak_allocated(gps.get_raw_data, min(polls, 1000))
+
+    print("legacy get_raw_data: {:8.1f} us/poll {:8.0f} bytes/poll".format(
+        legacy / polls * 1e6, legacy_bytes))
+    print("get_raw_data:        {:8.1f} us/poll {:8.0f} bytes/poll".format(
+        current / polls * 1e6, current_bytes))
+    print("speedup:             {:8.1f}x".format(legacy / current))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+#-----------------------------------------------------------------------------
+# qwiic_gps_ex3.py
+#
+# Record and Replay Example for SparkFun GPS Breakout - XA1110
+# In this example the I2C traffic from the GPS module is recorded to a file,
+# which can then be replayed without any hardware to measure how fast the
+# driver reads, frames and parses the data.
+#
+#   qwiic_gps_ex3.py record capture.bin [seconds]
+#   qwiic_gps_ex3.py replay capture.bin
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2019
+#
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2019 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+# Example 3
+#
+
+from __future__ import print_function
+from time import monotonic
+import sys
+import qwiic_i2c
+import qwiic_titan_gps
+
+def record(path, seconds):
+
+    print("Recording the SparkFun GPS Breakout - XA1110 to {}".format(path))
+    recorder = qwiic_titan_gps.I2CRecorder(qwiic_i2c.getI2CDriver(), path)
+    qwiicGPS = qwiic_titan_gps.QwiicTitanGps(i2c_driver=recorder)
+
+    if qwiicGPS.connected is False:
+        print("Could not connect to to the SparkFun GPS Unit. Double check that\
+              it's wired correctly.", file=sys.stderr)
+        return
+
+    qwiicGPS.begin()
+
+    end = monotonic() + seconds
+    while monotonic() < end:
+        qwiicGPS.parse_sentences(qwiicGPS.poll())
+
+    recorder.close()
+    print("Recorded {} fixes.".format(qwiicGPS.fixes_read))
+
+def replay(path):
+
+    print("Replaying {} as fast as possible".format(path))
+    driver = qwiic_titan_gps.ReplayI2CDriver.from_file(path)
+    qwiicGPS = qwiic_titan_gps.QwiicTitanGps(i2c_driver=driver)
+    framer = qwiic_titan_gps.NmeaFramer()
+
+    stages = {'read': 0.0, 'frame': 0.0, 'parse': 0.0}
+    polls = 0
+    sentences = 0
+    fixes = 0
+
+    while not driver.finished:
+        start = monotonic()
+        data = qwiicGPS.read_raw_bytes()
+        read = monotonic()
+        complete = list(framer.feed(data))
+        framed = monotonic()
+        qwiicGPS.parse_sentences(complete)
+        parsed = monotonic()
+
+        stages['read'] += read - start
+        stages['frame'] += framed - read
+        stages['parse'] += parsed - framed
+        polls += 1
+        sentences += len(complete)
+        fixes += sum(1 for sentence in complete if sentence[3:6] == 'GGA')
+
+    total = sum(stages.values())
+    print("Polls: {}, sentences: {}, fixes: {}, bytes: {}".format(
+        polls, sentences, fixes, qwiicGPS.bus_bytes_read))
+    print("Fixes/sec: {:.0f}, sentences/sec: {:.0f}, bytes/sec: {:.0f}".format(
+        fixes / total, sentences / total, qwiicGPS.bus_bytes_read / total))
+    for name, seconds in stages.items():
+        print("  {:<6} {:8.1f} us/poll".format(name, seconds / polls * 1e6))
+
+def run_example():
+
+    if len(sys.argv) < 3 or sys.argv[1] not in ('record', 'replay'):
+        print("usage: qwiic_gps_ex3.py record|replay FILE [seconds]", file=sys.stderr)
+        return
+
+    if sys.argv[1] == 'record':
+        record(sys.argv[2], float(sys.argv[3]) if len(sys.argv) > 3 else 60)
+    else:
+        replay(sys.argv[2])
+
+
+if __name__ == '__main__':
+    try:
+        run_example()
+    except (KeyboardInterrupt, SystemExit) as exErr:
+        print("Ending Record and Replay Example.")
+        sys.exit(0)
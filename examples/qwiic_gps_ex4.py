@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+#-----------------------------------------------------------------------------
+# qwiic_gps_ex4.py
+#
+# Broadcast Server Example for SparkFun GPS Breakout - XA1110
+# In this example one process reads the GPS module and serves its NMEA
+# sentences and JSON fixes over TCP, so any number of other processes can
+# use the GPS at once (try: nc localhost 10110). The bench mode replays a
+# capture from example 3 as fast as possible to many local clients to
+# measure throughput.
+#
+#   qwiic_gps_ex4.py serve [port]
+#   qwiic_gps_ex4.py bench capture.bin [clients] [seconds]
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2019
+#
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2019 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+# Example 4
+#
+
+from __future__ import print_function
+from time import monotonic
+import asyncio
+import sys
+import qwiic_titan_gps
+
+async def serve(port):
+
+    qwiicGPS = qwiic_titan_gps.QwiicTitanGps()
+
+    if qwiicGPS.connected is False:
+        print("Could not connect to to the SparkFun GPS Unit. Double check that\
+              it's wired correctly.", file=sys.stderr)
+        return
+
+    qwiicGPS.begin()
+
+    server = qwiic_titan_gps.NmeaServer(qwiicGPS, tcp=('0.0.0.0', port),
+                                        formats=('nmea', 'json'))
+    print("Serving on port {}".format(port))
+    await server.serve_forever()
+
+async def client(port, seconds, counts):
+
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    end = monotonic() + seconds
+    while monotonic() < end:
+        data = await reader.read(65536)
+        if not data:
+            break
+        counts[0] += len(data)
+        counts[1] += data.count(b'\n')
+    writer.close()
+
+async def bench(path, clients, seconds):
+
+    driver = qwiic_titan_gps.ReplayI2CDriver.from_file(path, loop=True)
+    qwiicGPS = qwiic_titan_gps.QwiicTitanGps(i2c_driver=driver)
+    qwiicGPS.update_interval = 0
+
+    server = qwiic_titan_gps.NmeaServer(qwiicGPS, tcp=('127.0.0.1', 0))
+    await server.start()
+    port = server.addresses[0][1]
+
+    counts = [[0, 0] for _ in range(clients)]
+    start = monotonic()
+    await asyncio.gather(*[client(port, seconds, count) for count in counts])
+    elapsed = monotonic() - start
+    await server.close()
+    server.gps.close()
+
+    received = sum(count[0] for count in counts)
+    lines = sum(count[1] for count in counts)
+    print("Clients: {}, polls published: {}, dropped: {}".format(
+        clients, server.payloads, server.dropped))
+    print("Sentences/sec to each client: {:.0f}, total: {:.0f}".format(
+        lines / elapsed / clients, lines / elapsed))
+    print("Bytes/sec total: {:.0f}".format(received / elapsed))
+
+def run_example():
+
+    if len(sys.argv) < 2 or sys.argv[1] not in ('serve', 'bench') or \
+       (sys.argv[1] == 'bench' and len(sys.argv) < 3):
+        print("usage: qwiic_gps_ex4.py serve [port] | bench FILE [clients] [seconds]",
+              file=sys.stderr)
+        return
+
+    loop = asyncio.get_event_loop()
+    if sys.argv[1] == 'serve':
+        loop.run_until_complete(serve(int(sys.argv[2]) if len(sys.argv) > 2 else 10110))
+    else:
+        loop.run_until_complete(bench(sys.argv[2],
+                                      int(sys.argv[3]) if len(sys.argv) > 3 else 50,
+                                      float(sys.argv[4]) if len(sys.argv) > 4 else 5))
+
+
+if __name__ == '__main__':
+    try:
+        run_example()
+    except (KeyboardInterrupt, SystemExit) as exErr:
+        print("Ending Broadcast Server Example.")
+        sys.exit(0)
@@ -61,8 +61,72 @@ New to Qwiic? Take a look at the entire `SparkFun Qwiic ecosystem <https://www.s
 from __future__ import print_function,division
 
 import sys
-import qwiic_i2c
-import pynmea2
+import datetime
+import time
+import threading
+import importlib
+import struct
+import random
+import bisect
+import re
+import os
+import mmap
+import math
+import errno
+import zlib
+from types import MappingProxyType
+from collections import namedtuple, deque
+from array import array
+
+class _LazyModule(object):
+
+    # Stand in for a module that is imported the first time one of its
+    # attributes is used, so importing this driver has no side effects and
+    # costs nothing for code that never touches the GPS.
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+qwiic_i2c = _LazyModule('qwiic_i2c')
+pynmea2 = _LazyModule('pynmea2')
+asyncio = _LazyModule('asyncio')
+futures = _LazyModule('concurrent.futures')
+decimal = _LazyModule('decimal')
+json = _LazyModule('json')
+socket = _LazyModule('socket')
+ctypes = _LazyModule('ctypes')
+queue = _LazyModule('queue')
+
+_NAN = float('nan')
+
+# i2c_msg flag for a read, from linux/i2c.h
+_I2C_M_RD = 0x0001
+
+# time.monotonic_ns() is Python 3.7 and later.
+_monotonic_ns = getattr(time, 'monotonic_ns', lambda: int(time.monotonic() * 1000000000))
+
+# NumPy is optional and only imported when it is first needed.
+_numpy_module = None
+
+def _numpy():
+
+    global _numpy_module    # pylint: disable=global-statement
+
+    if _numpy_module is None:
+        try:
+            import numpy    # pylint: disable=import-outside-toplevel
+            _numpy_module = numpy
+        except ImportError:
+            _numpy_module = False
+
+    return _numpy_module or None
 
 #======================================================================
 # NOTE: For Raspberry Pi
@@ -168,208 +232,4727 @@ _DEFAULT_NAME = "Qwiic Titan GPS"
 # device.
 _AVAILABLE_I2C_ADDRESS = [0x10]
 
-class QwiicTitanGps(object):
+def _nmea_checksum(data):
+
+    # XOR of every byte between the '$' and the '*'
+    checksum = 0
+    for byte in data:
+        checksum ^= byte
+
+    return checksum
+
+class NmeaSentence(str):
     """
 
-    QwiicTitanGps
+    NmeaSentence
 
-        :param address: The I2C address to use for the device.
-                        If not provided, the default address is used.
-        :param i2c_driver: An existing i2c driver object. If not provided
-                        a driver object is created.
-        :return: The Qwiic Titan GPS device object.
-        :rtype: Object
+        A complete NMEA sentence as produced by NmeaFramer. It is a str, with
+        received_ns holding the time.monotonic_ns() at which the read that
+        completed it returned.
 
     """
 
-    device_name = _DEFAULT_NAME
-    available_addresses = _AVAILABLE_I2C_ADDRESS
+    received_ns = None
 
-    MAX_I2C_BUFFER = 32
-    MAX_GPS_BUFFER = 255
+class NmeaFramer(object):
+    """
 
-    _i2c = qwiic_i2c.getI2CDriver()
-    _RPiCheck = False
+    NmeaFramer
 
-    gnss_messages = {
+        Incremental splitter that turns a stream of bytes into complete NMEA
+        sentences. Bytes after the last line ending are kept until the next
+        call to feed(), so a sentence split across two reads is put back
+        together instead of being lost.
 
-        'Time'           : 0,
-        'Latitude'       : 0,
-        'Lat'            : 0,
-        'Lat_Direction'  : "",
-        'Longitude'      : 0,
-        'Long'           : 0,
-        'Long_Direction' : "",
-        'Altitude'       : 0,
-        'Altitude_Units' : "",
-        'Sat_Number'     : 0,
-        'Geo_Separation' : 0,
-        'Geo_Sep_Units'  : "",
-    }
+        :param capacity: The most bytes kept waiting for a line ending before
+                        they are thrown away as noise.
+        :return: The NmeaFramer object.
+        :rtype: Object
 
-    def __init__(self, address=None, i2c_driver=None):
+    """
 
+    def __init__(self, capacity=1024):
 
-        # As noted above, to run this device on a Raspberry Pi,
-        # clock stretching is needed.
-        #
-        # Lets check if it's enabled. This is done only once in
-        # the session
-        if not QwiicTitanGps._RPiCheck:
-            _checkForRPiI2CClockStretch()
-            QwiicTitanGps._RPiCheck = True
+        self.capacity = capacity
+        self.checksum_errors = 0
+        self.fragments_dropped = 0
+        self._buffer = bytearray()
 
-        # Did the user specify an I2C address?
+    @property
+    def pending(self):
 
-        self.address = address if address is not None else self.available_addresses[0]
+        """
 
-        # load the I2C driver if one isn't provided
+            The number of bytes held waiting for a line ending.
 
-        if i2c_driver is None:
-            self._i2c = qwiic_i2c.getI2CDriver()
-            if self._i2c is None:
-                print("Unable to load I2C driver for this platform.")
-                return
-        else:
-            self._i2c = i2c_driver
+            :return: Length of the partial sentence being held.
+            :rtype: int
 
-    # ----------------------------------
+        """
+        return len(self._buffer)
 
-    def is_connected(self):
+    def reset(self):
 
         """
 
-            Determine if a GPS device is connected to the system..
+            Throw away any partial sentence being held.
 
-            :return: True if the device is connected, otherwise False.
-            :rtype: bool
+        """
+        del self._buffer[:]
+
+    def feed(self, data, stamps=None):
 
         """
-        return qwiic_i2c.isDeviceConnected(self.address)
 
-    connected = property(is_connected)
+            Add bytes to the framer. The bytes are copied straight away, so the
+            caller may reuse its buffer once this returns.
 
-    def begin(self):
+            :param data: Bytes like object of raw NMEA data.
+            :param stamps: (end offset, time.monotonic_ns()) pairs giving when
+                        each block of data was read. Defaults to now for all
+                        of data.
+            :return: A generator of complete sentences, without the trailing
+                     line ending, whose checksum matched. Each has a
+                     received_ns attribute: when its line ending was read.
+            :rtype: Generator
 
         """
+        base = len(self._buffer)
+        self._buffer += data
 
-            Initialize the data transmission lines.
+        if stamps is None:
+            stamps = ((len(data), _monotonic_ns()),)
+        else:
+            stamps = list(stamps)
 
-            :return: Returns True on success, False on failure
-            :rtype: boolean
+        return self._frame(base, stamps)
 
-        """
-        return self.is_connected()
+    def _frame(self, base, stamps):
 
-    def get_raw_data(self):
+        buf = self._buffer
+        start = 0
+        block = 0
 
-        """
+        try:
+            while True:
+                end = buf.find(b'\n', start)
+                if end == -1:
+                    break
 
-            This function pulls GPS data from the module 255 bytes at a time.
-            :return: A string of all the GPS data.
-            :rtype: String
+                line = buf[start:end]
+                start = end + 1
 
-        """
-        raw_sentences = ""
-        buffer_tracker = self.MAX_GPS_BUFFER
-        raw_data = []
+                sentence = self._check(line)
+                if sentence is not None:
+                    # Stamp with the read that delivered the line ending.
+                    while block < len(stamps) - 1 and stamps[block][0] <= end - base:
+                        block += 1
+                    sentence.received_ns = stamps[block][1]
+                    yield sentence
+        finally:
+            del buf[:start]
 
-        while buffer_tracker != 0:
+            # Never grow without bound on a stream with no line endings.
+            if len(buf) > self.capacity:
+                del buf[:]
+                self.fragments_dropped += 1
 
-            if buffer_tracker > self.MAX_I2C_BUFFER:
-                raw_data.extend(self._i2c.readBlock(self.address, 0x00,
-                                                    self.MAX_I2C_BUFFER))
-                buffer_tracker = buffer_tracker - self.MAX_I2C_BUFFER
-                if raw_data[0] == 0x0A:
-                    break
+    def _check(self, line):
 
-            elif buffer_tracker < self.MAX_I2C_BUFFER:
-                raw_data.extend(self._i2c.readBlock(self.address, 0x00,
-                                                    buffer_tracker))
-                buffer_tracker = 0
-                if raw_data[0] == 0x0A:
-                    break
+        line = line.rstrip(b'\r')
+        if not line:
+            # Padding from an idle module.
+            return None
 
-            for raw_bytes in raw_data:
-                raw_sentences = raw_sentences + chr(raw_bytes)
+        # A truncated sentence followed by a whole one, as left by an overrun
+        # of the module's buffer: resync to the last start of sentence.
+        dollar = line.rfind(b'$')
+        if dollar > 0:
+            self.fragments_dropped += 1
+            line = line[dollar:]
+            dollar = 0
 
-        return raw_sentences
+        star = len(line) - 3
+        if dollar != 0 or star <= dollar or line[star] != 0x2A:
+            self.fragments_dropped += 1
+            return None
 
-    def prepare_data(self):
+        try:
+            expected = int(line[star + 1:], 16)
+        except ValueError:
+            self.fragments_dropped += 1
+            return None
 
-        """
+        if _nmea_checksum(line[1:star]) != expected:
+            self.checksum_errors += 1
+            return None
 
-            This function seperates raw GPS data from the module into sentences
-            of GNSS data.
-            :return: A list of all the gathered GPS data.
-            :rtype: List
+        return NmeaSentence(str(line, 'latin-1'))
+
+#----------------------------------------------------------------------
+# Fast NMEA parsing
+#
+# pynmea2 builds a full object for every sentence and raises an exception
+# for every one it can't handle. For the few sentence types the driver
+# actually uses, the fields are split once and each one is only converted
+# when it is read. The objects use the same attribute names and value
+# types as pynmea2, so either parser can feed add_to_gnss_messages().
+#----------------------------------------------------------------------
+
+_UTC = datetime.timezone.utc
+
+def _nmea_str(value):
+    return value
+
+def _nmea_float(value):
+    return float(value) if value else None
+
+def _nmea_decimal(value):
+    return decimal.Decimal(value) if value else None
+
+def _nmea_int(value):
+    return int(value) if value else None
+
+def _nmea_time(value):
+
+    # hhmmss[.ss]
+    if not value:
+        return None
+
+    fraction = value[6:]
+    return datetime.time(int(value[0:2]), int(value[2:4]), int(value[4:6]),
+                         int(float(fraction) * 1000000) if fraction else 0,
+                         _UTC)
+
+def _nmea_date(value):
+
+    # ddmmyy, with the same century rule as strptime's %y
+    if not value:
+        return None
+
+    year = int(value[4:6])
+    year += 1900 if year >= 69 else 2000
+    return datetime.date(year, int(value[2:4]), int(value[0:2]))
+
+def _nmea_degrees(value, direction):
+
+    # dddmm.mmmm to signed decimal degrees. Like pynmea2, the minutes
+    # must have a fractional part.
+    if not value or value == '0':
+        return 0.0
+
+    dot = value.find('.')
+    if dot < 3 or dot == len(value) - 1:
+        raise ValueError(value)
+    split = dot - 2
+    degrees = float(value[:split]) + float(value[split:]) / 60
+
+    if direction in ('N', 'E'):
+        return degrees
+    if direction in ('S', 'W'):
+        return -degrees
+    return 0.0
+
+class FastNmeaSentence(object):
+    """
+
+    FastNmeaSentence
+
+        Lazily converted NMEA sentence returned by parse_nmea_fast(). Fields
+        are read as attributes with the same names as pynmea2 uses.
+
+    """
+
+    __slots__ = ('talker', 'sentence_type', 'data', 'received_ns')
+
+    # attribute name -> (converter, field index, ...)
+    _fields = {}
+
+    def __init__(self, talker, sentence_type, data):
+
+        self.talker = talker
+        self.sentence_type = sentence_type
+        self.data = data
+        self.received_ns = None
+
+    def __getattr__(self, name):
+
+        try:
+            spec = self._fields[name]
+        except KeyError:
+            raise AttributeError(name)
+
+        data = self.data
+        return spec[0](*[data[index] if index < len(data) else ''
+                         for index in spec[1:]])
+
+    def __repr__(self):
+        return "<%s(%r, %r, %r)>" % (type(self).__name__, self.talker,
+                                     self.sentence_type, self.data)
+
+class _FastGGA(FastNmeaSentence):
+    __slots__ = ()
+    _fields = {
+        'timestamp'      : (_nmea_time, 0),
+        'lat'            : (_nmea_str, 1),
+        'lat_dir'        : (_nmea_str, 2),
+        'lon'            : (_nmea_str, 3),
+        'lon_dir'        : (_nmea_str, 4),
+        'gps_qual'       : (_nmea_int, 5),
+        'num_sats'       : (_nmea_str, 6),
+        'horizontal_dil' : (_nmea_str, 7),
+        'altitude'       : (_nmea_float, 8),
+        'altitude_units' : (_nmea_str, 9),
+        'geo_sep'        : (_nmea_str, 10),
+        'geo_sep_units'  : (_nmea_str, 11),
+        'age_gps_data'   : (_nmea_str, 12),
+        'ref_station_id' : (_nmea_str, 13),
+        'latitude'       : (_nmea_degrees, 1, 2),
+        'longitude'      : (_nmea_degrees, 3, 4),
+    }
+
+class _FastRMC(FastNmeaSentence):
+    __slots__ = ()
+    _fields = {
+        'timestamp'     : (_nmea_time, 0),
+        'status'        : (_nmea_str, 1),
+        'lat'           : (_nmea_str, 2),
+        'lat_dir'       : (_nmea_str, 3),
+        'lon'           : (_nmea_str, 4),
+        'lon_dir'       : (_nmea_str, 5),
+        'spd_over_grnd' : (_nmea_float, 6),
+        'true_course'   : (_nmea_float, 7),
+        'datestamp'     : (_nmea_date, 8),
+        'mag_variation' : (_nmea_str, 9),
+        'mag_var_dir'   : (_nmea_str, 10),
+        'latitude'      : (_nmea_degrees, 2, 3),
+        'longitude'     : (_nmea_degrees, 4, 5),
+    }
+
+class _FastGSA(FastNmeaSentence):
+    __slots__ = ()
+    _fields = dict([
+        ('mode', (_nmea_str, 0)),
+        ('mode_fix_type', (_nmea_str, 1)),
+        ('pdop', (_nmea_str, 14)),
+        ('hdop', (_nmea_str, 15)),
+        ('vdop', (_nmea_str, 16)),
+    ] + [('sv_id%02d' % (index + 1), (_nmea_str, index + 2)) for index in range(12)])
+
+class _FastVTG(FastNmeaSentence):
+    __slots__ = ()
+    _fields = {
+        'true_track'            : (_nmea_float, 0),
+        'true_track_sym'        : (_nmea_str, 1),
+        'mag_track'             : (_nmea_decimal, 2),
+        'mag_track_sym'         : (_nmea_str, 3),
+        'spd_over_grnd_kts'     : (_nmea_decimal, 4),
+        'spd_over_grnd_kts_sym' : (_nmea_str, 5),
+        'spd_over_grnd_kmph'    : (_nmea_float, 6),
+        'spd_over_grnd_kmph_sym': (_nmea_str, 7),
+        'faa_mode'              : (_nmea_str, 8),
+    }
+
+class _FastGSV(FastNmeaSentence):
+    __slots__ = ()
+    _fields = dict([
+        ('num_messages', (_nmea_str, 0)),
+        ('msg_num', (_nmea_str, 1)),
+        ('num_sv_in_view', (_nmea_str, 2)),
+    ] + [(name % (index + 1), (_nmea_str, 3 + index * 4 + offset))
+         for index in range(4)
+         for offset, name in enumerate(('sv_prn_num_%d', 'elevation_deg_%d',
+                                        'azimuth_%d', 'snr_%d'))])
+
+_FAST_SENTENCES = {
+    'GGA' : _FastGGA,
+    'RMC' : _FastRMC,
+    'GSA' : _FastGSA,
+    'VTG' : _FastVTG,
+    'GSV' : _FastGSV,
+}
+
+def parse_nmea_fast(sentence):
+
+    """
+
+        Parse a GGA, RMC, GSA, VTG or GSV sentence without pynmea2.
+
+        :param sentence: A complete NMEA sentence, such as one from NmeaFramer.
+        :return: The parsed sentence, or None if the sentence type isn't
+                 supported or the sentence is malformed, in which case it
+                 should be handed to pynmea2.
+        :rtype: FastNmeaSentence
+
+    """
+    sentence = sentence.strip()
+    star = len(sentence) - 3
+    if star < 6 or sentence[0] != '$' or sentence[star] != '*':
+        return None
+
+    sentence_class = _FAST_SENTENCES.get(sentence[3:6])
+    if sentence_class is None:
+        return None
+
+    body = sentence[1:star]
+    try:
+        if _nmea_checksum(body.encode('latin-1')) != int(sentence[star + 1:], 16):
+            return None
+    except (ValueError, UnicodeEncodeError):
+        return None
+
+    fields = body.split(',')
+    return sentence_class(fields[0][0:2], fields[0][2:5], fields[1:])
+
+#----------------------------------------------------------------------
+# Sentence handlers
+#
+# Each handler takes a parsed sentence (pynmea2 or FastNmeaSentence) and the
+# current gnss_messages, and returns the keys that sentence updates. The
+# keys are only merged once the whole sentence has been read, so a sentence
+# with a missing or bad field changes nothing.
+#----------------------------------------------------------------------
+
+def _position_fields(sentence):
+
+    return {
+        'Time'           : sentence.timestamp,
+        'Latitude'       : sentence.latitude,
+        'Lat'            : sentence.lat,
+        'Lat_Direction'  : sentence.lat_dir,
+        'Longitude'      : sentence.longitude,
+        'Long'           : sentence.lon,
+        'Long_Direction' : sentence.lon_dir,
+    }
+
+def _gga_fields(sentence, messages):
+
+    fields = _position_fields(sentence)
+    fields.update({
+        'Altitude'       : sentence.altitude,
+        'Altitude_Units' : sentence.altitude_units,
+        'Sat_Number'     : sentence.num_sats,
+        'Geo_Separation' : sentence.geo_sep,
+        'Geo_Sep_Units'  : sentence.geo_sep_units,
+        'Fix_Quality'    : sentence.gps_qual,
+        'HDOP'           : sentence.horizontal_dil,
+    })
+    return fields
+
+def _gll_fields(sentence, messages):
+
+    return _position_fields(sentence)
+
+def _rmc_fields(sentence, messages):
+
+    # A void ('V') RMC still carries the time and date, but not a position.
+    fields = _position_fields(sentence) if sentence.status == 'A' else {
+        'Time' : sentence.timestamp
+    }
+    fields.update({
+        'Date'           : sentence.datestamp,
+        'Speed_Knots'    : sentence.spd_over_grnd,
+        'Course'         : sentence.true_course,
+    })
+    return fields
+
+def _vtg_fields(sentence, messages):
+
+    # pynmea2 gives knots as a Decimal here, but as a float in RMC.
+    knots = sentence.spd_over_grnd_kts
+    return {
+        'Speed_Knots'    : float(knots) if knots is not None else None,
+        'Speed_Kmph'     : sentence.spd_over_grnd_kmph,
+        'Course'         : sentence.true_track,
+    }
+
+def _gsa_fields(sentence, messages):
+
+    return {
+        'Fix_Type'       : sentence.mode_fix_type,
+        'PDOP'           : sentence.pdop,
+        'HDOP'           : sentence.hdop,
+        'VDOP'           : sentence.vdop,
+    }
+
+_SENTENCE_HANDLERS = {
+    'GGA' : _gga_fields,
+    'GLL' : _gll_fields,
+    'RMC' : _rmc_fields,
+    'VTG' : _vtg_fields,
+    'GSA' : _gsa_fields,
+}
+
+def _fix_datetime(fields, messages):
+
+    # Full UTC datetime: the date from the latest RMC and the time from this
+    # sentence. If the time has gone back by more than half a day without a
+    # new date, UTC midnight has passed.
+    value = fields['Time']
+    date = fields.get('Date') or messages['Date']
+    if not value or not date:
+        return None
+
+    if 'Date' not in fields and messages['Time'] and \
+       _seconds_of_day(value) < _seconds_of_day(messages['Time']) - 43200:
+        date += datetime.timedelta(days=1)
+        fields['Date'] = date
+
+    return datetime.datetime.combine(date, value)
+
+def _sentence_fields(sentence, messages, received_ns=None):
+
+    # The keys a parsed sentence updates, or None if it updates nothing.
+    handler = _SENTENCE_HANDLERS.get(getattr(sentence, 'sentence_type', None))
+    if handler is None:
+        return None
+
+    try:
+        fields = handler(sentence, messages)
+        if 'Time' in fields:
+            fields['Datetime'] = _fix_datetime(fields, messages)
+            fields['Received_NS'] = received_ns
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+    return fields
+
+#----------------------------------------------------------------------
+# Satellite tables
+#----------------------------------------------------------------------
+
+class SatelliteGroup(namedtuple('SatelliteGroup', ['prn', 'elevation', 'azimuth',
+                                                   'snr', 'in_view', 'mean_snr',
+                                                   'received_ns'])):
+    """
+
+    SatelliteGroup
+
+        The satellites one constellation reported in its last complete GSV
+        group. prn, elevation, azimuth and snr are parallel array.array
+        columns, with -1 where the module left a value out (snr is -1 for
+        satellites in view but not tracked). mean_snr is the mean over the
+        tracked satellites, or None if there are none, and received_ns the
+        time.monotonic_ns() at which the last part was read.
+
+    """
+
+    __slots__ = ()
+
+def _gsv_int(value):
+    return int(value) if value else -1
+
+class _GsvAssembly(object):
+
+    # Columns for one talker, filled in place as the parts of a group
+    # arrive and only copied out when the group is complete.
+    __slots__ = ('prn', 'elevation', 'azimuth', 'snr', 'count', 'next_part')
+
+    def __init__(self, capacity):
+
+        self.prn = array('h', bytes(2 * capacity))
+        self.elevation = array('h', bytes(2 * capacity))
+        self.azimuth = array('h', bytes(2 * capacity))
+        self.snr = array('h', bytes(2 * capacity))
+        self.count = 0
+        self.next_part = None
+
+class SatelliteTable(object):
+    """
+
+    SatelliteTable
+
+        Assembles multi-part GSV groups into a satellite table per
+        constellation, keyed by talker ID ('GP' GPS, 'GL' GLONASS, 'GA'
+        Galileo, 'BD' or 'GB' BeiDou). Parts are written into preallocated
+        columns as they arrive, across polls, and a group is published in
+        the snapshot only once its last part arrives. A group with a missing
+        or out of order part is dropped.
+
+        :param capacity: The most satellites kept per constellation.
+        :return: The SatelliteTable object.
+        :rtype: Object
+
+    """
+
+    def __init__(self, capacity=64):
+
+        self.capacity = capacity
+        self._assemblies = {}
+        self._snapshot = MappingProxyType({})
+        self.groups_completed = 0
+        self.groups_dropped = 0
+
+    @property
+    def snapshot(self):
 
         """
-        sentences = self.get_raw_data()
-        clean_gnss_list = []
-        complete_sentence_list = []
-        gnss_list = sentences.split('\n')
 
-        for sentence in gnss_list:
-            if sentence is not '':
-                clean_gnss_list.append(sentence)
+            The latest complete group of each constellation. The mapping
+            and its groups are never changed once published.
 
-        for index,sentence in enumerate(clean_gnss_list):
-            if not sentence.startswith('$') and index is not 0:
-                joined = clean_gnss_list[index - 1] + sentence
-                complete_sentence_list.append(joined)
-            else:
-                complete_sentence_list.append(sentence)
+            :return: Talker ID to SatelliteGroup.
+            :rtype: Mapping
 
-        return complete_sentence_list
+        """
+        return self._snapshot
 
-    def get_nmea_data(self):
+    def update(self, sentence, received_ns=None):
 
         """
 
-            This function takes a list of GNSS sentences and uses the pynmea2
-            parser to parse the data.
-            :return: Returns True on success and False otherwise
-            :rtype: Boolean
+            Add one GSV part to the table.
+
+            :param sentence: A parsed GSV sentence, from pynmea2 or
+                        parse_nmea_fast().
+            :param received_ns: The time.monotonic_ns() at which the sentence
+                        was read.
+            :return: True if the part completed a group, and so changed the
+                     snapshot.
+            :rtype: bool
 
         """
-        gps_data = self.prepare_data()
-        msg = ""
-        for sentence in gps_data:
-            try:
-                msg = pynmea2.parse(sentence)
-                self.add_to_gnss_messages(msg)
-            except pynmea2.nmea.ParseError:
-                pass
+        talker = sentence.talker
+        assembly = self._assemblies.get(talker)
+        if assembly is None:
+            assembly = self._assemblies[talker] = _GsvAssembly(self.capacity)
+
+        # Both pynmea2 and FastNmeaSentence keep the raw fields in data,
+        # which is much cheaper to read than the sixteen attributes.
+        data = sentence.data
+        try:
+            parts = int(data[0])
+            part = int(data[1])
+        except (IndexError, TypeError, ValueError):
+            assembly.next_part = None
+            return False
+
+        if part == 1:
+            if assembly.next_part is not None:
+                self.groups_dropped += 1
+            assembly.count = 0
+        elif part != assembly.next_part:
+            # A part went missing, so wait for the start of the next group.
+            if assembly.next_part is not None:
+                self.groups_dropped += 1
+            assembly.next_part = None
+            return False
+
+        count = assembly.count
+        try:
+            for index in range(3, min(len(data), 19) - 3, 4):
+                if not data[index] or count >= self.capacity:
+                    continue
+                assembly.prn[count] = int(data[index])
+                assembly.elevation[count] = _gsv_int(data[index + 1])
+                assembly.azimuth[count] = _gsv_int(data[index + 2])
+                assembly.snr[count] = _gsv_int(data[index + 3])
+                count += 1
+        except (OverflowError, ValueError):
+            self.groups_dropped += 1
+            assembly.next_part = None
+            return False
+        assembly.count = count
 
+        if part < parts:
+            assembly.next_part = part + 1
+            return False
+
+        assembly.next_part = None
+        self._publish(talker, assembly, _gsv_int(data[2]) if len(data) > 2 else -1,
+                      received_ns)
         return True
 
-    def add_to_gnss_messages(self, sentence):
+    def _publish(self, talker, assembly, in_view, received_ns):
+
+        count = assembly.count
+        snr = assembly.snr[:count]
+        tracked = [value for value in snr if value >= 0]
+
+        group = SatelliteGroup(assembly.prn[:count], assembly.elevation[:count],
+                               assembly.azimuth[:count], snr,
+                               in_view if in_view >= 0 else count,
+                               sum(tracked) / len(tracked) if tracked else None,
+                               received_ns)
+
+        # A new mapping, so anyone holding the old snapshot keeps a
+        # consistent view.
+        snapshot = dict(self._snapshot)
+        snapshot[talker] = group
+        self._snapshot = MappingProxyType(snapshot)
+        self.groups_completed += 1
+
+#----------------------------------------------------------------------
+# Fix records
+#----------------------------------------------------------------------
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+class Fix(namedtuple('Fix', ['time', 'date', 'latitude', 'longitude',
+                             'altitude', 'sat_number', 'fix_quality', 'hdop',
+                             'speed_knots', 'course', 'datetime',
+                             'received_ns'])):
+    """
+
+    Fix
+
+        Immutable, compact record of one position fix. Numeric fields are
+        converted from the strings pynmea2 leaves them as, and are None when
+        the module didn't report them. datetime is the full UTC time of the
+        fix and received_ns the time.monotonic_ns() at which it was read.
+
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_messages(cls, messages):
 
         """
 
-            This function takes parsed GNSS data and assigns them to the
-            respective dictionary key.
-            :return: Returns True
-            :rtype: Boolean
+            Build a Fix from a gnss_messages style mapping.
+
+            :param messages: The mapping to read.
+            :return: The new fix.
+            :rtype: Fix
 
         """
-        try:
-            self.gnss_messages['Time'] = sentence.timestamp
-            self.gnss_messages['Lat_Direction'] = sentence.lat_dir
-            self.gnss_messages['Long_Direction'] = sentence.lon_dir
-            self.gnss_messages['Latitude'] = sentence.latitude
-            self.gnss_messages['Lat'] = sentence.lat
-            self.gnss_messages['Longitude'] = sentence.longitude
-            self.gnss_messages['Long'] = sentence.lon
-            self.gnss_messages['Altitude'] = sentence.altitude
-            self.gnss_messages['Altitude_Units'] = sentence.altitude_units
-            self.gnss_messages['Sat_Number'] = sentence.num_sats
-            self.gnss_messages['Geo_Separation'] = sentence.geo_sep
-            self.gnss_messages['Geo_Sep_Units'] = sentence.geo_sep_units
-        except KeyError:
-            pass
-        except AttributeError:
-            pass
+        return cls(messages['Time'] or None,
+                   messages['Date'],
+                   _to_float(messages['Latitude']),
+                   _to_float(messages['Longitude']),
+                   _to_float(messages['Altitude']),
+                   _to_int(messages['Sat_Number']),
+                   _to_int(messages['Fix_Quality']),
+                   _to_float(messages['HDOP']),
+                   _to_float(messages['Speed_Knots']),
+                   _to_float(messages['Course']),
+                   messages.get('Datetime'),
+                   messages.get('Received_NS'))
 
-        return True
+class FixHistory(object):
+    """
+
+    FixHistory
+
+        Fixed capacity ring of recent fixes, stored as typed array columns
+        rather than objects. Once full, each append overwrites the oldest
+        fix. An hour of 10 Hz fixes at the default capacity takes about
+        1 MB.
+
+        :param capacity: The number of fixes kept.
+        :return: The FixHistory object.
+        :rtype: Object
+
+    """
+
+    # column name -> array typecode
+    COLUMNS = (('t', 'd'), ('latitude', 'd'), ('longitude', 'd'),
+               ('altitude', 'f'), ('sat_number', 'B'))
+
+    def __init__(self, capacity=36000):
+
+        self.capacity = capacity
+        self._columns = dict((name, array(code, bytes(array(code).itemsize * capacity)))
+                             for name, code in self.COLUMNS)
+        self._next = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, fix, t=None):
+
+        """
+
+            Add a fix to the history. Without t, fixes that have no
+            datetime are skipped, so the times are GPS time like those of
+            a FixLogWriter, and never step back with the host clock.
+
+            :param fix: The Fix to add.
+            :param t: The time of the fix in POSIX seconds. Times must not go
+                      backwards. Defaults to the fix's datetime.
+            :return: True if the fix was added.
+            :rtype: bool
+
+        """
+        if t is None:
+            if fix.datetime is None:
+                return False
+            t = _utc_timestamp(fix.datetime)
+
+        index = self._next
+        columns = self._columns
+
+        columns['t'][index] = t
+        columns['latitude'][index] = fix.latitude if fix.latitude is not None else _NAN
+        columns['longitude'][index] = fix.longitude if fix.longitude is not None else _NAN
+        columns['altitude'][index] = fix.altitude if fix.altitude is not None else _NAN
+        columns['sat_number'][index] = min(fix.sat_number or 0, 255)
+
+        self._next = (index + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+        return True
+
+    def _start(self):
+
+        # Physical index of the oldest fix.
+        return (self._next - self._count) % self.capacity
+
+    def _bisect(self, t):
+
+        # First logical index whose time is >= t.
+        times = self._columns['t']
+        start = self._start()
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if times[(start + middle) % self.capacity] < t:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def columns(self, t_start=None, t_end=None):
+
+        """
+
+            Return the fixes with t_start <= t < t_end, oldest first, one
+            sequence per column. When NumPy is installed these are NumPy
+            arrays, otherwise they are array.array objects.
+
+            :param t_start: Start of the window, or None for the oldest fix.
+            :param t_end: End of the window, or None for the newest fix.
+            :return: Column name to values.
+            :rtype: dict
+
+        """
+        first = 0 if t_start is None else self._bisect(t_start)
+        last = self._count if t_end is None else self._bisect(t_end)
+
+        # Logical to physical indexes; last may run past the end of the ring.
+        start = self._start()
+        first, last = start + first, start + max(last, first)
+        if first >= self.capacity:
+            first -= self.capacity
+            last -= self.capacity
+
+        numpy = _numpy()
+        result = {}
+        for name, column in self._columns.items():
+            if numpy is not None:
+                values = numpy.frombuffer(column, dtype=column.typecode)
+                values = numpy.take(values, numpy.arange(first, last), mode='wrap')
+            elif last <= self.capacity:
+                values = column[first:last]
+            else:
+                values = column[first:] + column[:last - self.capacity]
+            result[name] = values
+
+        return result
+
+class ClockOffset(object):
+    """
+
+    ClockOffset
+
+        Running estimate of how the host's monotonic clock lines up with GPS
+        time, from the receive stamp and UTC time of each fix. The smallest
+        offset over the last window seconds is the best case, a fix read
+        with no delay; how far each fix sits above it is that fix's
+        transport latency. The window lets the estimate follow the drift
+        between the host and GPS clocks: at 50 ppm, a 60 second window is
+        at most 3 ms behind.
+
+        :param gain: Weight of each new fix in the running mean and jitter.
+        :param window: Seconds of fixes the minimum is taken over.
+        :return: The ClockOffset object.
+        :rtype: Object
+
+    """
+
+    def __init__(self, gain=0.1, window=60.0):
+
+        self.gain = gain
+        self.window = window
+        self.samples = 0
+        self.offset = None          # mean receive minus GPS time, seconds
+        self.jitter = 0.0           # mean absolute deviation, seconds
+        self.min_offset = None
+        self.latency = None         # latest fix's delay over the best case
+
+        # (receive time, offset) with increasing offsets: the first is the
+        # minimum over the window.
+        self._minima = deque()
+
+    def update(self, received_ns, gps_datetime):
+
+        """
+
+            Add one fix.
+
+            :param received_ns: time.monotonic_ns() when the fix was read.
+            :param gps_datetime: The fix's UTC datetime.
+
+        """
+        received = received_ns / 1e9
+        offset = received - _utc_timestamp(gps_datetime)
+
+        if self.offset is None:
+            self.offset = offset
+        else:
+            deviation = offset - self.offset
+            self.offset += self.gain * deviation
+            self.jitter += self.gain * (abs(deviation) - self.jitter)
+
+        minima = self._minima
+        while minima and minima[-1][1] >= offset:
+            minima.pop()
+        minima.append((received, offset))
+        while minima[0][0] < received - self.window:
+            minima.popleft()
+        self.min_offset = minima[0][1]
+
+        self.latency = offset - self.min_offset
+        self.samples += 1
+
+    def to_utc(self, monotonic_ns):
+
+        """
+
+            Convert a host monotonic stamp, such as an IMU sample's, to UTC.
+
+            :param monotonic_ns: The time.monotonic_ns() stamp.
+            :return: The estimated UTC datetime, or None before the first fix.
+            :rtype: datetime.datetime
+
+        """
+        if self.min_offset is None:
+            return None
+
+        return datetime.datetime.fromtimestamp(monotonic_ns / 1e9 - self.min_offset, _UTC)
+
+def _utc_timestamp(value):
+
+    # POSIX seconds for a datetime, treating naive values as UTC.
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=_UTC)
+    return value.timestamp()
+
+#----------------------------------------------------------------------
+# Fix filtering
+#----------------------------------------------------------------------
+
+_EARTH_RADIUS = 6371000.0
+_POSITION_KEYS = ('Latitude', 'Lat', 'Lat_Direction', 'Longitude', 'Long',
+                  'Long_Direction')
+
+def _seconds_of_day(value):
+
+    return value.hour * 3600 + value.minute * 60 + value.second + value.microsecond / 1e6
+
+class FixFilter(object):
+    """
+
+    FixFilter
+
+        Incremental quality gate and smoother for a stream of fixes. Each
+        fix is checked against the gates and against the last accepted fix,
+        in constant time and memory. Accepted fixes can also be smoothed
+        with an alpha-beta filter.
+
+        :param min_quality: The lowest GGA fix quality accepted (1 is a GPS
+                        fix, 0 is no fix).
+        :param min_sats: The fewest satellites accepted.
+        :param max_hdop: The highest HDOP accepted, or None for no limit.
+        :param max_speed: The highest speed, in m/s, implied by the jump from
+                        the last accepted fix, or None for no limit.
+        :param alpha: Position gain of the smoother, 1 turns smoothing off.
+        :param beta: Velocity gain of the smoother.
+        :return: The FixFilter object.
+        :rtype: Object
+
+    """
+
+    def __init__(self, min_quality=1, min_sats=4, max_hdop=None, max_speed=None,
+                 alpha=1.0, beta=0.0):
+
+        self.min_quality = min_quality
+        self.min_sats = min_sats
+        self.max_hdop = max_hdop
+        self.max_speed = max_speed
+        self.alpha = alpha
+        self.beta = beta
+        self.reset()
+
+    def reset(self):
+
+        """
+
+            Forget the last fix and zero the counters.
+
+        """
+        self.accepted = 0
+        self.rejected = dict.fromkeys(('quality', 'sats', 'hdop', 'speed', 'position'), 0)
+        self._last = None       # (seconds of day, latitude, longitude)
+        self._velocity = (0.0, 0.0)
+
+    def _reject(self, reason):
+
+        self.rejected[reason] += 1
+        return None
+
+    def update(self, fix):
+
+        """
+
+            Check a fix, and smooth it if it passes.
+
+            :param fix: The Fix to check.
+            :return: The fix, with a smoothed position if smoothing is on, or
+                     None if it was rejected.
+            :rtype: Fix
+
+        """
+        if fix.fix_quality is None or fix.fix_quality < self.min_quality:
+            return self._reject('quality')
+        if (fix.sat_number or 0) < self.min_sats:
+            return self._reject('sats')
+        if self.max_hdop is not None and (fix.hdop is None or fix.hdop > self.max_hdop):
+            return self._reject('hdop')
+        if fix.latitude is None or fix.longitude is None or fix.time is None:
+            return self._reject('position')
+
+        now = _seconds_of_day(fix.time)
+        latitude, longitude = fix.latitude, fix.longitude
+
+        if self._last is not None:
+            then, last_lat, last_lon = self._last
+            dt = now - then
+            if dt < -43200:
+                dt += 86400     # UTC midnight
+
+            if dt > 0:
+                if self.max_speed is not None:
+                    dy = math.radians(latitude - last_lat) * _EARTH_RADIUS
+                    dx = math.radians(longitude - last_lon) * _EARTH_RADIUS * \
+                        math.cos(math.radians(latitude))
+                    if math.hypot(dx, dy) / dt > self.max_speed:
+                        return self._reject('speed')
+
+                if self.alpha < 1.0:
+                    # alpha-beta: predict from the last estimate, then correct.
+                    v_lat, v_lon = self._velocity
+                    predicted_lat = last_lat + v_lat * dt
+                    predicted_lon = last_lon + v_lon * dt
+                    r_lat = latitude - predicted_lat
+                    r_lon = longitude - predicted_lon
+                    latitude = predicted_lat + self.alpha * r_lat
+                    longitude = predicted_lon + self.alpha * r_lon
+                    self._velocity = (v_lat + self.beta * r_lat / dt,
+                                      v_lon + self.beta * r_lon / dt)
+
+        self._last = (now, latitude, longitude)
+        self.accepted += 1
+
+        if latitude != fix.latitude or longitude != fix.longitude:
+            fix = fix._replace(latitude=latitude, longitude=longitude)
+
+        return fix
+
+#----------------------------------------------------------------------
+# Streaming pipeline
+#
+# Generator stages that can be chained from any byte source:
+#
+#   fixes = messages_to_fixes(
+#               parse_messages(
+#                   frame_sentences(iter_stream(serial_port)),
+#                   types=('GGA', 'RMC')))
+#
+# Nothing is gathered into lists between stages, and sentence types that
+# aren't wanted are dropped before they cost a parse.
+#----------------------------------------------------------------------
+
+def iter_stream(stream, size=1024):
+
+    """
+
+        Read chunks from a file, serial port or socket until it returns no
+        data.
+
+        :param stream: Any object with read(size) or recv(size).
+        :param size: The most bytes per read.
+        :return: A generator of byte strings.
+        :rtype: Generator
+
+    """
+    read = getattr(stream, 'read', None) or stream.recv
+    while True:
+        chunk = read(size)
+        if not chunk:
+            return
+        yield chunk
+
+def frame_sentences(chunks, framer=None):
+
+    """
+
+        Turn chunks of bytes into complete, checksum validated sentences.
+
+        :param chunks: Iterable of bytes like objects.
+        :param framer: The NmeaFramer to use, so partial sentences can be
+                    carried between calls. A new one is made if not given.
+        :return: A generator of sentences, without line endings.
+        :rtype: Generator
+
+    """
+    framer = framer if framer is not None else NmeaFramer()
+    for chunk in chunks:
+        for sentence in framer.feed(chunk):
+            yield sentence
+
+def parse_nmea(sentence, fast=True):
+
+    """
+
+        Parse one sentence, using parse_nmea_fast() where it can and pynmea2
+        for everything else.
+
+        :param sentence: A complete NMEA sentence.
+        :param fast: If False, always use pynmea2.
+        :return: The parsed sentence, or None if it couldn't be parsed.
+        :rtype: Object
+
+    """
+    msg = parse_nmea_fast(sentence) if fast else None
+    if msg is None:
+        try:
+            msg = pynmea2.parse(sentence)
+        except pynmea2.nmea.ParseError:
+            return None
+
+    return msg
+
+def parse_messages(sentences, types=None, fast=True):
+
+    """
+
+        Parse sentences, skipping those that fail to parse.
+
+        :param sentences: Iterable of complete NMEA sentences.
+        :param types: Sentence types to keep, such as ('GGA', 'RMC'). Other
+                    types are dropped before they are parsed. None keeps all.
+        :param fast: If False, always use pynmea2.
+        :return: A generator of parsed sentences. Each has the received_ns
+                 of the sentence it came from.
+        :rtype: Generator
+
+    """
+    types = frozenset(types) if types is not None else None
+    for sentence in sentences:
+        if types is not None and sentence[3:6] not in types:
+            continue
+
+        msg = parse_nmea(sentence, fast)
+        if msg is not None:
+            msg.received_ns = getattr(sentence, 'received_ns', None)
+            yield msg
+
+def messages_to_fixes(messages, emit_on=('GGA',), state=None):
+
+    """
+
+        Merge parsed sentences the same way QwiicTitanGps does, and produce a
+        Fix each time a sentence of an emit_on type is merged.
+
+        :param messages: Iterable of parsed sentences.
+        :param emit_on: Sentence types that complete a fix.
+        :param state: A gnss_messages style dict to merge into. Defaults to a
+                    fresh copy of QwiicTitanGps.gnss_messages.
+        :return: A generator of Fix records.
+        :rtype: Generator
+
+    """
+    state = state if state is not None else dict(QwiicTitanGps.gnss_messages)
+    for msg in messages:
+        sentence_type = getattr(msg, 'sentence_type', None)
+        fields = _sentence_fields(msg, state, getattr(msg, 'received_ns', None))
+        if fields is None:
+            continue
+
+        state.update(fields)
+
+        if sentence_type in emit_on:
+            yield Fix.from_messages(state)
+
+#----------------------------------------------------------------------
+# Device probing
+#----------------------------------------------------------------------
+
+# (id(driver), address) -> (driver, connected, latency, probed at)
+_probe_cache = {}
+_probe_lock = threading.Lock()
+
+def probe_device(driver, address, ttl=5.0):
+
+    """
+
+        Check whether a device answers at an address, through the given
+        driver. Answers are cached for ttl seconds, so repeated checks during
+        start up don't each cost a bus transaction.
+
+        :param driver: The I2C driver for the bus.
+        :param address: The I2C address.
+        :param ttl: Seconds a cached answer stays valid. 0 always probes.
+        :return: Whether the device answered, and how many seconds the probe
+                 took (that of the original probe if the answer was cached).
+        :rtype: tuple
+
+    """
+    if driver is None:
+        return False, 0.0
+
+    key = (id(driver), address)
+    now = time.monotonic()
+
+    with _probe_lock:
+        entry = _probe_cache.get(key)
+    if entry is not None and entry[0] is driver and now - entry[3] < ttl:
+        return entry[1], entry[2]
+
+    started = time.monotonic()
+    try:
+        connected = bool(driver.isDeviceConnected(address))
+    except (IOError, OSError):
+        connected = False
+    finished = time.monotonic()
+
+    with _probe_lock:
+        _probe_cache[key] = (driver, connected, finished - started, finished)
+
+    return connected, finished - started
+
+def scan_devices(drivers, addresses=None, ttl=5.0):
+
+    """
+
+        Probe a set of addresses on several buses at once. Each bus is
+        scanned on its own thread, so buses are probed in parallel.
+
+        :param drivers: The I2C drivers, one per bus.
+        :param addresses: The addresses to probe. Defaults to this device's
+                    available_addresses.
+        :param ttl: Seconds a cached answer stays valid.
+        :return: One dict per driver, in order, mapping each address to a
+                 (connected, latency) tuple.
+        :rtype: list
+
+    """
+    addresses = list(addresses) if addresses is not None else _AVAILABLE_I2C_ADDRESS
+    results = [{} for _ in drivers]
+
+    def scan(index, driver):
+        for address in addresses:
+            results[index][address] = probe_device(driver, address, ttl)
+
+    threads = [threading.Thread(target=scan, args=(index, driver))
+               for index, driver in enumerate(drivers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results
+
+#----------------------------------------------------------------------
+# PMTK commands
+#----------------------------------------------------------------------
+
+# PMTK001 acknowledgement flags
+PMTK_ACK_INVALID = 0
+PMTK_ACK_UNSUPPORTED = 1
+PMTK_ACK_FAILED = 2
+PMTK_ACK_SUCCESS = 3
+
+# Order of the sentence rates in a PMTK314 (set NMEA output) command.
+_PMTK314_SENTENCES = ('gll', 'rmc', 'vtg', 'gga', 'gsa', 'gsv')
+_PMTK314_FIELDS = 19
+
+# Command sets for common setups, for use with apply_pmtk_preset().
+PMTK_PRESETS = {
+    # Only what's needed for a position fix, ten times a second.
+    'gga_rmc_10hz' : [('314', (0, 1, 0, 1, 0, 0) + (0,) * 13), ('220', (100,))],
+    # Position, speed and DOP at 5 Hz, satellites in view once a second.
+    'nav_5hz'      : [('314', (0, 1, 1, 1, 1, 5) + (0,) * 13), ('220', (200,))],
+    # The module's power on default: everything once a second.
+    'default_1hz'  : [('314', (-1,)), ('220', (1000,))],
+}
+
+def pmtk_sentence(command, args=()):
+
+    """
+
+        Frame a PMTK command as a complete NMEA sentence.
+
+        :param command: The command number, such as 220 or '220'.
+        :param args: The command's fields.
+        :return: The sentence, including checksum and line ending.
+        :rtype: bytes
+
+    """
+    body = ','.join(['PMTK%03d' % int(command)] + [str(arg) for arg in args])
+    body = body.encode('ascii')
+    return b'$' + body + b'*' + ('%02X' % _nmea_checksum(body)).encode('ascii') + b'\r\n'
+
+#----------------------------------------------------------------------
+# I2C transports
+#
+# QwiicTitanGps only needs three methods from its driver, so any object
+# providing them can be passed as i2c_driver and stand in for the bus:
+#
+#   readBlock(address, commandCode, nBytes)  read nBytes from the device
+#                                            and return them as a list of
+#                                            ints; raise OSError on a bus
+#                                            error
+#   writeBlock(address, commandCode, value)  write commandCode followed by
+#                                            the list of ints in value
+#   isDeviceConnected(devAddress)            True if a device answers at
+#                                            devAddress
+#
+# A driver may also have an smbus2 SMBus as i2cbus, for I2C_RDWR reads.
+# The classes below record a real bus to a file and play it back without
+# hardware, for tests and benchmarks.
+#
+# Capture file: the magic below, then one record per transaction: a
+# little endian double (seconds since recording started), a kind byte and
+# a length byte, followed by that many data bytes.
+#----------------------------------------------------------------------
+
+_CAPTURE_MAGIC = b'QTGPS-I2C1\n'
+_CAPTURE_RECORD = struct.Struct('<dBB')
+
+_CAPTURE_READ = 0
+_CAPTURE_WRITE = 1
+_CAPTURE_ERROR = 2
+
+class I2CRecorder(object):
+    """
+
+    I2CRecorder
+
+        Wraps a driver and records every block it reads and writes, and
+        every bus error, to a capture file for ReplayI2CDriver.
+
+        :param driver: The driver to record, such as qwiic_i2c.getI2CDriver().
+        :param path: The capture file to write.
+        :return: The I2CRecorder object.
+        :rtype: Object
+
+    """
+
+    def __init__(self, driver, path):
+
+        self.driver = driver
+        self._file = open(path, 'wb')
+        self._file.write(_CAPTURE_MAGIC)
+        self._start = time.monotonic()
+
+    def _record(self, kind, data):
+
+        self._file.write(_CAPTURE_RECORD.pack(time.monotonic() - self._start,
+                                              kind, len(data)))
+        self._file.write(bytes(data))
+
+    def readBlock(self, address, commandCode, nBytes):
+
+        try:
+            block = self.driver.readBlock(address, commandCode, nBytes)
+        except (IOError, OSError):
+            self._record(_CAPTURE_ERROR, b'')
+            raise
+
+        self._record(_CAPTURE_READ, block)
+        return block
+
+    def writeBlock(self, address, commandCode, value):
+
+        self._record(_CAPTURE_WRITE, [commandCode] + list(value))
+        return self.driver.writeBlock(address, commandCode, value)
+
+    def isDeviceConnected(self, devAddress):
+        return self.driver.isDeviceConnected(devAddress)
+
+    def close(self):
+
+        """
+
+            Flush and close the capture file.
+
+        """
+        self._file.close()
+
+class ReplayI2CDriver(object):
+    """
+
+    ReplayI2CDriver
+
+        Plays back a capture file, or raw NMEA text, as if it were the
+        module. The recorded bytes are served in order whatever block size
+        is asked for, with 0x0A padding once they run out, just as the
+        XA1110 pads when it has nothing to send.
+
+        :param data: The capture file contents, or raw NMEA bytes.
+        :param realtime: If True, recorded bytes only become readable once
+                        as much time has passed as when they were recorded.
+                        Otherwise they are served as fast as they are read.
+        :param error_rate: The chance of each read raising OSError.
+        :param padding_rate: The chance of each read returning a block of
+                        padding even though data is waiting.
+        :param loop: If True, start over at the end of the data.
+        :param seed: Seed for the error and padding choices.
+        :return: The ReplayI2CDriver object.
+        :rtype: Object
+
+    """
+
+    def __init__(self, data, realtime=False, error_rate=0.0, padding_rate=0.0,
+                 loop=False, seed=None):
+
+        self._data, self._times, self._errors = self._parse(bytes(data))
+        self.realtime = realtime
+        self.error_rate = error_rate
+        self.padding_rate = padding_rate
+        self.loop = loop
+        self._random = random.Random(seed)
+        self._position = 0
+        self._start = None
+        self._recorded_errors = 0
+        self.reads = 0
+        self.writes = []
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+
+        """
+
+            Load a capture file, or a raw NMEA log.
+
+            :param path: The file to load.
+            :return: The ReplayI2CDriver object.
+            :rtype: ReplayI2CDriver
+
+        """
+        with open(path, 'rb') as fCapture:
+            return cls(fCapture.read(), **kwargs)
+
+    @staticmethod
+    def _parse(data):
+
+        # Returns the data bytes, the recorded time of each data byte and the
+        # recorded times of bus errors.
+        if not data.startswith(_CAPTURE_MAGIC):
+            return bytearray(data), None, []
+
+        stream = bytearray()
+        times = array('d')
+        errors = []
+        offset = len(_CAPTURE_MAGIC)
+
+        while offset + _CAPTURE_RECORD.size <= len(data):
+            stamp, kind, length = _CAPTURE_RECORD.unpack_from(data, offset)
+            offset += _CAPTURE_RECORD.size
+            block = data[offset:offset + length]
+            offset += length
+
+            if kind == _CAPTURE_ERROR:
+                errors.append(stamp)
+            elif kind == _CAPTURE_READ:
+                # Padding is put back on replay, it isn't data. Keep one
+                # newline to end the sentence it followed, even when that
+                # newline was the first byte of an all padding block.
+                if block.endswith(b'\n'):
+                    block = block.rstrip(b'\n')
+                    if block or (stream and not stream.endswith(b'\n')):
+                        block += b'\n'
+                stream += block
+                times.extend([stamp] * len(block))
+
+        return stream, times, errors
+
+    def _available(self):
+
+        # How far into the data a read may go at this moment.
+        if not self.realtime or self._times is None:
+            return len(self._data)
+
+        if self._start is None:
+            self._start = time.monotonic()
+
+        elapsed = time.monotonic() - self._start
+        return bisect.bisect_right(self._times, elapsed)
+
+    def readBlock(self, address, commandCode, nBytes):
+
+        self.reads += 1
+
+        if self.realtime and self._recorded_errors < len(self._errors) and \
+           self._start is not None and \
+           self._errors[self._recorded_errors] <= time.monotonic() - self._start:
+            self._recorded_errors += 1
+            raise OSError(121, "Remote I/O error (replayed)")
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            raise OSError(121, "Remote I/O error (injected)")
+
+        if self.loop and self._position >= len(self._data):
+            self._position = 0
+            self._start = None
+
+        end = min(self._position + nBytes, self._available())
+        if self.padding_rate and self._random.random() < self.padding_rate:
+            end = self._position
+
+        block = list(self._data[self._position:end])
+        self._position = max(end, self._position)
+
+        return block + [0x0A] * (nBytes - len(block))
+
+    def writeBlock(self, address, commandCode, value):
+        self.writes.append(bytes([commandCode] + list(value)))
+
+    def isDeviceConnected(self, devAddress):
+        return True
+
+    @property
+    def finished(self):
+
+        """
+
+            :return: True once every recorded byte has been read.
+            :rtype: bool
+
+        """
+        return not self.loop and self._position >= len(self._data)
+
+#----------------------------------------------------------------------
+# Bus error handling
+#----------------------------------------------------------------------
+
+# errno values that mean the transfer can never work, so retrying is
+# pointless.
+_PERMANENT_ERRNOS = (errno.ENOTTY, errno.EOPNOTSUPP, errno.EINVAL)
+
+class RetryPolicy(object):
+    """
+
+    RetryPolicy
+
+        How often, and after how long, a failed I2C transfer is tried again.
+        Each retry waits an exponentially longer backoff, less a random
+        jitter so that devices sharing a bus don't retry in step. Keep the
+        backoffs short: they sleep on the thread doing the read.
+
+        :param retries: Retries per transfer after the first attempt.
+        :param backoff: Seconds before the first retry.
+        :param max_backoff: The longest wait before any one retry.
+        :param jitter: The fraction of each wait that is randomised, 0 to 1.
+        :param seed: Seed for the jitter, for repeatable tests.
+        :return: The RetryPolicy object.
+        :rtype: Object
+
+    """
+
+    def __init__(self, retries=3, backoff=0.001, max_backoff=0.02, jitter=0.5, seed=None):
+
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self._random = random.Random(seed)
+
+    def delay(self, attempt):
+
+        """
+
+            :param attempt: The retry about to be made, starting at 1.
+            :return: Seconds to wait before it.
+            :rtype: float
+
+        """
+        delay = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+        return delay * (1 - self.jitter * self._random.random())
+
+class CircuitBreaker(object):
+    """
+
+    CircuitBreaker
+
+        Stops a QwiicTitanGps hammering a device that has stopped answering.
+        After failure_threshold failed reads in a row the breaker opens:
+        reads return nothing without touching the bus, and poll() waits until
+        the next probe is due. A probe is a single small read; if it works
+        the breaker closes, otherwise the wait doubles, up to max_timeout.
+
+        :param failure_threshold: Failed reads in a row that open the breaker.
+        :param reset_timeout: Seconds from opening to the first probe.
+        :param max_timeout: The longest wait between probes.
+        :return: The CircuitBreaker object.
+        :rtype: Object
+
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=3, reset_timeout=0.5, max_timeout=30.0):
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_timeout = max_timeout
+
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.next_probe = None
+        self._timeout = reset_timeout
+
+    def allow(self, now):
+
+        """
+
+            :param now: time.monotonic().
+            :return: True if a read may go to the bus. When a probe is due
+                     the breaker moves to HALF_OPEN and allows it.
+            :rtype: bool
+
+        """
+        if self.state == self.OPEN:
+            if now < self.next_probe:
+                return False
+            self.state = self.HALF_OPEN
+        return True
+
+    def success(self):
+
+        """
+
+            Record a read that worked.
+
+        """
+        self.failures = 0
+        if self.state != self.CLOSED:
+            self.state = self.CLOSED
+            self.next_probe = None
+            self._timeout = self.reset_timeout
+
+    def failure(self, now):
+
+        """
+
+            Record a read that failed.
+
+            :param now: time.monotonic().
+
+        """
+        self.failures += 1
+        if self.state == self.HALF_OPEN:
+            self._timeout = min(self._timeout * 2, self.max_timeout)
+            self._open(now)
+        elif self.state == self.CLOSED and self.failures >= self.failure_threshold:
+            self._open(now)
+
+    def _open(self, now):
+
+        self.state = self.OPEN
+        self.next_probe = now + self._timeout
+        self.trips += 1
+
+#----------------------------------------------------------------------
+# Metrics
+#----------------------------------------------------------------------
+
+class _Histogram(object):
+
+    # Durations in power of two microsecond buckets: bucket n counts
+    # durations below 2**n us, the last bucket everything longer.
+
+    BUCKETS = 24
+
+    def __init__(self):
+
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+
+        micros = int(seconds * 1000000)
+        self.counts[min(micros.bit_length(), self.BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def snapshot(self):
+
+        return {
+            'count'   : self.count,
+            'mean'    : self.total / self.count if self.count else 0.0,
+            'max'     : self.max,
+            'buckets' : dict(('<%dus' % (1 << index), count)
+                             for index, count in enumerate(self.counts) if count),
+        }
+
+def _padding_count(buf, end):
+
+    # The newline padding at the end of buf[:end]: every trailing newline
+    # but the first, which ends the last sentence.
+    data = len(buf[:end].rstrip(b'\n'))
+    return max(end - data - 1, 0)
+
+class GpsMetrics(object):
+    """
+
+    GpsMetrics
+
+        Timings and counters for the read, frame and parse stages of a
+        QwiicTitanGps. Create it with QwiicTitanGps.enable_metrics(); while
+        metrics are off the driver only pays for a None check per stage.
+        Bus trouble is counted too: bus_errors failed transfers, retries
+        the retries made, failed_reads reads that gave up, skipped_reads
+        reads skipped by an open circuit breaker, and error_seconds the time
+        spent in failed transfers and backoffs.
+
+        :param framer: The NmeaFramer whose checksum and fragment counts are
+                        included.
+        :param callback: Called with snapshot() at most once every interval
+                        seconds, after a parse.
+        :param interval: Seconds between callbacks.
+        :return: The GpsMetrics object.
+        :rtype: Object
+
+    """
+
+    COUNTERS = ('reads', 'bytes_read', 'padding_bytes', 'sentences_parsed',
+                'parse_errors', 'bus_errors', 'retries', 'failed_reads',
+                'skipped_reads', 'error_seconds')
+    STAGES = ('read', 'frame', 'parse')
+
+    def __init__(self, framer=None, callback=None, interval=10.0):
+
+        self.framer = framer
+        self.callback = callback
+        self.interval = interval
+        self.reset()
+
+    def reset(self):
+
+        """
+
+            Zero every counter and histogram.
+
+        """
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+        self.stages = dict((name, _Histogram()) for name in self.STAGES)
+        self._framer_base = (self.framer.checksum_errors, self.framer.fragments_dropped) \
+            if self.framer is not None else (0, 0)
+        self._next_callback = time.monotonic() + self.interval
+
+    def observe(self, stage, seconds):
+
+        """
+
+            Record how long one run of a stage took.
+
+            :param stage: 'read', 'frame' or 'parse'.
+            :param seconds: The duration.
+
+        """
+        self.stages[stage].add(seconds)
+
+    def snapshot(self):
+
+        """
+
+            :return: Every counter, plus a count/mean/max/buckets summary for
+                     each stage, in seconds.
+            :rtype: dict
+
+        """
+        result = dict((name, getattr(self, name)) for name in self.COUNTERS)
+
+        checksum_failures, fragments_dropped = 0, 0
+        if self.framer is not None:
+            checksum_failures = self.framer.checksum_errors - self._framer_base[0]
+            fragments_dropped = self.framer.fragments_dropped - self._framer_base[1]
+        result['checksum_failures'] = checksum_failures
+        result['fragments_dropped'] = fragments_dropped
+
+        for name, histogram in self.stages.items():
+            result[name] = histogram.snapshot()
+
+        return result
+
+    def maybe_report(self):
+
+        """
+
+            Call the callback if one is set and the interval has passed.
+
+        """
+        if self.callback is None:
+            return
+
+        now = time.monotonic()
+        if now >= self._next_callback:
+            self._next_callback = now + self.interval
+            self.callback(self.snapshot())
+
+#----------------------------------------------------------------------
+# Bulk log decoding
+#----------------------------------------------------------------------
+
+# Locates every sentence in a raw capture in one pass over the bytes:
+# talker, sentence type, the fields and the checksum.
+_LOG_SENTENCE = re.compile(br'\$([A-Z]{2})(GGA|RMC)([^*$\r\n]*)\*([0-9A-Fa-f]{2})')
+
+# Columns produced for each sentence type, with their array typecodes.
+LOG_COLUMNS = {
+    'GGA' : (('time', 'd'), ('latitude', 'd'), ('longitude', 'd'),
+             ('quality', 'b'), ('sat_number', 'b'), ('hdop', 'f'),
+             ('altitude', 'f')),
+    'RMC' : (('time', 'd'), ('date', 'l'), ('latitude', 'd'), ('longitude', 'd'),
+             ('speed_knots', 'f'), ('course', 'f'), ('valid', 'b')),
+}
+
+def _log_float(value):
+    return float(value) if value else _NAN
+
+def _log_seconds(value):
+
+    # hhmmss.ss to seconds since midnight
+    if len(value) < 6:
+        return _NAN
+    return int(value[0:2]) * 3600 + int(value[2:4]) * 60 + float(value[4:])
+
+def _log_degrees(value, direction):
+
+    if not value:
+        return _NAN
+    raw = float(value)
+    degrees = int(raw / 100)
+    degrees += (raw - degrees * 100) / 60
+    return -degrees if direction in (b'S', b'W') else degrees
+
+def _log_gga(fields):
+
+    return (_log_seconds(fields[1]),
+            _log_degrees(fields[2], fields[3]),
+            _log_degrees(fields[4], fields[5]),
+            int(fields[6] or 0),
+            int(fields[7] or 0),
+            _log_float(fields[8]),
+            _log_float(fields[9]))
+
+def _log_rmc(fields):
+
+    # ddmmyy to yyyymmdd, with the same century rule as _nmea_date()
+    date = fields[9]
+    if date:
+        year = int(date[4:6])
+        year += 1900 if year >= 69 else 2000
+        date = year * 10000 + int(date[2:4]) * 100 + int(date[0:2])
+    else:
+        date = 0
+
+    return (_log_seconds(fields[1]),
+            date,
+            _log_degrees(fields[3], fields[4]),
+            _log_degrees(fields[5], fields[6]),
+            _log_float(fields[7]),
+            _log_float(fields[8]),
+            1 if fields[2] == b'A' else 0)
+
+_LOG_DECODERS = {b'GGA' : _log_gga, b'RMC' : _log_rmc}
+
+def _decode_log_chunk(path, start, end):
+
+    # Decode the sentences that start in [start, end) of a log file.
+    # Returns plain arrays so the result pickles cheaply between processes.
+    columns = dict((kind, [array(code) for _, code in spec])
+                   for kind, spec in LOG_COLUMNS.items())
+    checksum_errors = 0
+    malformed = 0
+
+    with open(path, 'rb') as fLog:
+        if end <= start:
+            return columns, 0, 0
+        data = mmap.mmap(fLog.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        matches = list(_LOG_SENTENCE.finditer(data, start, end))
+        numpy = _numpy()
+
+        # Checksums: with NumPy, every sentence is XOR reduced in one call.
+        if numpy is not None and matches:
+            raw = numpy.frombuffer(data, dtype=numpy.uint8)
+            bounds = numpy.empty(len(matches) * 2, dtype=numpy.intp)
+            bounds[0::2] = [match.start() + 1 for match in matches]
+            bounds[1::2] = [match.end(3) for match in matches]
+            sums = numpy.bitwise_xor.reduceat(raw, bounds)[0::2].tolist()
+            del raw
+        else:
+            sums = [_nmea_checksum(data[match.start() + 1:match.end(3)])
+                    for match in matches]
+
+        for match, checksum in zip(matches, sums):
+            if checksum != int(match.group(4), 16):
+                checksum_errors += 1
+                continue
+
+            kind = match.group(2)
+            fields = match.group(3).split(b',')
+            try:
+                row = _LOG_DECODERS[kind](fields)
+            except (IndexError, ValueError):
+                malformed += 1
+                continue
+
+            for column, value in zip(columns[kind.decode()], row):
+                column.append(value)
+    finally:
+        data.close()
+
+    return columns, checksum_errors, malformed
+
+def decode_nmea_log(path, processes=None, chunk_size=1 << 24):
+
+    """
+
+        Decode the GGA and RMC sentences in a raw NMEA log file into columns.
+        The file is memory mapped, split into chunks at line boundaries and
+        the chunks are decoded in parallel on a process pool.
+
+        :param path: The log file.
+        :param processes: Worker processes. None uses one per CPU, 1 decodes
+                        in this process.
+        :param chunk_size: Approximate bytes per chunk.
+        :return: 'GGA' and 'RMC' each map column name to values, oldest
+                 first, as NumPy arrays when NumPy is installed and as
+                 array.array otherwise. Times are seconds since midnight
+                 UTC, dates are yyyymmdd, and missing values are NaN.
+                 'checksum_errors' and 'malformed' count skipped sentences.
+        :rtype: dict
+
+    """
+    bounds = []
+    with open(path, 'rb') as fLog:
+        size = os.fstat(fLog.fileno()).st_size
+        if size:
+            data = mmap.mmap(fLog.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                start = 0
+                while start < size:
+                    end = data.find(b'\n', min(start + chunk_size, size))
+                    end = size if end == -1 else end + 1
+                    bounds.append((start, end))
+                    start = end
+            finally:
+                data.close()
+
+    if processes == 1 or len(bounds) <= 1:
+        results = [_decode_log_chunk(path, start, end) for start, end in bounds]
+    else:
+        with futures.ProcessPoolExecutor(processes) as pool:
+            results = list(pool.map(_decode_log_chunk, [path] * len(bounds),
+                                    [start for start, _ in bounds],
+                                    [end for _, end in bounds]))
+
+    numpy = _numpy()
+    decoded = {'checksum_errors' : 0, 'malformed' : 0}
+    for kind, spec in LOG_COLUMNS.items():
+        columns = {}
+        for index, (name, code) in enumerate(spec):
+            merged = array(code)
+            for result in results:
+                merged.extend(result[0][kind][index])
+            columns[name] = numpy.frombuffer(merged, dtype=code) \
+                if numpy is not None else merged
+        decoded[kind] = columns
+
+    for _, checksum_errors, malformed in results:
+        decoded['checksum_errors'] += checksum_errors
+        decoded['malformed'] += malformed
+
+    return decoded
+
+#----------------------------------------------------------------------
+# Binary fix log
+#----------------------------------------------------------------------
+
+_FIXLOG_MAGIC = b'QTGPSFX1'
+_FIXLOG_INDEX_MAGIC = b'QTGPSIX1'
+_FIXLOG_HEADER = struct.Struct('<8sHHI')
+
+# t, latitude, longitude, altitude, hdop, speed_knots, course, sat_number,
+# fix_quality, then the CRC32 of the rest of the record.
+_FIXLOG_RECORD = struct.Struct('<dddffffBBxxI')
+_FIXLOG_FIELDS = (('t', '<f8'), ('latitude', '<f8'), ('longitude', '<f8'),
+                  ('altitude', '<f4'), ('hdop', '<f4'), ('speed_knots', '<f4'),
+                  ('course', '<f4'), ('sat_number', 'u1'), ('fix_quality', 'u1'),
+                  ('_pad', 'V2'), ('crc', '<u4'))
+_FIXLOG_TYPECODES = (('t', 'd'), ('latitude', 'd'), ('longitude', 'd'),
+                     ('altitude', 'f'), ('hdop', 'f'), ('speed_knots', 'f'),
+                     ('course', 'f'), ('sat_number', 'B'), ('fix_quality', 'B'))
+
+# One per completed block: t_first, t_last, first record number.
+_FIXLOG_INDEX = struct.Struct('<ddQ')
+
+def _fixlog_value(value):
+    return _NAN if value is None else value
+
+def _fixlog_valid(data, offset):
+
+    # The CRC covers every byte of the record before it.
+    size = _FIXLOG_RECORD.size - 4
+    crc, = struct.unpack_from('<I', data, offset + size)
+    return zlib.crc32(data[offset:offset + size]) == crc
+
+def _fixlog_scan(data, index, block_records):
+
+    # Return (records, index entries) that survived the last write. Only
+    # the records after the last indexed block can be torn, so only those
+    # are checked, and index entries past the end of the data are dropped.
+    header = _FIXLOG_HEADER.size
+    size = _FIXLOG_RECORD.size
+    records = (len(data) - header) // size if len(data) >= header else 0
+
+    blocks = len(index) // 3
+    while blocks and index[(blocks - 1) * 3 + 2] + block_records > records:
+        blocks -= 1
+
+    valid = blocks * block_records
+    while valid < records and _fixlog_valid(data, header + valid * size):
+        valid += 1
+
+    return valid, blocks
+
+def _fixlog_build_index(data, records, block_records):
+
+    # Index entries for every complete block of the first records records,
+    # read back from the records themselves.
+    header = _FIXLOG_HEADER.size
+    size = _FIXLOG_RECORD.size
+    entries = []
+    for first in range(0, records - block_records + 1, block_records):
+        t_first, = struct.unpack_from('<d', data, header + first * size)
+        t_last, = struct.unpack_from('<d', data, header + (first + block_records - 1) * size)
+        entries.append((t_first, t_last, first))
+
+    return entries
+
+def _fixlog_read_index(path, block_records=None):
+
+    # The index as a flat array('d') of (t_first, t_last, first) triples.
+    index = array('d')
+    try:
+        with open(path, 'rb') as fIndex:
+            raw = fIndex.read()
+    except IOError:
+        return index, block_records
+
+    if len(raw) >= _FIXLOG_HEADER.size:
+        magic, _, _, stored = _FIXLOG_HEADER.unpack_from(raw)
+        if magic == _FIXLOG_INDEX_MAGIC and stored == (block_records or stored):
+            body = raw[_FIXLOG_HEADER.size:]
+            body = body[:len(body) - len(body) % _FIXLOG_INDEX.size]
+            for entry in _FIXLOG_INDEX.iter_unpack(body):
+                index.extend(entry)
+            return index, stored
+
+    return index, block_records
+
+class FixLogWriter(object):
+    """
+
+    FixLogWriter
+
+        Appends fixes to a compact binary log: fixed width 48 byte records,
+        each with its own CRC32, plus a small index file (path + '.idx')
+        holding the time span of every block of block_records records.
+        Records are buffered and written a block at a time, or at least
+        every flush_interval seconds, and the files are fsynced at most
+        every sync_interval seconds. After a crash, at most the block being
+        written is lost. Reopening a log appends to it, and rebuilds the
+        index from the records if it is missing or unreadable. Read it with
+        FixLog.
+
+        :param path: The log file.
+        :param block_records: Records per indexed block.
+        :param flush_interval: The most seconds a record waits in memory.
+        :param sync_interval: The fewest seconds between two fsyncs.
+        :return: The FixLogWriter object.
+        :rtype: Object
+
+    """
+
+    def __init__(self, path, block_records=256, flush_interval=1.0, sync_interval=5.0):
+
+        self.path = path
+        self.index_path = path + '.idx'
+        self.flush_interval = flush_interval
+        self.sync_interval = sync_interval
+
+        # Carry on from the valid part of an existing log.
+        index, stored = _fixlog_read_index(self.index_path)
+        try:
+            with open(path, 'rb') as fLog:
+                data = fLog.read()
+        except IOError:
+            data = b''
+
+        entries = None
+        if data[:len(_FIXLOG_MAGIC)] != _FIXLOG_MAGIC:
+            records, blocks = 0, 0
+        elif stored is not None:
+            block_records = stored
+            records, blocks = _fixlog_scan(data, index, block_records)
+        else:
+            # With no usable index, check every record and index them again
+            # rather than start a new log over the old one.
+            records, _ = _fixlog_scan(data, index, block_records)
+            entries = _fixlog_build_index(data, records, block_records)
+            blocks = len(entries)
+        self.block_records = block_records
+
+        self._file = open(path, 'r+b' if records else 'w+b')
+        self._index = open(self.index_path, 'r+b' if records and entries is None else 'w+b')
+        if not records:
+            self._file.write(_FIXLOG_HEADER.pack(_FIXLOG_MAGIC, _FIXLOG_RECORD.size, 1, 0))
+        if not records or entries is not None:
+            self._index.write(_FIXLOG_HEADER.pack(_FIXLOG_INDEX_MAGIC, _FIXLOG_INDEX.size,
+                                                  1, block_records))
+            for entry in entries or ():
+                self._index.write(_FIXLOG_INDEX.pack(*entry))
+
+        self._file.truncate(_FIXLOG_HEADER.size + records * _FIXLOG_RECORD.size)
+        self._file.seek(0, os.SEEK_END)
+        self._index.truncate(_FIXLOG_HEADER.size + blocks * _FIXLOG_INDEX.size)
+        self._index.seek(0, os.SEEK_END)
+
+        self.records = records
+        self._buffer = bytearray()
+        self._block_first = blocks * block_records
+        self._block_t_first = None
+        if self._block_first < records:
+            offset = _FIXLOG_HEADER.size + self._block_first * _FIXLOG_RECORD.size
+            self._block_t_first = struct.unpack_from('<d', data, offset)[0]
+
+        now = time.monotonic()
+        self._last_flush = now
+        self._last_sync = now
+        self._t = None
+
+    def append(self, fix, t=None):
+
+        """
+
+            Add a fix to the log. Without t, fixes that have no datetime are
+            skipped, so every record keeps to GPS time.
+
+            :param fix: The Fix to add.
+            :param t: The time of the fix in POSIX seconds. Times must not go
+                      backwards. Defaults to the fix's datetime.
+            :return: True if the fix was added.
+            :rtype: bool
+
+        """
+        if t is None:
+            if fix.datetime is None:
+                return False
+            t = _utc_timestamp(fix.datetime)
+
+        record = _FIXLOG_RECORD.pack(t, _fixlog_value(fix.latitude),
+                                     _fixlog_value(fix.longitude),
+                                     _fixlog_value(fix.altitude),
+                                     _fixlog_value(fix.hdop),
+                                     _fixlog_value(fix.speed_knots),
+                                     _fixlog_value(fix.course),
+                                     min(fix.sat_number or 0, 255),
+                                     min(fix.fix_quality or 0, 255), 0)
+        size = _FIXLOG_RECORD.size - 4
+        self._buffer += record[:size]
+        self._buffer += struct.pack('<I', zlib.crc32(record[:size]))
+
+        if self._block_t_first is None:
+            self._block_t_first = t
+        self._t = t
+        self.records += 1
+
+        if self.records - self._block_first >= self.block_records:
+            self._write(block_done=True)
+        elif time.monotonic() - self._last_flush >= self.flush_interval:
+            self._write()
+
+        return True
+
+    def _write(self, block_done=False, sync=False):
+
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+            self._file.flush()
+
+        if block_done:
+            # The index entry only goes out once its block's records have.
+            self._index.write(_FIXLOG_INDEX.pack(self._block_t_first, self._t,
+                                                 self._block_first))
+            self._index.flush()
+            self._block_first = self.records
+            self._block_t_first = None
+
+        now = time.monotonic()
+        self._last_flush = now
+        if sync or now - self._last_sync >= self.sync_interval:
+            os.fsync(self._file.fileno())
+            os.fsync(self._index.fileno())
+            self._last_sync = now
+
+    def flush(self, sync=True):
+
+        """
+
+            Write out buffered records now.
+
+            :param sync: Also fsync the log.
+
+        """
+        self._write(sync=sync)
+
+    def close(self):
+
+        """
+
+            Write out buffered records, fsync and close the log.
+
+        """
+        if self._file.closed:
+            return
+        self._write(sync=True)
+        self._file.close()
+        self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class FixLog(object):
+    """
+
+    FixLog
+
+        Reads a log written by FixLogWriter. The file is memory mapped and
+        ranges are found by binary search over the block index and then
+        within one block, so only a few pages are touched. With NumPy,
+        records() and columns() are views into the map, not copies. A torn
+        final block is ignored.
+
+        :param path: The log file.
+        :return: The FixLog object.
+        :rtype: Object
+
+    """
+
+    def __init__(self, path):
+
+        with open(path, 'rb') as fLog:
+            header = fLog.read(_FIXLOG_HEADER.size)
+            magic, record_size = _FIXLOG_HEADER.unpack(header)[:2] \
+                if len(header) == _FIXLOG_HEADER.size else (None, None)
+            if magic != _FIXLOG_MAGIC or record_size != _FIXLOG_RECORD.size:
+                raise ValueError('{} is not a fix log'.format(path))
+            size = os.fstat(fLog.fileno()).st_size
+            self._map = mmap.mmap(fLog.fileno(), 0, access=mmap.ACCESS_READ) \
+                if size > _FIXLOG_HEADER.size else b''
+
+        index, self.block_records = _fixlog_read_index(path + '.idx')
+        if self.block_records is None:
+            index, self.block_records = array('d'), 1
+        if not self._map:
+            self._count, blocks = 0, 0
+        else:
+            self._count, blocks = _fixlog_scan(self._map, index, self.block_records)
+        self._index = index[:blocks * 3]
+
+        numpy = _numpy()
+        self._records = None
+        if numpy is not None and self._count:
+            self._records = numpy.frombuffer(self._map, numpy.dtype(list(_FIXLOG_FIELDS)),
+                                             count=self._count,
+                                             offset=_FIXLOG_HEADER.size)
+
+    def __len__(self):
+        return self._count
+
+    def _t(self, record):
+        return struct.unpack_from('<d', self._map,
+                                  _FIXLOG_HEADER.size + record * _FIXLOG_RECORD.size)[0]
+
+    def find(self, t):
+
+        """
+
+            Return the number of the first record at or after time t.
+
+            :param t: The time in POSIX seconds.
+            :return: A record number, len(self) if every record is earlier.
+            :rtype: int
+
+        """
+        # Find the block from the index, then bisect inside it.
+        index = self._index
+        low, high = 0, len(index) // 3
+        while low < high:
+            middle = (low + high) // 2
+            if index[middle * 3 + 1] < t:
+                low = middle + 1
+            else:
+                high = middle
+
+        # Records after the last indexed block are searched as one.
+        high = self._count if low == len(index) // 3 else \
+            (low + 1) * self.block_records
+        low = low * self.block_records
+        while low < high:
+            middle = (low + high) // 2
+            if self._t(middle) < t:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def _bounds(self, t_start, t_end):
+
+        first = 0 if t_start is None else self.find(t_start)
+        last = self._count if t_end is None else self.find(t_end)
+        return first, max(first, last)
+
+    def records(self, t_start=None, t_end=None):
+
+        """
+
+            Return the records with t_start <= t < t_end as a NumPy structured
+            array viewing the map. Needs NumPy; see columns() otherwise.
+
+            :param t_start: Start of the window, or None for the first record.
+            :param t_end: End of the window, or None for the last record.
+            :return: The records.
+            :rtype: numpy.ndarray
+
+        """
+        if _numpy() is None:
+            raise ImportError('FixLog.records() needs NumPy, use columns()')
+
+        first, last = self._bounds(t_start, t_end)
+        if self._records is None:
+            return _numpy().zeros(0, list(_FIXLOG_FIELDS))
+        return self._records[first:last]
+
+    def columns(self, t_start=None, t_end=None):
+
+        """
+
+            Return the records with t_start <= t < t_end, one sequence per
+            column: NumPy views when NumPy is installed, otherwise
+            array.array copies. Missing values are NaN.
+
+            :param t_start: Start of the window, or None for the first record.
+            :param t_end: End of the window, or None for the last record.
+            :return: Column name to values.
+            :rtype: dict
+
+        """
+        first, last = self._bounds(t_start, t_end)
+
+        if self._records is not None:
+            records = self._records[first:last]
+            return dict((name, records[name]) for name, _ in _FIXLOG_TYPECODES)
+
+        columns = [array(code) for _, code in _FIXLOG_TYPECODES]
+        offset = _FIXLOG_HEADER.size + first * _FIXLOG_RECORD.size
+        data = self._map[offset:offset + (last - first) * _FIXLOG_RECORD.size]
+        for values in _FIXLOG_RECORD.iter_unpack(data):
+            for column, value in zip(columns, values):
+                column.append(value)
+
+        return dict((name, column) for (name, _), column in zip(_FIXLOG_TYPECODES, columns))
+
+    def close(self):
+
+        """
+
+            Unmap the log. If views returned by records() or columns() are
+            still held, the map stays until the last of them is freed.
+
+        """
+        self._records = None
+        if self._map:
+            try:
+                self._map.close()
+            except BufferError:
+                # NumPy views still export the map; they keep it alive.
+                pass
+            self._map = b''
+            self._count = 0
+            self._index = array('d')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+#----------------------------------------------------------------------
+# Change subscriptions
+#----------------------------------------------------------------------
+
+class Subscription(object):
+    """
+
+    Subscription
+
+        A change handler registered with QwiicTitanGps.subscribe(). Keep it
+        to unsubscribe later. Deliveries dropped on a full queue are counted
+        in dropped, and exceptions raised by the handler or key in errors,
+        with the latest kept as last_error.
+
+    """
+
+    def __init__(self, target, fields, key, sentence_types, thresholds, debounce):
+
+        self.target = target
+        self.fields = tuple(fields) if fields is not None else None
+        self.key = key
+        self.sentence_types = frozenset(sentence_types) if sentence_types else None
+        self.thresholds = thresholds or {}
+        self.debounce = debounce
+        self._last = None
+        self._last_time = None
+        self.dropped = 0
+        self.errors = 0
+        self.last_error = None
+
+        # An asyncio.Queue isn't thread safe, so it is filled on its event
+        # loop. If asyncio hasn't been imported, target can't be one.
+        self._loop = None
+        asyncio_module = sys.modules.get('asyncio')
+        if asyncio_module is not None and isinstance(target, asyncio_module.Queue):
+            self._loop = asyncio_module.get_event_loop()
+
+    def _put_async(self, item):
+
+        # Runs on the event loop of an asyncio.Queue target.
+        try:
+            self.target.put_nowait(item)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    def _value(self, snapshot):
+
+        if self.key is not None:
+            return {'key' : self.key(snapshot)}
+        fields = self.fields if self.fields is not None else snapshot.keys()
+        return dict((field, snapshot.get(field)) for field in fields)
+
+    def _changes(self, value):
+
+        last = self._last
+        if last is None:
+            return dict((name, (None, new)) for name, new in value.items())
+
+        changes = {}
+        for name, new in value.items():
+            old = last.get(name)
+            if new == old:
+                continue
+
+            threshold = self.thresholds.get(name)
+            if threshold is not None:
+                try:
+                    if abs(float(new) - float(old)) < threshold:
+                        continue
+                except (TypeError, ValueError):
+                    pass
+
+            changes[name] = (old, new)
+
+        return changes
+
+    def check(self, snapshot, sentence_types, now):
+
+        """
+
+            Deliver the snapshot if it changed enough since the last delivery.
+
+            :return: True if the handler was called.
+            :rtype: bool
+
+        """
+        if self.sentence_types is not None and not self.sentence_types & sentence_types:
+            return False
+        if self._last_time is not None and now - self._last_time < self.debounce:
+            return False
+
+        try:
+            value = self._value(snapshot)
+        except Exception as error:
+            self.errors += 1
+            self.last_error = error
+            return False
+
+        changes = self._changes(value)
+        if not changes:
+            return False
+
+        # Fields below their threshold keep their old baseline, so slow
+        # drift is still reported once it adds up.
+        if self._last is None:
+            self._last = value
+        else:
+            self._last.update((name, new) for name, (old, new) in changes.items())
+        self._last_time = now
+
+        # A failing handler must not stop the parse, or the reader thread
+        # running it.
+        put = getattr(self.target, 'put_nowait', None)
+        try:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._put_async, (snapshot, changes))
+            elif put is not None:
+                put((snapshot, changes))
+            else:
+                self.target(snapshot, changes)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        except Exception as error:
+            self.errors += 1
+            self.last_error = error
+            return False
+
+        return True
+
+class QwiicTitanGps(object):
+    """
+
+    QwiicTitanGps
+
+        :param address: The I2C address to use for the device.
+                        If not provided, the default address is used.
+        :param i2c_driver: An existing i2c driver object. If not provided
+                        a driver object is created.
+        :return: The Qwiic Titan GPS device object.
+        :rtype: Object
+
+    """
+
+    device_name = _DEFAULT_NAME
+    available_addresses = _AVAILABLE_I2C_ADDRESS
+
+    MAX_I2C_BUFFER = 32
+    MAX_GPS_BUFFER = 255
+
+    # Seconds a presence check is cached for, see is_connected().
+    PROBE_TTL = 5.0
+
+    _RPiCheck = False
+
+    gnss_messages = {
+
+        'Time'           : 0,
+        'Latitude'       : 0,
+        'Lat'            : 0,
+        'Lat_Direction'  : "",
+        'Longitude'      : 0,
+        'Long'           : 0,
+        'Long_Direction' : "",
+        'Altitude'       : 0,
+        'Altitude_Units' : "",
+        'Sat_Number'     : 0,
+        'Geo_Separation' : 0,
+        'Geo_Sep_Units'  : "",
+        'Fix_Quality'    : 0,
+        'Fix_Type'       : "",
+        'HDOP'           : "",
+        'PDOP'           : "",
+        'VDOP'           : "",
+        'Date'           : None,
+        'Speed_Knots'    : 0,
+        'Speed_Kmph'     : 0,
+        'Course'         : 0,
+        'Satellites'     : {},
+        'Datetime'       : None,
+        'Received_NS'    : None,
+    }
+
+    def __init__(self, address=None, i2c_driver=None):
+
+        # Buffer that every read fills in place. Where the driver sits on an
+        # smbus2 bus, the whole window is read with one I2C_RDWR ioctl
+        # instead of a transaction per block; _rdwr caches that set up.
+        self._raw_buffer = bytearray(self.MAX_GPS_BUFFER)
+        self.use_rdwr = True
+        self._rdwr = None
+
+        # Sentences that span two reads are carried over by the framer.
+        # _read_stamps holds when each block of the last read arrived.
+        self._framer = NmeaFramer()
+        self._read_stamps = []
+
+        # State for poll(): seconds between fixes, the expected size of one
+        # NMEA burst and when the next one is due.
+        self.update_interval = 1.0
+        self._burst_estimate = self.MAX_GPS_BUFFER
+        self._next_epoch = None
+        self.bus_bytes_read = 0
+        self.fixes_read = 0
+
+        # Each instance has its own fix. latest_fix is a read only copy of it
+        # that is swapped in whole after every parse.
+        self.gnss_messages = dict(self.gnss_messages)
+        self._latest_fix = MappingProxyType(dict(self.gnss_messages))
+
+        # Change handlers, see subscribe(), and per fix handlers, see
+        # add_fix_listener().
+        self._subscriptions = []
+        self._fix_listeners = []
+        self.listener_error = None
+
+        # How the host clock lines up with GPS time.
+        self.clock = ClockOffset()
+
+        # Optional quality gate for fixes, see set_fix_filter().
+        self.fix_filter = None
+
+        # Optional stage timings and counters, see enable_metrics().
+        self.metrics = None
+
+        # Satellites from GSV groups, also published as
+        # gnss_messages['Satellites'].
+        self.satellites = SatelliteTable()
+
+        # Cache for the fix property and the optional fix history.
+        self._fix_cache = (None, None)
+        self.history = None
+        self.fix_log = None
+
+        # Latest PMTK001 flag for each command number, see send_pmtk().
+        self._pmtk_acks = {}
+        self._ack_condition = threading.Condition()
+
+        # Bus error handling, see read_raw_bytes(). Set either to None to
+        # turn it off.
+        self.retry_policy = RetryPolicy()
+        self.breaker = CircuitBreaker()
+        self.last_bus_error = None
+        self._read_error = None
+
+        # 1 when the last read ended with one byte of padding, see
+        # read_raw_bytes().
+        self._padding_kept = 0
+
+        # Background reader thread, see start().
+        self._reader = None
+        self._stop_event = threading.Event()
+        self.reader_error = None
+
+        # Parse GGA, RMC, GSA and VTG without pynmea2. pynmea2 still handles
+        # every other sentence type.
+        self.fast_parser = True
+
+        # Did the user specify an I2C address?
+
+        self.address = address if address is not None else self.available_addresses[0]
+
+        # The I2C driver, if one was provided. Otherwise one is loaded the
+        # first time the bus is used, see _i2c.
+
+        self._i2c_driver = i2c_driver
+
+    @property
+    def _i2c(self):
+
+        # Bus probing and the Raspberry Pi checks wait until the bus is
+        # actually needed.
+
+        # As noted above, to run this device on a Raspberry Pi,
+        # clock stretching is needed.
+        #
+        # Lets check if it's enabled. This is done only once in
+        # the session
+        if not QwiicTitanGps._RPiCheck:
+            _checkForRPiI2CClockStretch()
+            QwiicTitanGps._RPiCheck = True
+
+        # load the I2C driver if one isn't provided
+
+        if self._i2c_driver is None:
+            self._i2c_driver = qwiic_i2c.getI2CDriver()
+            if self._i2c_driver is None:
+                print("Unable to load I2C driver for this platform.")
+
+        return self._i2c_driver
+
+    @_i2c.setter
+    def _i2c(self, driver):
+        self._i2c_driver = driver
+
+    # ----------------------------------
+
+    def is_connected(self):
+
+        """
+
+            Determine if a GPS device is connected to the system.. The
+            probe goes through this device's own driver, and its answer is
+            cached for PROBE_TTL seconds.
+
+            :return: True if the device is connected, otherwise False.
+            :rtype: bool
+
+        """
+        return probe_device(self._i2c, self.address, self.PROBE_TTL)[0]
+
+    connected = property(is_connected)
+
+    def begin(self):
+
+        """
+
+            Initialize the data transmission lines.
+
+            :return: Returns True on success, False on failure
+            :rtype: boolean
+
+        """
+        return self.is_connected()
+
+    def read_raw_bytes(self, nbytes=None):
+
+        """
+
+            This function pulls GPS data from the module 255 bytes at a time,
+            in MAX_I2C_BUFFER sized blocks, into a buffer that is allocated
+            once per instance. On an smbus2 bus all the blocks are read with a
+            single I2C_RDWR ioctl; otherwise there is one readBlock per block
+            and reading stops at the first block that is nothing but the
+            module's newline padding. The first byte of that block is kept,
+            as it may be the line ending of the last sentence.
+
+            Failed transfers are retried as retry_policy says. If they still
+            fail, the bytes read so far are returned and the error is kept in
+            last_bus_error; with no circuit breaker set, a read that got
+            nothing raises the error instead. While the breaker is open this
+            returns nothing without touching the bus.
+            :param nbytes: The most bytes to read. Defaults to MAX_GPS_BUFFER.
+            :return: A view of the bytes read. The view is only valid until the
+                     next read; copy it with bytes() to keep it.
+            :rtype: memoryview
+
+        """
+        metrics = self.metrics
+        if metrics is not None:
+            started = time.monotonic()
+
+        stamps = self._read_stamps
+        del stamps[:]
+        limit = self.MAX_GPS_BUFFER
+        if nbytes is not None:
+            limit = min(nbytes, limit)
+
+        breaker = self.breaker
+        if breaker is not None:
+            if not breaker.allow(time.monotonic()):
+                if metrics is not None:
+                    metrics.skipped_reads += 1
+                return memoryview(self._raw_buffer)[:0]
+            if breaker.state == breaker.HALF_OPEN:
+                # Probing for recovery: one small read is enough.
+                limit = min(limit, self.MAX_I2C_BUFFER)
+
+        self._read_error = None
+        self._padding_kept = 0
+        messages = self._rdwr_messages(limit) if self.use_rdwr else None
+        if messages is not None:
+            length = self._read_rdwr(messages, limit, metrics)
+        else:
+            length = self._read_blocks(limit, metrics)
+
+        error = self._read_error
+        if error is not None:
+            self.last_bus_error = error
+            if metrics is not None:
+                metrics.failed_reads += 1
+            if breaker is None:
+                if length == 0:
+                    raise error
+            else:
+                breaker.failure(time.monotonic())
+        elif breaker is not None:
+            breaker.success()
+
+        if metrics is not None:
+            metrics.observe('read', time.monotonic() - started)
+            metrics.reads += 1
+            metrics.bytes_read += length
+
+        return memoryview(self._raw_buffer)[:length]
+
+    def _read_blocks(self, limit, metrics):
+
+        # One readBlock transaction per MAX_I2C_BUFFER block.
+        buf = self._raw_buffer
+        stamps = self._read_stamps
+        length = 0
+        end = 0
+
+        while length < limit:
+
+            try:
+                block = self._bus_call(self._i2c.readBlock, metrics, self.address,
+                                       0x00, min(self.MAX_I2C_BUFFER, limit - length))
+            except (IOError, OSError) as error:
+                # Keep what was read before the failure.
+                self._read_error = error
+                break
+
+            count = len(block)
+            if count == 0:
+                break
+
+            # Same sized slice assignment, so the buffer is filled in place.
+            buf[length:length + count] = block
+            end = length + count
+            self.bus_bytes_read += count
+            stamps.append((length + count, _monotonic_ns()))
+
+            # The module pads with newlines when it has nothing to send, so
+            # a block of only padding means its buffer is drained. Its first
+            # byte may still be the line ending of the last sentence, so it
+            # is kept; the framer ignores the empty line otherwise.
+            if buf.count(0x0A, length, end) == count:
+                self._padding_kept = 1
+                length += 1
+                break
+
+            length += count
+
+        if metrics is not None:
+            metrics.padding_bytes += _padding_count(buf, end)
+
+        return length
+
+    def _bus_call(self, func, metrics, *args):
+
+        # Call func, retrying transient bus errors as retry_policy says.
+        policy = self.retry_policy
+        attempt = 0
+        while True:
+            if metrics is not None:
+                started = time.monotonic()
+            try:
+                return func(*args)
+            except (IOError, OSError) as error:
+                retry = policy is not None and attempt < policy.retries and \
+                    error.errno not in _PERMANENT_ERRNOS
+                delay = policy.delay(attempt + 1) if retry else 0
+                if metrics is not None:
+                    metrics.bus_errors += 1
+                    metrics.error_seconds += time.monotonic() - started + delay
+                if not retry:
+                    raise
+                attempt += 1
+                if metrics is not None:
+                    metrics.retries += 1
+                time.sleep(delay)
+
+    def _rdwr_messages(self, limit):
+
+        # Read messages for one I2C_RDWR ioctl that fills the first limit
+        # bytes of the buffer, one MAX_I2C_BUFFER segment per message.
+        # Returns None when the driver has no smbus2 bus underneath.
+        rdwr = self._rdwr
+        if rdwr is None:
+            rdwr = self._rdwr = self._rdwr_setup()
+        if rdwr is False:
+            return None
+
+        messages = rdwr[1].get(limit)
+        if messages is None:
+            i2c_msg = rdwr[2]
+            messages = []
+            for offset in range(0, limit, self.MAX_I2C_BUFFER):
+                count = min(self.MAX_I2C_BUFFER, limit - offset)
+                segment = (ctypes.c_char * count).from_buffer(self._raw_buffer, offset)
+                message = i2c_msg(addr=self.address, flags=_I2C_M_RD, len=count,
+                                  buf=ctypes.cast(segment, ctypes.POINTER(ctypes.c_char)))
+                # The message only holds a pointer, so keep the segment alive.
+                message._segment = segment
+                messages.append(message)
+            rdwr[1][limit] = messages
+
+        return messages
+
+    def _rdwr_setup(self):
+
+        bus = getattr(self._i2c, 'i2cbus', None)
+        if bus is None or not hasattr(bus, 'i2c_rdwr'):
+            return False
+
+        try:
+            i2c_msg = importlib.import_module('smbus2').i2c_msg
+        except ImportError:
+            return False
+
+        return (bus.i2c_rdwr, {}, i2c_msg)
+
+    def _read_rdwr(self, messages, limit, metrics):
+
+        # The whole window in one ioctl, straight into the buffer.
+        try:
+            self._bus_call(self._rdwr[0], metrics, *messages)
+        except (IOError, OSError) as error:
+            if error.errno not in _PERMANENT_ERRNOS:
+                self._read_error = error
+                return 0
+            # The adapter can't do combined transfers, use readBlock from now on.
+            self._rdwr = False
+            return self._read_blocks(limit, metrics)
+
+        self._read_stamps.append((limit, _monotonic_ns()))
+        self.bus_bytes_read += limit
+
+        # Keep everything up to the last block that isn't all padding, and
+        # the first byte after it, which may be a line ending.
+        buf = self._raw_buffer
+        length = 0
+        for offset in range(0, limit, self.MAX_I2C_BUFFER):
+            end = min(offset + self.MAX_I2C_BUFFER, limit)
+            if buf.count(0x0A, offset, end) != end - offset:
+                length = end
+        if length < limit:
+            self._padding_kept = 1
+            length += 1
+
+        if metrics is not None:
+            metrics.padding_bytes += _padding_count(buf, limit)
+
+        return length
+
+    def _frame(self, data):
+
+        # Frame data into a list of sentences, timing it if metrics are on.
+        metrics = self.metrics
+        if metrics is None:
+            return list(self._framer.feed(data, self._read_stamps))
+
+        started = time.monotonic()
+        sentences = list(self._framer.feed(data, self._read_stamps))
+        metrics.observe('frame', time.monotonic() - started)
+
+        return sentences
+
+    def get_raw_data(self):
+
+        """
+
+            This function pulls GPS data from the module 255 bytes at a time.
+            The bytes are decoded once, after the read has finished.
+            :return: A string of all the GPS data.
+            :rtype: String
+
+        """
+        return str(self.read_raw_bytes(), 'latin-1')
+
+    def get_sentences(self):
+
+        """
+
+            This function reads from the module once and hands the bytes to the
+            instance's NMEA framer. Sentences that are cut off at the end of a
+            read are kept and completed by the next call.
+            :return: A generator of complete, checksum validated sentences.
+            :rtype: Generator
+
+        """
+        return self._framer.feed(self.read_raw_bytes(), self._read_stamps)
+
+    def iter_raw(self):
+
+        """
+
+            Read the module for ever, as a source for frame_sentences(). Reads
+            are paced by update_interval once the module runs dry.
+
+            :return: A generator of byte strings.
+            :rtype: Generator
+
+        """
+        while True:
+            data = self.read_raw_bytes()
+            if len(data):
+                yield bytes(data)
+            if len(data) <= self._padding_kept:
+                time.sleep(self.update_interval / 10)
+
+    def iter_fixes(self, types=None):
+
+        """
+
+            Read the module for ever, producing a Fix for every GGA sentence
+            that merges. Sentences go through the same merge as
+            parse_sentences(), so the fix filter, history, fix log,
+            subscriptions and PMTK acknowledgements all apply.
+
+            :param types: Sentence types to parse, or None for all. GGA is
+                        always parsed.
+            :return: A generator of Fix records.
+            :rtype: Generator
+
+        """
+        if types is not None:
+            types = frozenset(types) | frozenset(['GGA'])
+
+        fixes = []
+        for data in self.iter_raw():
+            self._merge_sentences(self._frame(data), types, fixes)
+            for fix in fixes:
+                yield fix
+            del fixes[:]
+
+    def prepare_data(self):
+
+        """
+
+            This function seperates raw GPS data from the module into sentences
+            of GNSS data.
+            :return: A list of all the complete GPS sentences gathered so far.
+            :rtype: List
+
+        """
+        return self._frame(self.read_raw_bytes())
+
+    def poll(self, wait=True):
+
+        """
+
+            Read one NMEA burst from the module. Reads are sized to the burst
+            seen in earlier epochs and stop as soon as the module's buffer is
+            drained.
+
+            :param wait: If True, sleep until the next fix epoch is due before
+                         reading.
+            :return: A list of the complete sentences read.
+            :rtype: List
+
+        """
+        if wait and self._next_epoch is not None:
+            delay = self._next_epoch - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+        started = time.monotonic()
+        sentences = []
+        burst = 0
+        drained = False
+
+        while True:
+            want = min(max(self.MAX_I2C_BUFFER, int(self._burst_estimate) - burst),
+                       self.MAX_GPS_BUFFER)
+            data = self.read_raw_bytes(want)
+            count = len(data) - self._padding_kept
+            burst += count
+            sentences.extend(self._frame(data))
+
+            if self._padding_kept or count < want:
+                drained = True
+                break
+
+            if self._burst_complete(burst, drained):
+                break
+
+        self._end_burst(started, burst, drained, sentences)
+
+        # Leave an unresponsive device alone until its next probe is due.
+        breaker = self.breaker
+        if breaker is not None and breaker.state == breaker.OPEN:
+            self._next_epoch = max(self._next_epoch, breaker.next_probe)
+
+        return sentences
+
+    def read_block(self):
+
+        """
+
+            Read a single MAX_I2C_BUFFER block and frame it. This is the unit
+            of work QwiicBusScheduler interleaves between devices.
+
+            :return: The number of data bytes read (0 once the module is
+                     drained) and the sentences completed by them.
+            :rtype: tuple
+
+        """
+        data = self.read_raw_bytes(self.MAX_I2C_BUFFER)
+        return len(data) - self._padding_kept, self._frame(data)
+
+    def _burst_complete(self, burst, drained):
+
+        return drained or (burst >= self._burst_estimate
+                           and not self._framer.pending)
+
+    def _end_burst(self, started, burst, drained, sentences):
+
+        # Book keeping after a burst: learn its size and when the next is due.
+        if burst == 0:
+            # Nothing yet, look again shortly rather than a whole epoch later.
+            self._next_epoch = started + self.update_interval / 10
+            return
+
+        if drained or burst > self._burst_estimate:
+            self._burst_estimate += (burst - self._burst_estimate) / 4
+
+        self._next_epoch = started + self.update_interval
+        self.fixes_read += sum(1 for sentence in sentences
+                               if sentence[3:6] == 'GGA')
+
+    @property
+    def bus_bytes_per_fix(self):
+
+        """
+
+            The average number of bytes moved over the bus, padding included,
+            for each GGA fix read.
+
+            :return: Bytes per fix, or 0 if no fix has been read.
+            :rtype: float
+
+        """
+        if not self.fixes_read:
+            return 0
+        return self.bus_bytes_read / self.fixes_read
+
+    def get_nmea_data(self):
+
+        """
+
+            This function takes a list of GNSS sentences and uses the pynmea2
+            parser to parse the data.
+            :return: Returns True on success and False otherwise
+            :rtype: Boolean
+
+        """
+        self.parse_sentences(self.prepare_data())
+
+        return True
+
+    def parse_sentences(self, sentences):
+
+        """
+
+            This function parses a list of GNSS sentences into gnss_messages
+            and then publishes a new latest_fix snapshot.
+            :param sentences: Complete NMEA sentences.
+            :return: Returns True
+            :rtype: Boolean
+
+        """
+        self._merge_sentences(sentences)
+
+        return True
+
+    def _merge_sentences(self, sentences, types=None, fixes=None):
+
+        # The one merge step behind parse_sentences() and iter_fixes(). Only
+        # sentences in types are parsed, and a Fix for every GGA that merged
+        # is appended to fixes if a list is given.
+        metrics = self.metrics
+        if metrics is not None:
+            started = time.monotonic()
+            parsed = errors = 0
+
+        types_seen = set() if self._subscriptions else None
+
+        for sentence in sentences:
+            if sentence.startswith('$PMTK001,'):
+                self._handle_pmtk_ack(sentence)
+                continue
+
+            if types is not None and sentence[3:6] not in types:
+                continue
+
+            if types_seen is not None:
+                types_seen.add(sentence[3:6])
+
+            msg = parse_nmea(sentence, self.fast_parser)
+            if msg is None:
+                if metrics is not None:
+                    errors += 1
+                continue
+
+            merged = self._merge_message(msg, getattr(sentence, 'received_ns', None))
+            if metrics is not None:
+                parsed += 1
+
+            if merged:
+                messages = self.gnss_messages
+                if messages['Datetime'] is not None and messages['Received_NS'] is not None:
+                    self.clock.update(messages['Received_NS'], messages['Datetime'])
+
+                if self.history is not None or self.fix_log is not None or \
+                   fixes is not None or self._fix_listeners:
+                    fix = Fix.from_messages(messages)
+                    if self.history is not None:
+                        self.history.append(fix)
+                    if self.fix_log is not None:
+                        self.fix_log.append(fix)
+                    if fixes is not None:
+                        fixes.append(fix)
+                    for listener in self._fix_listeners:
+                        try:
+                            listener(fix)
+                        except Exception as error:
+                            self.listener_error = error
+
+        # Replacing the reference is atomic, so readers never see a
+        # half updated fix.
+        self._latest_fix = MappingProxyType(dict(self.gnss_messages))
+
+        if self._subscriptions and types_seen:
+            now = time.monotonic()
+            for subscription in list(self._subscriptions):
+                subscription.check(self._latest_fix, types_seen, now)
+
+        if metrics is not None:
+            metrics.observe('parse', time.monotonic() - started)
+            metrics.sentences_parsed += parsed
+            metrics.parse_errors += errors
+            metrics.maybe_report()
+
+    @property
+    def latest_fix(self):
+
+        """
+
+            A read only snapshot of gnss_messages, taken after the most recent
+            parse. Reading it never touches the bus and needs no lock.
+
+            :return: The latest fix.
+            :rtype: Mapping
+
+        """
+        return self._latest_fix
+
+    def send_pmtk(self, command, args=(), timeout=1.0):
+
+        """
+
+            Send one PMTK command to the module and wait for its PMTK001
+            acknowledgement.
+
+            :param command: The command number, such as 220.
+            :param args: The command's fields.
+            :param timeout: The most seconds to wait for the acknowledgement.
+                            Use 0 to send without waiting.
+            :return: The acknowledgement flag (PMTK_ACK_SUCCESS on success), or
+                     None if none arrived in time.
+            :rtype: int
+
+        """
+        return self.send_pmtk_batch([(command, args)], timeout)[0]
+
+    def send_pmtk_batch(self, commands, timeout=1.0):
+
+        """
+
+            Send several PMTK commands in one run of bus writes, then wait for
+            all of their acknowledgements.
+
+            :param commands: A list of (command, args) pairs.
+            :param timeout: The most seconds to wait for all the
+                            acknowledgements. Use 0 to send without waiting.
+            :return: The acknowledgement flag, or None, for each command.
+            :rtype: list
+
+        """
+        numbers = ['%03d' % int(command) for command, _ in commands]
+
+        with self._ack_condition:
+            for number in numbers:
+                self._pmtk_acks.pop(number, None)
+
+        self.write_raw_bytes(b''.join(pmtk_sentence(command, args)
+                                      for command, args in commands))
+
+        if timeout:
+            self.wait_for_pmtk_ack(numbers, timeout)
+
+        with self._ack_condition:
+            return [self._pmtk_acks.get(number) for number in numbers]
+
+    def write_raw_bytes(self, data):
+
+        """
+
+            Write bytes to the module, MAX_I2C_BUFFER bytes per transaction.
+
+            :param data: The bytes to write.
+
+        """
+        for start in range(0, len(data), self.MAX_I2C_BUFFER):
+            chunk = data[start:start + self.MAX_I2C_BUFFER]
+            self._i2c.writeBlock(self.address, chunk[0], list(chunk[1:]))
+
+    def wait_for_pmtk_ack(self, commands, timeout=1.0):
+
+        """
+
+            Wait for PMTK001 acknowledgements. If the background reader is
+            running, it reads them, otherwise the bus is read here until they
+            arrive. Sentences read while waiting still update gnss_messages.
+
+            :param commands: The command numbers to wait for, as '%03d' strings.
+            :param timeout: The most seconds to wait.
+            :return: True if every acknowledgement arrived.
+            :rtype: bool
+
+        """
+        deadline = time.monotonic() + timeout
+
+        def pending():
+            return [number for number in commands
+                    if number not in self._pmtk_acks]
+
+        while True:
+            with self._ack_condition:
+                if not pending():
+                    return True
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+
+                if self.running:
+                    self._ack_condition.wait(remaining)
+                    continue
+
+            sentences = self.prepare_data()
+            self.parse_sentences(sentences)
+            if not sentences:
+                time.sleep(min(0.01, max(remaining, 0)))
+
+    def _handle_pmtk_ack(self, sentence):
+
+        # $PMTK001,<command>,<flag>*hh
+        fields = sentence[:-3].split(',')
+        if len(fields) < 3:
+            return
+
+        with self._ack_condition:
+            try:
+                self._pmtk_acks['%03d' % int(fields[1])] = int(fields[2])
+            except ValueError:
+                return
+            self._ack_condition.notify_all()
+
+    def set_update_rate(self, hz, timeout=1.0):
+
+        """
+
+            Set how often the module computes and reports a fix (PMTK220).
+
+            :param hz: Fixes per second, from 1 to 10.
+            :param timeout: The most seconds to wait for the acknowledgement.
+            :return: The acknowledgement flag, or None.
+            :rtype: int
+
+        """
+        interval = int(round(1000.0 / hz))
+        ack = self.send_pmtk(220, (interval,), timeout)
+        if ack == PMTK_ACK_SUCCESS or not timeout:
+            self.update_interval = interval / 1000.0
+
+        return ack
+
+    def set_nmea_output(self, timeout=1.0, **rates):
+
+        """
+
+            Choose which NMEA sentences the module sends (PMTK314). Each
+            keyword is a sentence type (gll, rmc, vtg, gga, gsa, gsv) and its
+            value sends that sentence once every N fixes, 0 turns it off.
+            Sentence types not given are turned off.
+
+            :param timeout: The most seconds to wait for the acknowledgement.
+            :return: The acknowledgement flag, or None.
+            :rtype: int
+
+        """
+        unknown = set(rates) - set(_PMTK314_SENTENCES)
+        if unknown:
+            raise ValueError("Unknown NMEA sentence type(s): %s" % ", ".join(sorted(unknown)))
+
+        fields = [rates.get(name, 0) for name in _PMTK314_SENTENCES]
+        fields += [0] * (_PMTK314_FIELDS - len(fields))
+
+        return self.send_pmtk(314, fields, timeout)
+
+    def set_navigation_mode(self, mode, timeout=1.0):
+
+        """
+
+            Set the navigation mode (PMTK886): 0 normal, 1 fitness,
+            2 aviation, 3 balloon.
+
+            :param mode: The navigation mode.
+            :param timeout: The most seconds to wait for the acknowledgement.
+            :return: The acknowledgement flag, or None.
+            :rtype: int
+
+        """
+        return self.send_pmtk(886, (mode,), timeout)
+
+    def apply_pmtk_preset(self, name, timeout=1.0):
+
+        """
+
+            Send one of the command sets in PMTK_PRESETS as a single batch.
+
+            :param name: The preset name, such as 'gga_rmc_10hz'.
+            :param timeout: The most seconds to wait for the acknowledgements.
+            :return: True if every command was acknowledged as successful.
+            :rtype: bool
+
+        """
+        commands = PMTK_PRESETS[name]
+        acks = self.send_pmtk_batch(commands, timeout)
+
+        for (command, args), ack in zip(commands, acks):
+            if int(command) == 220 and (ack == PMTK_ACK_SUCCESS or not timeout):
+                self.update_interval = args[0] / 1000.0
+
+        return all(ack == PMTK_ACK_SUCCESS for ack in acks)
+
+    @property
+    def fix(self):
+
+        """
+
+            The latest fix as a Fix record.
+
+            :return: The latest fix.
+            :rtype: Fix
+
+        """
+        snapshot, fix = self._fix_cache
+        if snapshot is not self._latest_fix:
+            snapshot = self._latest_fix
+            fix = Fix.from_messages(snapshot)
+            self._fix_cache = (snapshot, fix)
+
+        return fix
+
+    def enable_metrics(self, callback=None, interval=10.0):
+
+        """
+
+            Start collecting read, frame and parse timings and counters.
+
+            :param callback: Called with a snapshot dict at most once every
+                        interval seconds.
+            :param interval: Seconds between callbacks.
+            :return: The metrics object, also available as self.metrics.
+            :rtype: GpsMetrics
+
+        """
+        self.metrics = GpsMetrics(self._framer, callback, interval)
+        return self.metrics
+
+    def disable_metrics(self):
+
+        """
+
+            Stop collecting metrics.
+
+        """
+        self.metrics = None
+
+    def enable_history(self, capacity=36000):
+
+        """
+
+            Keep a FixHistory of every GGA fix parsed from now on, once
+            an RMC sentence has given the date.
+
+            :param capacity: The number of fixes kept.
+            :return: The history object, also available as self.history.
+            :rtype: FixHistory
+
+        """
+        self.history = FixHistory(capacity)
+        return self.history
+
+    def enable_fix_log(self, path, **kwargs):
+
+        """
+
+            Append every GGA fix parsed from now on to a binary fix log,
+            replacing any log already open.
+
+            :param path: The log file, created or appended to.
+            :param kwargs: Passed on to FixLogWriter.
+            :return: The writer, also available as self.fix_log.
+            :rtype: FixLogWriter
+
+        """
+        self.disable_fix_log()
+        self.fix_log = FixLogWriter(path, **kwargs)
+        return self.fix_log
+
+    def disable_fix_log(self):
+
+        """
+
+            Write out and close the fix log, if one is open.
+
+        """
+        if self.fix_log is not None:
+            self.fix_log.close()
+            self.fix_log = None
+
+    def start(self):
+
+        """
+
+            Start a daemon thread that owns the bus, polling the module once
+            per fix epoch and keeping latest_fix up to date. While it runs,
+            read the data with latest_fix rather than get_nmea_data(). The
+            thread keeps running through errors, leaving the latest one in
+            reader_error.
+
+            :return: The device object, so start() can be chained.
+            :rtype: Object
+
+        """
+        if self._reader is not None and self._reader.is_alive():
+            return self
+
+        self._stop_event.clear()
+        self._reader = threading.Thread(target=self._reader_loop,
+                                        name="QwiicTitanGps-0x%02X" % self.address)
+        self._reader.daemon = True
+        self._reader.start()
+
+        return self
+
+    def stop(self, timeout=None):
+
+        """
+
+            Stop the background reader thread and wait for it to exit.
+
+            :param timeout: The most seconds to wait for the thread.
+
+        """
+        self._stop_event.set()
+        if self._reader is not None:
+            self._reader.join(timeout)
+            self._reader = None
+
+    @property
+    def running(self):
+
+        """
+
+            :return: True if the background reader thread is running.
+            :rtype: bool
+
+        """
+        return self._reader is not None and self._reader.is_alive()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _reader_loop(self):
+
+        while not self._stop_event.is_set():
+            try:
+                self.parse_sentences(self.poll(wait=False))
+            except Exception as error:
+                self.reader_error = error
+                self._next_epoch = time.monotonic() + self.update_interval
+
+            delay = self._next_epoch - time.monotonic()
+            if delay > 0:
+                self._stop_event.wait(delay)
+
+    def add_to_gnss_messages(self, sentence, received_ns=None):
+
+        """
+
+            This function takes parsed GNSS data and assigns them to the
+            respective dictionary key. The sentence type picks which keys
+            are updated, and they are all updated together.
+            :param sentence: The parsed sentence.
+            :param received_ns: The time.monotonic_ns() at which the sentence
+                        was read, stored as Received_NS.
+            :return: Returns True
+            :rtype: Boolean
+
+        """
+        self._merge_message(sentence, received_ns)
+
+        return True
+
+    def _merge_message(self, sentence, received_ns=None):
+
+        # Merge one parsed sentence into gnss_messages. Returns True if it
+        # was a GGA whose fix was merged, which is when a new fix exists.
+        sentence_type = getattr(sentence, 'sentence_type', None)
+        if sentence_type == 'GSV':
+            if self.satellites.update(sentence, received_ns):
+                self.gnss_messages['Satellites'] = self.satellites.snapshot
+            return False
+
+        fields = _sentence_fields(sentence, self.gnss_messages, received_ns)
+        if fields is None:
+            return False
+
+        accepted = True
+        if self.fix_filter is not None:
+            accepted = self._filter_fields(sentence_type, fields)
+
+        self.gnss_messages.update(fields)
+
+        return accepted and sentence_type == 'GGA'
+
+    def _filter_fields(self, sentence_type, fields):
+
+        # With a filter set, the position only comes from GGA sentences that
+        # pass it. Other sentences keep their remaining keys. Returns False
+        # if the filter rejected a GGA.
+        if sentence_type != 'GGA':
+            for key in _POSITION_KEYS:
+                fields.pop(key, None)
+            return True
+
+        candidate = dict(self.gnss_messages)
+        candidate.update(fields)
+        fix = self.fix_filter.update(Fix.from_messages(candidate))
+        if fix is None:
+            # The epoch still moves on, so mark it as having no fix rather
+            # than leave the last position looking current.
+            for key in _POSITION_KEYS:
+                fields.pop(key, None)
+            fields['Fix_Quality'] = 0
+            return False
+
+        fields['Latitude'] = fix.latitude
+        fields['Longitude'] = fix.longitude
+        return True
+
+    def subscribe(self, target, fields=None, key=None, sentence_types=None,
+                  thresholds=None, debounce=0.0):
+
+        """
+
+            Call a function, or fill a queue, when the fix changes, instead
+            of polling gnss_messages. Checks happen after each parse, on the
+            thread doing the parsing.
+
+            Some examples:
+                - new epoch: fields=('Time',)
+                - fix gained or lost: key=lambda fix: bool(fix['Fix_Quality'])
+                - satellite count: fields=('Sat_Number',)
+                - moved: fields=('Latitude', 'Longitude'),
+                  thresholds={'Latitude': 1e-5, 'Longitude': 1e-5}
+
+            :param target: Called as target(fix, changes), where fix is the
+                        latest_fix snapshot and changes maps each changed
+                        name to (old, new). If target has put_nowait(), such
+                        as a queue.Queue, the (fix, changes) pair is put on it,
+                        and dropped if the queue is full. An asyncio.Queue is
+                        filled on the event loop current when subscribing,
+                        so subscribe from that loop. Exceptions from target
+                        are counted on the subscription, not raised.
+            :param fields: gnss_messages keys to watch. None watches them all.
+            :param key: Function of the snapshot to watch instead of fields;
+                        its result is reported under the name 'key'.
+            :param sentence_types: Only check after parses that included one
+                        of these sentence types, such as ('GGA',).
+            :param thresholds: Smallest change worth reporting, per numeric
+                        field.
+            :param debounce: Fewest seconds between two calls.
+            :return: The subscription, for unsubscribe().
+            :rtype: Subscription
+
+        """
+        subscription = Subscription(target, fields, key, sentence_types,
+                                    thresholds, debounce)
+        self._subscriptions.append(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription):
+
+        """
+
+            Remove a subscription made with subscribe().
+
+            :param subscription: The subscription to remove.
+
+        """
+        try:
+            self._subscriptions.remove(subscription)
+        except ValueError:
+            pass
+
+    def add_fix_listener(self, listener):
+
+        """
+
+            Call a function with every GGA fix as it merges, on the thread
+            doing the parsing. Unlike subscribe(), which sees the snapshot
+            at the end of each parse, this sees every epoch of a parse, and
+            never a GGA the fix filter rejected. Exceptions from listener
+            are kept in listener_error, not raised.
+
+            :param listener: Called as listener(fix) with a Fix.
+
+        """
+        self._fix_listeners.append(listener)
+
+    def remove_fix_listener(self, listener):
+
+        """
+
+            Remove a function added with add_fix_listener().
+
+            :param listener: The function to remove.
+
+        """
+        try:
+            self._fix_listeners.remove(listener)
+        except ValueError:
+            pass
+
+    def set_fix_filter(self, fix_filter):
+
+        """
+
+            Gate (and optionally smooth) every GGA fix before it reaches
+            gnss_messages. While a filter is set, RMC and GLL sentences no
+            longer update the position. A rejected GGA keeps the last
+            position but sets Fix_Quality to 0, and is left out of the
+            history, the fix log and the clock offset.
+
+            :param fix_filter: A FixFilter, or None to remove the filter.
+
+        """
+        self.fix_filter = fix_filter
+
+class AsyncQwiicTitanGps(object):
+    """
+
+    AsyncQwiicTitanGps
+
+        asyncio front end for QwiicTitanGps. Bus transfers and parsing run on a
+        single worker thread, so they never block the event loop and never
+        overlap one another.
+
+        :param address: The I2C address to use for the device.
+                        If not provided, the default address is used.
+        :param i2c_driver: An existing i2c driver object. If not provided
+                        a driver object is created.
+        :param gps: An existing QwiicTitanGps object to wrap. If provided,
+                        address and i2c_driver are ignored.
+        :return: The async Qwiic Titan GPS device object.
+        :rtype: Object
+
+    """
+
+    def __init__(self, address=None, i2c_driver=None, gps=None):
+
+        self.gps = gps if gps is not None else QwiicTitanGps(address, i2c_driver)
+        self._executor = futures.ThreadPoolExecutor(max_workers=1)
+        self.dropped_fixes = 0
+
+    def _run(self, func, *args):
+
+        loop = asyncio.get_event_loop()
+        return loop.run_in_executor(self._executor, func, *args)
+
+    async def get_raw_data(self):
+
+        """
+
+            Awaitable version of QwiicTitanGps.get_raw_data().
+
+            :return: A string of all the GPS data.
+            :rtype: String
+
+        """
+        return await self._run(self.gps.get_raw_data)
+
+    async def get_nmea_data(self):
+
+        """
+
+            Awaitable version of QwiicTitanGps.get_nmea_data().
+
+            :return: Returns True on success and False otherwise
+            :rtype: Boolean
+
+        """
+        return await self._run(self.gps.get_nmea_data)
+
+    def _poll_fix(self):
+
+        # Runs on the worker thread: read one burst, parse it and hand back
+        # the new snapshot if the burst held a fix.
+        sentences = self.gps.poll(wait=False)
+        self.gps.parse_sentences(sentences)
+        for sentence in sentences:
+            if sentence[3:6] == 'GGA':
+                return self.gps.latest_fix
+        return None
+
+    async def fixes(self, maxsize=8, drop_oldest=True):
+
+        """
+
+            Asynchronous iterator of fixes, one per epoch that contained a GGA
+            sentence. Use it as ``async for fix in gps.fixes():``.
+
+            :param maxsize: The most fixes queued for a slow consumer.
+            :param drop_oldest: If True, a full queue drops its oldest fix to
+                        make room. If False, reading the bus pauses until the
+                        consumer catches up.
+            :return: An async iterator of latest_fix snapshots.
+            :rtype: AsyncIterator
+
+        """
+        queue = asyncio.Queue(maxsize)
+        producer = asyncio.ensure_future(self._produce(queue, drop_oldest))
+
+        try:
+            while True:
+                fix = await queue.get()
+                if isinstance(fix, BaseException):
+                    raise fix
+                yield fix
+        finally:
+            producer.cancel()
+
+    async def _produce(self, queue, drop_oldest):
+
+        try:
+            while True:
+                fix = await self._run(self._poll_fix)
+                if fix is not None:
+                    if drop_oldest and queue.full():
+                        queue.get_nowait()
+                        self.dropped_fixes += 1
+                    await queue.put(fix)
+
+                delay = self.gps._next_epoch - time.monotonic()
+                await asyncio.sleep(max(delay, 0))
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:      # pylint: disable=broad-except
+            # Hand the failure to the consumer rather than losing it here.
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(error)
+
+    async def wait_for_fix(self, min_sats=1, timeout=None):
+
+        """
+
+            Wait until a fix with at least min_sats satellites is read.
+
+            :param min_sats: The fewest satellites the fix must use.
+            :param timeout: The most seconds to wait, or None to wait forever.
+            :return: The first fix that qualifies.
+            :rtype: Mapping
+
+        """
+        async def _wait():
+            async for fix in self.fixes(maxsize=1):
+                try:
+                    if int(fix['Sat_Number']) >= min_sats:
+                        return fix
+                except (TypeError, ValueError):
+                    pass
+
+        return await asyncio.wait_for(_wait(), timeout)
+
+    def close(self):
+
+        """
+
+            Shut down the worker thread.
+
+        """
+        self._executor.shutdown(wait=True)
+
+#----------------------------------------------------------------------
+# Broadcast server
+#----------------------------------------------------------------------
+
+def _json_default(value):
+
+    # json.dumps() fallback for the types found in latest_fix snapshots.
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, array):
+        return value.tolist()
+    if isinstance(value, SatelliteGroup):
+        return value._asdict()
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    raise TypeError(repr(value))
+
+def fix_to_json(fix):
+
+    """
+
+        Encode a latest_fix snapshot as one line of JSON.
+
+        :param fix: The snapshot.
+        :return: The JSON object, ending in a newline.
+        :rtype: bytes
+
+    """
+    return (json.dumps(dict(fix, Class='FIX'), default=_json_default,
+                       separators=(',', ':')) + '\n').encode()
+
+class _Client(object):
+
+    # One stream client: a bounded queue of payloads and the task that
+    # drains it into the socket.
+    __slots__ = ('writer', 'queue', 'task', 'done', 'peer', 'bytes_sent', 'dropped')
+
+    def __init__(self, writer, queue_size):
+
+        self.writer = writer
+        self.queue = asyncio.Queue(queue_size)
+        self.task = None
+        self.done = asyncio.get_event_loop().create_future()
+        self.peer = writer.get_extra_info('peername')
+        self.bytes_sent = 0
+        self.dropped = 0
+
+class NmeaServer(object):
+    """
+
+    NmeaServer
+
+        Runs the read loop of one QwiicTitanGps and fans its output out to
+        any number of local clients, so processes that can't share the bus
+        can all have the data. Each poll's checksummed NMEA sentences and/or
+        one JSON line per GGA fix are sent to TCP and Unix socket clients,
+        and as datagrams to a UDP (multicast) group. Each stream client has
+        its own bounded queue; a client that falls behind loses its oldest
+        data rather than holding up the others.
+
+        :param gps: The QwiicTitanGps or AsyncQwiicTitanGps to serve.
+        :param tcp: (host, port) to listen on, or None.
+        :param unix: Path of a Unix socket to listen on, or None.
+        :param udp: (group, port) to send datagrams to, or None.
+        :param formats: What to send: 'nmea', 'json' or both.
+        :param queue_size: The most payloads queued per client.
+        :param multicast_ttl: The multicast TTL for udp.
+        :return: The NmeaServer object.
+        :rtype: Object
+
+    """
+
+    # Seconds close() waits for clients to disconnect before aborting them.
+    CLOSE_TIMEOUT = 1.0
+
+    def __init__(self, gps, tcp=('127.0.0.1', 10110), unix=None, udp=None,
+                 formats=('nmea',), queue_size=64, multicast_ttl=1):
+
+        self.gps = gps if isinstance(gps, AsyncQwiicTitanGps) else AsyncQwiicTitanGps(gps=gps)
+        self.tcp = tcp
+        self.unix = unix
+        self.udp = udp
+        self.formats = frozenset(formats)
+        self.queue_size = queue_size
+        self.multicast_ttl = multicast_ttl
+
+        self._clients = set()
+        self._servers = []
+        self._datagram = None
+        self._producer = None
+        self.payloads = 0
+        self.dropped = 0
+
+    async def start(self):
+
+        """
+
+            Open the listening sockets and start reading the module.
+
+        """
+        if self.tcp is not None:
+            self._servers.append(await asyncio.start_server(self._serve_client, *self.tcp))
+        if self.unix is not None:
+            self._servers.append(await asyncio.start_unix_server(self._serve_client, self.unix))
+        if self.udp is not None:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, self.multicast_ttl)
+            sock.setblocking(False)
+            sock.connect(tuple(self.udp))
+            self._datagram, _ = await asyncio.get_event_loop().create_datagram_endpoint(
+                asyncio.DatagramProtocol, sock=sock)
+
+        self._producer = asyncio.ensure_future(self._produce())
+
+    @property
+    def addresses(self):
+
+        """
+
+            The addresses being listened on, useful with port 0.
+
+            :return: The socket names.
+            :rtype: list
+
+        """
+        return [sock.getsockname() for server in self._servers for sock in server.sockets]
+
+    async def serve_forever(self):
+
+        """
+
+            Start, then serve until cancelled or the module can't be read.
+
+        """
+        if self._producer is None:
+            await self.start()
+        try:
+            await self._producer
+        finally:
+            await self.close()
+
+    async def close(self):
+
+        """
+
+            Stop reading, disconnect every client and close the sockets.
+
+        """
+        if self._producer is not None:
+            self._producer.cancel()
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers = []
+        clients = list(self._clients)
+        for client in clients:
+            client.task.cancel()
+            # Closing waits for the buffer to flush, which never happens
+            # for a client that stopped reading, so drop what it has left.
+            transport = client.writer.transport
+            if transport.get_write_buffer_size():
+                transport.abort()
+            else:
+                client.writer.close()
+        # Let each connection handler see its socket close and finish,
+        # aborting any that still haven't.
+        if clients:
+            await asyncio.wait([client.done for client in clients],
+                               timeout=self.CLOSE_TIMEOUT)
+            for client in clients:
+                if not client.done.done():
+                    client.writer.transport.abort()
+            await asyncio.gather(*[client.done for client in clients])
+        self._clients.clear()
+        if self._datagram is not None:
+            self._datagram.close()
+            self._datagram = None
+        if self.unix is not None and os.path.exists(self.unix):
+            os.unlink(self.unix)
+
+    def _poll(self):
+
+        # Runs on the gps worker thread.
+        gps = self.gps.gps
+        sentences = gps.poll(wait=False)
+        gps.parse_sentences(sentences)
+        fix = None
+        if any(sentence[3:6] == 'GGA' for sentence in sentences):
+            fix = gps.latest_fix
+        return sentences, fix
+
+    async def _produce(self):
+
+        gps = self.gps
+        while True:
+            sentences, fix = await gps._run(self._poll)
+            self.publish(sentences, fix)
+            await asyncio.sleep(max(gps.gps._next_epoch - time.monotonic(), 0))
+
+    def publish(self, sentences=(), fix=None):
+
+        """
+
+            Send sentences and a fix to every client, as if they had just
+            been read. The read loop calls this; it can also be used to
+            serve data from elsewhere.
+
+            :param sentences: Complete NMEA sentences.
+            :param fix: A latest_fix snapshot, or None.
+
+        """
+        payload = b''
+        if sentences and 'nmea' in self.formats:
+            payload = ''.join(sentence.strip() + '\r\n' for sentence in sentences).encode('latin-1')
+        if fix is not None and 'json' in self.formats:
+            payload += fix_to_json(fix)
+        if not payload:
+            return
+
+        self.payloads += 1
+        for client in self._clients:
+            queue = client.queue
+            if queue.full():
+                queue.get_nowait()
+                client.dropped += 1
+                self.dropped += 1
+            queue.put_nowait(payload)
+
+        if self._datagram is not None:
+            self._datagram.sendto(payload)
+
+    async def _serve_client(self, reader, writer):
+
+        client = _Client(writer, self.queue_size)
+        client.task = asyncio.ensure_future(self._send(client))
+        self._clients.add(client)
+        try:
+            # Clients have nothing to say; reading only notices them leaving.
+            while await reader.read(1024):
+                pass
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self._clients.discard(client)
+            client.task.cancel()
+            writer.close()
+            if not client.done.done():
+                client.done.set_result(None)
+
+    async def _send(self, client):
+
+        queue = client.queue
+        writer = client.writer
+        try:
+            while True:
+                payload = await queue.get()
+                writer.write(payload)
+                client.bytes_sent += len(payload)
+                await writer.drain()
+        except (ConnectionError, OSError):
+            self._clients.discard(client)
+            writer.close()
+
+    def stats(self):
+
+        """
+
+            Per client counters.
+
+            :return: One dict per client with peer, bytes_sent, dropped and
+                     queued.
+            :rtype: list
+
+        """
+        return [{'peer' : client.peer, 'bytes_sent' : client.bytes_sent,
+                 'dropped' : client.dropped, 'queued' : client.queue.qsize()}
+                for client in self._clients]
+
+class QwiicBusScheduler(object):
+    """
+
+    QwiicBusScheduler
+
+        Shares one I2C bus between several QwiicTitanGps devices. Devices
+        that are due are served one MAX_I2C_BUFFER block at a time in turn,
+        earliest deadline first, so a long burst from one receiver can't
+        hold up the others. Use one scheduler per bus; schedulers on
+        different buses run in parallel on their own threads.
+
+        :param devices: QwiicTitanGps objects to add, all on the same bus.
+        :return: The QwiicBusScheduler object.
+        :rtype: Object
+
+    """
+
+    def __init__(self, devices=()):
+
+        self._devices = []
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._started = None
+        self.busy_time = 0.0
+
+        for gps in devices:
+            self.add_device(gps)
+
+    @classmethod
+    def for_devices(cls, devices):
+
+        """
+
+            Group devices by the I2C driver they use and make one scheduler
+            per bus.
+
+            :param devices: QwiicTitanGps objects.
+            :return: One scheduler per bus.
+            :rtype: list
+
+        """
+        buses = {}
+        for gps in devices:
+            buses.setdefault(id(gps._i2c), []).append(gps)
+
+        return [cls(group) for group in buses.values()]
+
+    def add_device(self, gps, rate=None):
+
+        """
+
+            Add a device to the schedule.
+
+            :param gps: The QwiicTitanGps object.
+            :param rate: Bursts to read per second. Defaults to the device's
+                         update rate.
+
+        """
+        device = _ScheduledDevice(gps, 1.0 / rate if rate else None)
+        with self._lock:
+            self._devices.append(device)
+
+    def remove_device(self, gps):
+
+        """
+
+            Take a device off the schedule.
+
+            :param gps: The QwiicTitanGps object.
+
+        """
+        with self._lock:
+            self._devices = [device for device in self._devices
+                             if device.gps is not gps]
+
+    def run_once(self):
+
+        """
+
+            Read one block from each device that is due.
+
+            :return: The number of blocks read.
+            :rtype: int
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            due = sorted((device for device in self._devices
+                          if device.started is not None or device.next_due <= now),
+                         key=lambda device: device.next_due)
+
+        for device in due:
+            self.busy_time += device.step()
+
+        return len(due)
+
+    def next_due(self):
+
+        """
+
+            :return: The monotonic time at which the next device is due.
+            :rtype: float
+
+        """
+        with self._lock:
+            if not self._devices:
+                return time.monotonic() + 0.1
+            return min(device.next_due for device in self._devices)
+
+    def start(self):
+
+        """
+
+            Run the schedule on a daemon thread.
+
+            :return: The scheduler, so start() can be chained.
+            :rtype: Object
+
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return self
+
+        self._stop_event.clear()
+        self._started = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="QwiicBusScheduler")
+        self._thread.daemon = True
+        self._thread.start()
+
+        return self
+
+    def stop(self, timeout=None):
+
+        """
+
+            Stop the scheduler thread and wait for it to exit.
+
+            :param timeout: The most seconds to wait for the thread.
+
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _run(self):
+
+        while not self._stop_event.is_set():
+            if self.run_once():
+                continue
+
+            delay = self.next_due() - time.monotonic()
+            if delay > 0:
+                self._stop_event.wait(delay)
+
+    def stats(self):
+
+        """
+
+            Bus and per device utilization.
+
+            :return: 'bus_utilization' is the share of wall time spent on
+                     the bus since start(). 'devices' maps each device's
+                     address to its bytes, transactions, bursts, fixes,
+                     busy time and share of the bus time.
+            :rtype: dict
+
+        """
+        elapsed = time.monotonic() - self._started if self._started else 0
+        with self._lock:
+            devices = list(self._devices)
+
+        return {
+            'busy_time'       : self.busy_time,
+            'bus_utilization' : self.busy_time / elapsed if elapsed else 0.0,
+            'devices'         : dict((device.gps.address, device.stats(self.busy_time))
+                                     for device in devices),
+        }
+
+class _ScheduledDevice(object):
+
+    # Per device state for QwiicBusScheduler.
+
+    def __init__(self, gps, interval):
+
+        self.gps = gps
+        self.interval = interval
+        self.next_due = time.monotonic()
+        self.started = None
+        self.burst = 0
+        self.sentences = []
+        self.transactions = 0
+        self.bursts = 0
+        self.busy_time = 0.0
+
+    def step(self):
+
+        # Read one block; returns the seconds spent on the bus.
+        gps = self.gps
+        started = time.monotonic()
+        if self.started is None:
+            self.started = started
+
+        count, sentences = gps.read_block()
+        elapsed = time.monotonic() - started
+        self.busy_time += elapsed
+        self.transactions += 1
+        self.burst += count
+        self.sentences.extend(sentences)
+
+        drained = count < gps.MAX_I2C_BUFFER
+        if not gps._burst_complete(self.burst, drained):
+            return elapsed
+
+        gps._end_burst(self.started, self.burst, drained, self.sentences)
+        gps.parse_sentences(self.sentences)
+
+        interval = self.interval if self.interval is not None else gps.update_interval
+        self.next_due = self.started + (interval if self.burst else interval / 10)
+        self.bursts += 1 if self.burst else 0
+        self.started = None
+        self.burst = 0
+        self.sentences = []
+
+        return elapsed
+
+    def stats(self, bus_time):
+
+        return {
+            'bytes'        : self.gps.bus_bytes_read,
+            'transactions' : self.transactions,
+            'bursts'       : self.bursts,
+            'fixes'        : self.gps.fixes_read,
+            'busy_time'    : self.busy_time,
+            'bus_share'    : self.busy_time / bus_time if bus_time else 0.0,
+        }
+
+#----------------------------------------------------------------------
+# Receiver fusion
+#----------------------------------------------------------------------
+
+class FusedFix(namedtuple('FusedFix', ['datetime', 'latitude', 'longitude',
+                                       'altitude', 'hdop', 'sat_number',
+                                       'sources'])):
+    """
+
+    FusedFix
+
+        One epoch's fix combined from several receivers by FixFusion.
+        Positions are weighted means, hdop is the combined value
+        1 / sqrt(sum(1 / hdop ** 2)), sat_number the most any receiver used,
+        and sources the names of the receivers that contributed. Until a
+        receiver has seen an RMC date, its epochs are dated 1970-01-01.
+
+    """
+
+    __slots__ = ()
+
+class SourceHealth(object):
+    """
+
+    SourceHealth
+
+        Counters for one receiver feeding a FixFusion. fixes counts every
+        fix received, rejected those that failed the quality limits and late
+        those that arrived after their epoch was published.
+
+    """
+
+    __slots__ = ('fixes', 'rejected', 'late', 'last_seen', 'last_key',
+                 'hdop', 'sat_number', 'weight', 'accepted')
+
+    def __init__(self):
+
+        self.fixes = 0
+        self.rejected = 0
+        self.late = 0
+        self.last_seen = None
+        self.last_key = None
+        self.hdop = None
+        self.sat_number = None
+        self.weight = None
+        self.accepted = False
+
+class _FusionEpoch(object):
+
+    # Running weighted sums for one epoch, so each fix is added in constant
+    # time however many receivers there are.
+    __slots__ = ('reports', 'expected', 'weight', 'latitude', 'longitude',
+                 'ref_longitude', 'altitude', 'altitude_weight', 'inv_hdop2',
+                 'sat_number', 'sources')
+
+    def __init__(self, expected):
+
+        self.reports = 0
+        self.expected = expected
+        self.weight = 0.0
+        self.latitude = 0.0
+        self.longitude = 0.0
+        self.ref_longitude = None
+        self.altitude = 0.0
+        self.altitude_weight = 0.0
+        self.inv_hdop2 = 0.0
+        self.sat_number = 0
+        self.sources = []
+
+class FixFusion(object):
+    """
+
+    FixFusion
+
+        Merges the fixes of several receivers into one best estimate per GPS
+        epoch. Fixes are matched by their GPS time, and each is weighted by
+        sat_number / hdop ** 2, so a receiver with a poor view of the sky
+        counts for less. An epoch is published as soon as every receiver
+        that reported the previous epoch has reported it, or when a later
+        epoch starts, so a dead receiver delays nothing for more than one
+        epoch. Receivers are expected to run in step, as they do when all
+        of them are tracking: a fix from a receiver whose clock is epochs
+        ahead closes the epochs before it early. Each fix costs the same
+        however many receivers there are.
+
+        :param sources: QwiicTitanGps objects to fuse, see add_source().
+        :param callback: Called with each FusedFix as it is published.
+        :param min_quality: The lowest GGA fix quality used.
+        :param min_sats: The fewest satellites a fix must use.
+        :param max_hdop: The highest HDOP used, or None for any.
+        :param stale_after: Seconds without a fix before a receiver is
+                        reported as stale by health().
+        :return: The FixFusion object.
+        :rtype: Object
+
+    """
+
+    def __init__(self, sources=(), callback=None, min_quality=1, min_sats=4,
+                 max_hdop=None, stale_after=2.0):
+
+        self.callback = callback
+        self.min_quality = min_quality
+        self.min_sats = min_sats
+        self.max_hdop = max_hdop
+        self.stale_after = stale_after
+
+        self._lock = threading.Lock()
+        self._sources = {}
+        self._listeners = {}
+        self._pending = {}
+        self._last_key = None
+        self._last_reports = 0
+        self.latest = None
+        self.published = 0
+
+        for gps in sources:
+            self.add_source(gps)
+
+    def add_source(self, gps, name=None):
+
+        """
+
+            Fuse the GGA fixes of a QwiicTitanGps, through its
+            add_fix_listener().
+
+            :param gps: The receiver.
+            :param name: Its name in FusedFix.sources and health(). Defaults
+                        to its position in the order added.
+            :return: The name.
+            :rtype: str
+
+        """
+        if name is None:
+            name = str(len(self._sources))
+
+        with self._lock:
+            self._sources[name] = SourceHealth()
+        listener = lambda fix: self.update(name, fix)
+        gps.add_fix_listener(listener)
+        self._listeners[name] = (gps, listener)
+
+        return name
+
+    def remove_source(self, name):
+
+        """
+
+            Stop fusing a receiver.
+
+            :param name: The name add_source() returned.
+
+        """
+        gps, listener = self._listeners.pop(name, (None, None))
+        if gps is not None:
+            gps.remove_fix_listener(listener)
+        with self._lock:
+            self._sources.pop(name, None)
+
+    def _weight(self, fix):
+
+        # None if the fix fails the limits, otherwise its weight.
+        if fix.latitude is None or fix.longitude is None:
+            return None
+        if (fix.fix_quality or 0) < self.min_quality or (fix.sat_number or 0) < self.min_sats:
+            return None
+        if self.max_hdop is not None and (fix.hdop is None or fix.hdop > self.max_hdop):
+            return None
+
+        hdop = fix.hdop if fix.hdop else 1.0
+        return (fix.sat_number or 1) / (hdop * hdop)
+
+    def update(self, name, fix):
+
+        """
+
+            Add one receiver's fix. add_source() arranges for this to be
+            called; call it directly to feed fixes from elsewhere.
+
+            :param name: The receiver's name.
+            :param fix: A Fix, or a gnss_messages style mapping.
+            :return: The FusedFix this fix completed, or None.
+            :rtype: FusedFix
+
+        """
+        if not isinstance(fix, Fix):
+            fix = Fix.from_messages(fix)
+
+        with self._lock:
+            source = self._sources.get(name)
+            if source is None:
+                source = self._sources[name] = SourceHealth()
+            source.fixes += 1
+            source.last_seen = time.monotonic()
+
+            key = fix.datetime
+            if key is None and fix.time is not None:
+                # No date yet: borrow the day of the last epoch published.
+                day = self._last_key.date() if self._last_key is not None \
+                    else datetime.date(1970, 1, 1)
+                key = datetime.datetime.combine(day, fix.time)
+            if key is None:
+                source.rejected += 1
+                source.accepted = False
+                return None
+            source.last_key = key
+
+            if self._last_key is not None and key <= self._last_key:
+                # Its epoch has already been published.
+                source.late += 1
+                if key == self._last_key:
+                    self._last_reports += 1
+                return None
+
+            # A new epoch means older ones will get no more fixes.
+            published = [self._publish(older) for older in sorted(
+                pending for pending in self._pending if pending < key)]
+
+            epoch = self._pending.get(key)
+            if epoch is None:
+                expected = self._last_reports if self._last_key is not None \
+                    else len(self._sources)
+                epoch = self._pending[key] = _FusionEpoch(max(expected, 1))
+            epoch.reports += 1
+
+            weight = self._weight(fix)
+            source.hdop = fix.hdop
+            source.sat_number = fix.sat_number
+            source.weight = weight
+            source.accepted = weight is not None
+            if weight is None:
+                source.rejected += 1
+            else:
+                # Longitudes are summed as offsets from the first, so an
+                # epoch straddling the antimeridian still averages properly.
+                if epoch.ref_longitude is None:
+                    epoch.ref_longitude = fix.longitude
+                offset = (fix.longitude - epoch.ref_longitude + 180.0) % 360.0 - 180.0
+                epoch.weight += weight
+                epoch.latitude += weight * fix.latitude
+                epoch.longitude += weight * offset
+                if fix.altitude is not None:
+                    epoch.altitude += weight * fix.altitude
+                    epoch.altitude_weight += weight
+                if fix.hdop:
+                    epoch.inv_hdop2 += 1.0 / (fix.hdop * fix.hdop)
+                epoch.sat_number = max(epoch.sat_number, fix.sat_number or 0)
+                epoch.sources.append(name)
+
+            if epoch.reports >= epoch.expected:
+                published.append(self._publish(key))
+
+        fused = None
+        for fused in published:
+            if fused is not None and self.callback is not None:
+                self.callback(fused)
+
+        return fused
+
+    def _publish(self, key):
+
+        epoch = self._pending.pop(key)
+        if self._last_key is None or key > self._last_key:
+            self._last_key = key
+            self._last_reports = epoch.reports
+        if not epoch.weight:
+            return None
+
+        longitude = epoch.ref_longitude + epoch.longitude / epoch.weight
+        fused = FusedFix(key,
+                         epoch.latitude / epoch.weight,
+                         (longitude + 180.0) % 360.0 - 180.0,
+                         epoch.altitude / epoch.altitude_weight if epoch.altitude_weight else None,
+                         epoch.inv_hdop2 ** -0.5 if epoch.inv_hdop2 else None,
+                         epoch.sat_number,
+                         tuple(epoch.sources))
+        self.latest = fused
+        self.published += 1
+
+        return fused
+
+    def health(self):
+
+        """
+
+            The state of every receiver: 'ok', 'no_fix' if its last fix
+            failed the limits, or 'stale' if it hasn't sent a fix for
+            stale_after seconds.
+
+            :return: Name to a dict of state and the SourceHealth counters.
+            :rtype: dict
+
+        """
+        now = time.monotonic()
+        result = {}
+        with self._lock:
+            for name, source in self._sources.items():
+                if source.last_seen is None or now - source.last_seen > self.stale_after:
+                    state = 'stale'
+                elif not source.accepted:
+                    state = 'no_fix'
+                else:
+                    state = 'ok'
+                info = dict((slot, getattr(source, slot)) for slot in SourceHealth.__slots__)
+                info['state'] = state
+                result[name] = info
+
+        return result
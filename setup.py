@@ -88,7 +88,6 @@ setup(
 
         # Specify the Python versions you support here. In particular, ensure
         # that you indicate whether you support Python 2, Python 3 or both.
-        'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
     ],
@@ -100,4 +99,7 @@ setup(
     # simple. Or you can use find_packages().
     py_modules=["qwiic_titan_gps"],
 
+    # AsyncQwiicTitanGps.fixes() is an async generator.
+    python_requires='>=3.6',
+
 )
@@ -0,0 +1,39 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qwiic_titan_gps
+
+def sentence(body):
+
+    # A complete NMEA sentence with its checksum and line ending.
+    return '${}*{:02X}\r\n'.format(body, qwiic_titan_gps._nmea_checksum(body.encode()))
+
+GGA = sentence('GPGGA,123519.00,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,')
+RMC = sentence('GPRMC,123519.00,A,4807.038,N,01131.000,E,0.0,0.0,230394,,')
+
+class FakeDriver(object):
+
+    # Serves each burst in turn, padding with newlines once a burst is used
+    # up. A read that ends in padding finishes the burst, so the next read
+    # starts the next one.
+    def __init__(self, bursts=()):
+        self.bursts = [bytearray(burst.encode() if isinstance(burst, str) else burst)
+                       for burst in bursts]
+        self.written = []
+
+    def readBlock(self, address, commandCode, nBytes):
+        if not self.bursts:
+            return [0x0A] * nBytes
+        block = list(self.bursts[0][:nBytes])
+        del self.bursts[0][:nBytes]
+        if len(block) < nBytes or not self.bursts[0]:
+            del self.bursts[0]
+        return block + [0x0A] * (nBytes - len(block))
+
+    def writeBlock(self, address, commandCode, value):
+        self.written.append(bytes([commandCode] + list(value)))
+
+    def isDeviceConnected(self, devAddress):
+        return True
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+import qwiic_titan_gps
+from conftest import FakeDriver, sentence
+
+def _gga(second, sats=8):
+    return sentence('GPGGA,1235{:02d}.00,4807.038,N,01131.000,E,1,{:02d},0.9,545.4,M,46.9,M,,'
+                    .format(second, sats))
+
+def _gps(ggas):
+    # A padding only block after each burst, so every poll reads one fix.
+    bursts = []
+    for gga in ggas:
+        bursts += [gga, '\n' * 32]
+    driver = FakeDriver(bursts)
+    gps = qwiic_titan_gps.AsyncQwiicTitanGps(i2c_driver=driver)
+    gps.gps.use_rdwr = False
+    gps.gps.update_interval = 0.001
+    return gps, driver
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+async def _collect(gps, count, stall, **kwargs):
+
+    # Take one fix, stall while the producer runs on, then take the rest.
+    fixes = gps.fixes(**kwargs)
+    seconds = []
+    try:
+        async for fix in fixes:
+            seconds.append(fix['Time'].second)
+            if len(seconds) == 1:
+                await asyncio.sleep(stall)
+            if len(seconds) == count:
+                break
+    finally:
+        await fixes.aclose()
+    return seconds
+
+def test_fixes_drop_oldest():
+    gps, driver = _gps([_gga(second) for second in range(10)])
+    try:
+        seconds = _run(_collect(gps, 3, 0.3, maxsize=2, drop_oldest=True))
+    finally:
+        gps.close()
+
+    assert seconds == [0, 8, 9]
+    assert gps.dropped_fixes == 7
+
+def test_fixes_backpressure():
+    gps, driver = _gps([_gga(second) for second in range(10)])
+
+    async def _check():
+        fixes = gps.fixes(maxsize=2, drop_oldest=False)
+        seconds = [(await fixes.__anext__())['Time'].second]
+        await asyncio.sleep(0.3)
+        # The producer waits for the consumer instead of reading on.
+        left = len(driver.bursts)
+        async for fix in fixes:
+            seconds.append(fix['Time'].second)
+            if len(seconds) == 10:
+                break
+        await fixes.aclose()
+        return seconds, left
+
+    try:
+        seconds, left = _run(_check())
+    finally:
+        gps.close()
+
+    assert seconds == list(range(10))
+    assert left >= 10
+    assert gps.dropped_fixes == 0
+
+def test_wait_for_fix_min_sats():
+    gps, driver = _gps([_gga(0, 3), _gga(1, 4), _gga(2, 7), _gga(3, 9)])
+    try:
+        fix = _run(gps.wait_for_fix(min_sats=6, timeout=5.0))
+    finally:
+        gps.close()
+
+    assert fix['Time'].second == 2
+    assert int(fix['Sat_Number']) == 7
+
+def test_wait_for_fix_timeout():
+    gps, driver = _gps([_gga(0, 3)])
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            _run(gps.wait_for_fix(min_sats=6, timeout=0.2))
+    finally:
+        gps.close()
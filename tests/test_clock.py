@@ -0,0 +1,29 @@
+import datetime
+
+import qwiic_titan_gps
+from conftest import GGA, sentence
+
+_EPOCH = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+
+def test_min_offset_follows_drift():
+    # The host clock runs 50 ppm fast, with a fixed 5 ms transport delay.
+    clock = qwiic_titan_gps.ClockOffset(window=60.0)
+    for second in range(3600):
+        received = second * (1 + 50e-6) + 0.005
+        clock.update(int(received * 1e9), _EPOCH + datetime.timedelta(seconds=second))
+
+    assert clock.latency < 0.005
+    expected = _EPOCH + datetime.timedelta(seconds=3600)
+    utc = clock.to_utc(int((3600 * (1 + 50e-6) + 0.005) * 1e9))
+    assert abs((utc - expected).total_seconds()) < 0.005
+
+def test_received_ns_reaches_fixes():
+    rmc = sentence('GPRMC,123519.00,A,4807.038,N,01131.000,E,0.0,0.0,230394,,')
+    for fast in (True, False):
+        framer = qwiic_titan_gps.NmeaFramer()
+        sentences = framer.feed((rmc + GGA).encode(), [(1000, 42)])
+        messages = qwiic_titan_gps.parse_messages(sentences, fast=fast)
+        fixes = list(qwiic_titan_gps.messages_to_fixes(messages))
+
+        assert [fix.received_ns for fix in fixes] == [42]
+        assert fixes[0].datetime is not None
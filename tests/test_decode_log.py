@@ -0,0 +1,81 @@
+import pytest
+
+import qwiic_titan_gps
+from conftest import sentence
+
+def _gga(second):
+    return sentence('GPGGA,1235{:02d}.00,4807.038,N,01131.000,W,1,{:02d},0.9,545.4,M,46.9,M,,'
+                    .format(second, second % 12))
+
+def _rmc(second):
+    return sentence('GPRMC,1235{:02d}.00,A,4807.038,S,01131.000,E,1.5,54.7,230394,,'
+                    .format(second))
+
+def _log(tmp_path, seconds=range(40)):
+    lines = []
+    for second in seconds:
+        lines += [_gga(second), _rmc(second)]
+    # A bad checksum, a malformed time and a line cut short.
+    lines.insert(5, _gga(1)[:-4] + '00\r\n')
+    lines.insert(9, sentence('GPGGA,12xx19.00,4807.038,N,01131.000,E,1,08,0.9,545.4,M,,M,,'))
+    lines.append('$GPGGA,1235')
+    path = tmp_path / 'nmea.log'
+    path.write_bytes(''.join(lines).encode())
+    return str(path)
+
+def _values(decoded):
+    return dict((kind, dict((name, list(values)) for name, values in decoded[kind].items()))
+                for kind in ('GGA', 'RMC'))
+
+def test_decode(tmp_path):
+    decoded = qwiic_titan_gps.decode_nmea_log(_log(tmp_path), processes=1)
+
+    gga = decoded['GGA']
+    assert list(gga['time'])[:3] == [45300.0, 45301.0, 45302.0]
+    assert gga['latitude'][0] == pytest.approx(48.1173)
+    assert gga['longitude'][0] == pytest.approx(-11.516666, abs=1e-6)
+    assert list(gga['sat_number'])[:3] == [0, 1, 2]
+    assert len(gga['time']) == 40
+    assert list(decoded['RMC']['date'])[:1] == [19940323]
+    assert decoded['RMC']['latitude'][0] == pytest.approx(-48.1173)
+    assert decoded['checksum_errors'] == 1
+    assert decoded['malformed'] == 1
+
+def test_small_chunks_split_at_lines(tmp_path):
+    path = _log(tmp_path)
+    whole = qwiic_titan_gps.decode_nmea_log(path, processes=1)
+    chunked = qwiic_titan_gps.decode_nmea_log(path, processes=1, chunk_size=100)
+
+    assert _values(chunked) == _values(whole)
+    assert chunked['checksum_errors'] == 1
+    assert chunked['malformed'] == 1
+
+def test_processes_match(tmp_path):
+    path = _log(tmp_path)
+    single = qwiic_titan_gps.decode_nmea_log(path, processes=1, chunk_size=500)
+    pooled = qwiic_titan_gps.decode_nmea_log(path, processes=2, chunk_size=500)
+
+    assert _values(pooled) == _values(single)
+    assert pooled['checksum_errors'] == single['checksum_errors']
+    assert pooled['malformed'] == single['malformed']
+
+def test_numpy_checksums_match(tmp_path, monkeypatch):
+    numpy = pytest.importorskip('numpy')
+    path = _log(tmp_path)
+    with_numpy = qwiic_titan_gps.decode_nmea_log(path, processes=1, chunk_size=300)
+    assert isinstance(with_numpy['GGA']['time'], numpy.ndarray)
+
+    monkeypatch.setattr(qwiic_titan_gps, '_numpy', lambda: None)
+    without = qwiic_titan_gps.decode_nmea_log(path, processes=1, chunk_size=300)
+
+    assert _values(with_numpy) == _values(without)
+    assert with_numpy['checksum_errors'] == without['checksum_errors'] == 1
+
+def test_empty_file(tmp_path):
+    path = tmp_path / 'empty.log'
+    path.write_bytes(b'')
+    decoded = qwiic_titan_gps.decode_nmea_log(str(path))
+
+    assert len(decoded['GGA']['time']) == 0
+    assert len(decoded['RMC']['date']) == 0
+    assert decoded['checksum_errors'] == decoded['malformed'] == 0
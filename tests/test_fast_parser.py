@@ -0,0 +1,59 @@
+import pytest
+
+import qwiic_titan_gps
+from conftest import sentence
+
+pynmea2 = pytest.importorskip('pynmea2')
+
+BODIES = [
+    'GPGGA,123519.00,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,',
+    'GNGGA,235959.999,3354.123456,S,15112.654321,W,2,12,1.25,-12.3,M,-33.1,M,1.2,0042',
+    'GPGGA,123519,4807,N,01131,E,1,04,,,M,,M,,',
+    'GPGGA,,,,,,0,00,99.99,,,,,,',
+    'GPRMC,123519.00,A,4807.038,N,01131.000,E,022.4,084.4,230394,003.1,W',
+    'GNRMC,000000.00,V,,,,,,,010100,,,N',
+    'GPRMC,225446,A,4916.45,S,12311.12,W,000.5,054.7,191199,020.3,E',
+    'GPGSA,A,3,04,05,,09,12,,,24,,,,,2.5,1.3,2.1',
+    'GNGSA,M,1,,,,,,,,,,,,,,,',
+    'GPVTG,054.7,T,034.4,M,005.5,N,010.2,K,A',
+    'GPVTG,,T,,M,,N,,K,N',
+    'GPGSV,3,1,11,03,03,111,00,04,15,270,00,06,01,010,00,13,06,292,00',
+    'GPGSV,3,3,11,22,42,067,42,24,14,311,43',
+    'GLGSV,1,1,02,65,30,100,,66,,200,20',
+]
+
+def _parsed(body):
+    line = sentence(body).strip()
+    fast = qwiic_titan_gps.parse_nmea_fast(line)
+    assert fast is not None
+    return fast, pynmea2.parse(line)
+
+def _attribute(sentence, name):
+    try:
+        return sentence.__getattr__(name) if isinstance(
+            sentence, qwiic_titan_gps.FastNmeaSentence) else getattr(sentence, name)
+    except (AttributeError, IndexError, TypeError, ValueError) as error:
+        return type(error)
+
+@pytest.mark.parametrize('body', BODIES)
+def test_attributes_match_pynmea2(body):
+    fast, slow = _parsed(body)
+
+    assert (fast.talker, fast.sentence_type) == (slow.talker, slow.sentence_type)
+    for name in type(fast)._fields:
+        value, expected = _attribute(fast, name), _attribute(slow, name)
+        assert (name, value) == (name, expected)
+        assert (name, type(value)) == (name, type(expected))
+
+@pytest.mark.parametrize('body', BODIES)
+def test_merged_fields_match_pynmea2(body):
+    state = dict(qwiic_titan_gps.QwiicTitanGps.gnss_messages)
+    state['Date'] = qwiic_titan_gps._nmea_date('230394')
+    fast, slow = _parsed(body)
+
+    fields = qwiic_titan_gps._sentence_fields(fast, state, 42)
+    expected = qwiic_titan_gps._sentence_fields(slow, state, 42)
+    assert fields == expected
+    if fields is not None:
+        for key in fields:
+            assert (key, type(fields[key])) == (key, type(expected[key]))
@@ -0,0 +1,46 @@
+import qwiic_titan_gps
+from conftest import FakeDriver, GGA, RMC, sentence
+
+def _gps():
+    gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=FakeDriver())
+    gps.set_fix_filter(qwiic_titan_gps.FixFilter())
+    return gps
+
+def test_rejected_gga_marks_no_fix():
+    gps = _gps()
+    history = gps.enable_history()
+    lost = sentence('GPGGA,123520.00,4807.100,N,01131.100,E,0,00,,,M,,M,,')
+    gps.parse_sentences([RMC, GGA, lost])
+
+    fix = gps.fix
+    assert fix.fix_quality == 0
+    assert fix.time.second == 20
+    assert fix.latitude == gps.gnss_messages['Latitude']
+    assert abs(fix.latitude - 48.1173) < 1e-4
+    assert len(history) == 1
+
+def test_accepted_gga_after_rejection():
+    gps = _gps()
+    lost = sentence('GPGGA,123520.00,,,,,0,00,,,M,,M,,')
+    later = sentence('GPGGA,123521.00,4807.039,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,')
+    gps.parse_sentences([GGA, lost, later])
+
+    assert gps.fix.fix_quality == 1
+    assert gps.fix.time.second == 21
+
+def test_iter_fixes_uses_the_same_merge():
+    lost = sentence('GPGGA,123520.00,,,,,0,00,,,M,,M,,')
+    later = sentence('GPGGA,123521.00,4807.039,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,')
+    gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=FakeDriver([RMC + GGA + lost + later]))
+    gps.set_fix_filter(qwiic_titan_gps.FixFilter())
+    history = gps.enable_history()
+    changes = []
+    gps.subscribe(lambda fix, changed: changes.append(changed), fields=('Fix_Quality',))
+
+    fixes = gps.iter_fixes()
+    first, second = next(fixes), next(fixes)
+
+    assert [first.time.second, second.time.second] == [19, 21]
+    assert len(history) == 2
+    assert gps.fix == second
+    assert changes
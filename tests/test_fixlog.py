@@ -0,0 +1,67 @@
+import datetime
+import os
+
+import pytest
+
+import qwiic_titan_gps
+
+_EPOCH = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+
+def _fix(second, dated=True):
+    when = _EPOCH + datetime.timedelta(seconds=second)
+    return qwiic_titan_gps.Fix(when.time(), when.date(), 48.1, 11.5, 545.4, 8, 1,
+                               0.9, 0.0, 0.0, when if dated else None, None)
+
+def _write(path, seconds):
+    with qwiic_titan_gps.FixLogWriter(path, block_records=4) as writer:
+        for second in seconds:
+            writer.append(_fix(second))
+
+def test_missing_index_is_rebuilt(tmp_path):
+    path = str(tmp_path / 'fixes.log')
+    _write(path, range(10))
+    with open(path + '.idx', 'rb') as fIndex:
+        index = fIndex.read()
+    os.remove(path + '.idx')
+
+    _write(path, range(10, 12))
+
+    log = qwiic_titan_gps.FixLog(path)
+    assert len(log) == 12
+    assert log.find(qwiic_titan_gps._utc_timestamp(_EPOCH) + 5) == 5
+    with open(path + '.idx', 'rb') as fIndex:
+        assert fIndex.read().startswith(index)
+
+def test_unreadable_index_is_rebuilt(tmp_path):
+    path = str(tmp_path / 'fixes.log')
+    _write(path, range(6))
+    with open(path + '.idx', 'wb') as fIndex:
+        fIndex.write(b'garbage')
+
+    _write(path, range(6, 8))
+
+    assert len(qwiic_titan_gps.FixLog(path)) == 8
+
+def test_undated_fixes_are_skipped(tmp_path):
+    path = str(tmp_path / 'fixes.log')
+    with qwiic_titan_gps.FixLogWriter(path) as writer:
+        assert writer.append(_fix(0))
+        assert not writer.append(_fix(1, dated=False))
+        assert writer.append(_fix(2, dated=False), t=qwiic_titan_gps._utc_timestamp(_EPOCH) + 2)
+
+    assert len(qwiic_titan_gps.FixLog(path)) == 2
+
+def test_numpy_views_outlive_close(tmp_path):
+    numpy = pytest.importorskip('numpy')
+    path = str(tmp_path / 'fixes.log')
+    _write(path, range(10))
+    start = qwiic_titan_gps._utc_timestamp(_EPOCH)
+
+    with qwiic_titan_gps.FixLog(path) as log:
+        records = log.records(start + 2, start + 7)
+        columns = log.columns(start + 2, start + 7)
+
+    assert isinstance(records, numpy.ndarray)
+    assert list(records['t'] - start) == [2, 3, 4, 5, 6]
+    assert list(columns['sat_number']) == [8] * 5
+    assert len(log) == 0
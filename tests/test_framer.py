@@ -0,0 +1,31 @@
+import qwiic_titan_gps
+from conftest import GGA, sentence
+
+def test_sentence_split_across_feeds():
+    framer = qwiic_titan_gps.NmeaFramer()
+    data = GGA.encode()
+
+    assert list(framer.feed(data[:20])) == []
+    assert list(framer.feed(data[20:])) == [GGA.strip()]
+    assert framer.pending == 0
+
+def test_bad_checksum_is_counted():
+    framer = qwiic_titan_gps.NmeaFramer()
+    bad = GGA.replace('4807', '4808').encode()
+
+    assert list(framer.feed(bad)) == []
+    assert framer.checksum_errors == 1
+
+def test_resync_after_truncated_sentence():
+    # An overrun leaves a cut off sentence glued to the next whole one.
+    framer = qwiic_titan_gps.NmeaFramer()
+
+    assert list(framer.feed(('$GPGSV,3,2,1' + GGA).encode())) == [GGA.strip()]
+    assert framer.fragments_dropped == 1
+
+def test_padding_lines_are_ignored():
+    framer = qwiic_titan_gps.NmeaFramer()
+    rmc = sentence('GPRMC,123519.00,A,4807.038,N,01131.000,E,0.0,0.0,230394,,')
+
+    assert list(framer.feed((GGA + '\n\n\n' + rmc).encode())) == [GGA.strip(), rmc.strip()]
+    assert framer.fragments_dropped == 0
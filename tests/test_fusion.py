@@ -0,0 +1,110 @@
+import struct
+import time
+
+import pytest
+
+import qwiic_titan_gps
+from conftest import FakeDriver, GGA, sentence
+
+LATER = sentence('GPGGA,123520.00,4807.040,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,')
+LOST = sentence('GPGGA,123521.00,,,,,0,00,,,M,,M,,')
+
+def _fusion():
+    gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=FakeDriver())
+    fused = []
+    fusion = qwiic_titan_gps.FixFusion(callback=fused.append)
+    name = fusion.add_source(gps)
+    return gps, fusion, name, fused
+
+def test_every_epoch_of_a_parse_is_fused():
+    gps, fusion, name, fused = _fusion()
+    gps.parse_sentences([GGA, LATER])
+
+    assert [fix.datetime.second for fix in fused] == [19, 20]
+    assert abs(fused[0].latitude - 48.1173) < 1e-4
+
+def test_rejected_epoch_is_not_fused():
+    gps, fusion, name, fused = _fusion()
+    gps.set_fix_filter(qwiic_titan_gps.FixFilter())
+    gps.parse_sentences([GGA, LOST])
+
+    assert [fix.datetime.second for fix in fused] == [19]
+    assert fusion.health()[name]['fixes'] == 1
+
+def test_remove_source_stops_fusing():
+    gps, fusion, name, fused = _fusion()
+    fusion.remove_source(name)
+    gps.parse_sentences([GGA])
+
+    assert fused == []
+
+INTERVAL = 0.1
+
+def _epoch_gga(second, latitude, sats, hdop, quality=1):
+    return sentence('GPGGA,1235{:02d}.00,{},N,01131.000,E,{},{:02d},{},545.4,M,46.9,M,,'
+                    .format(second, latitude, quality, sats, hdop))
+
+def _capture(epochs):
+
+    # A capture file with one epoch read every INTERVAL seconds, each burst
+    # ending in a block of padding as the module sends it.
+    data = bytearray(qwiic_titan_gps._CAPTURE_MAGIC)
+    for index, epoch in enumerate(epochs):
+        for block in (epoch.encode(), b'\n' * 32):
+            data += qwiic_titan_gps._CAPTURE_RECORD.pack(index * INTERVAL,
+                                                         qwiic_titan_gps._CAPTURE_READ,
+                                                         len(block))
+            data += block
+    return bytes(data)
+
+def test_replayed_receivers():
+    # a: good view, b: poor view then silent, c: loses its fix.
+    captures = {
+        'a' : [_epoch_gga(second, '4806.000', 8, '1.0') for second in range(5)],
+        'b' : [_epoch_gga(second, '4806.060', 4, '2.0') for second in range(3)],
+        'c' : [_epoch_gga(second, '4806.030', 6, '1.5', quality=0 if second >= 2 else 1)
+               for second in range(5)],
+    }
+    receivers = {}
+    for name, epochs in captures.items():
+        driver = qwiic_titan_gps.ReplayI2CDriver(_capture(epochs), realtime=True)
+        gps = receivers[name] = qwiic_titan_gps.QwiicTitanGps(i2c_driver=driver)
+        gps.use_rdwr = False
+
+    fused = []
+    fusion = qwiic_titan_gps.FixFusion(callback=fused.append, stale_after=1.5 * INTERVAL)
+    for name, gps in sorted(receivers.items()):
+        fusion.add_source(gps, name)
+
+    # The replay clocks start at the first read, so after the first epoch
+    # poll halfway between epochs.
+    started = time.monotonic()
+    for index in range(5):
+        due = started + index * INTERVAL + (INTERVAL / 2 if index else 0)
+        time.sleep(max(due - time.monotonic(), 0))
+        for name, gps in sorted(receivers.items()):
+            gps.parse_sentences(gps.poll(wait=False))
+
+    states = dict((name, health['state']) for name, health in fusion.health().items())
+    assert states == {'a' : 'ok', 'b' : 'stale', 'c' : 'no_fix'}
+    time.sleep(2 * INTERVAL)
+
+    assert [fix.datetime.second for fix in fused] == [0, 1, 2, 3, 4]
+    assert [fix.sources for fix in fused] == [('a', 'b', 'c'), ('a', 'b', 'c'),
+                                              ('a', 'b'), ('a',), ('a',)]
+
+    # Weighted by sat_number / hdop ** 2: 8, 1 and 6 / 2.25.
+    weights = {'a' : 8.0, 'b' : 1.0, 'c' : 6.0 / 2.25}
+    minutes = {'a' : 6.0, 'b' : 6.06, 'c' : 6.03}
+    expected = 48 + sum(weights[name] * minutes[name] for name in weights) / \
+        sum(weights.values()) / 60
+    assert fused[0].latitude == pytest.approx(expected)
+    assert fused[0].hdop == pytest.approx((1 / 1.0 + 1 / 4.0 + 1 / 2.25) ** -0.5)
+    assert fused[0].sat_number == 8
+    assert fused[2].latitude == pytest.approx(48 + (8 * 6.0 + 6.06) / 9 / 60)
+
+    health = fusion.health()
+    assert health['a']['state'] == 'stale'
+    assert health['b']['state'] == 'stale'
+    assert health['c']['state'] == 'stale'
+    assert health['c']['rejected'] == 3
@@ -0,0 +1,56 @@
+import datetime
+
+import pytest
+
+import qwiic_titan_gps
+from conftest import GGA, RMC
+
+_EPOCH = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+_START = qwiic_titan_gps._utc_timestamp(_EPOCH)
+
+def _fix(second, dated=True):
+    when = _EPOCH + datetime.timedelta(seconds=second)
+    return qwiic_titan_gps.Fix(when.time(), when.date(), 48.0 + second / 1000.0, 11.5,
+                               545.4, second % 12, 1, 0.9, 0.0, 0.0,
+                               when if dated else None, None)
+
+@pytest.fixture(params=['numpy', 'array'])
+def history(request, monkeypatch):
+    if request.param == 'array':
+        monkeypatch.setattr(qwiic_titan_gps, '_numpy', lambda: None)
+    else:
+        pytest.importorskip('numpy')
+    return qwiic_titan_gps.FixHistory(capacity=5)
+
+def test_ring_wraps_around(history):
+    for second in range(8):
+        history.append(_fix(second))
+
+    columns = history.columns()
+    assert len(history) == 5
+    assert [t - _START for t in columns['t']] == [3, 4, 5, 6, 7]
+    assert list(columns['sat_number']) == [3, 4, 5, 6, 7]
+
+def test_window_across_the_wrap(history):
+    for second in range(8):
+        history.append(_fix(second))
+
+    columns = history.columns(_START + 4, _START + 7)
+    assert [t - _START for t in columns['t']] == [4, 5, 6]
+    assert len(history.columns(_START + 10)['t']) == 0
+    assert len(history.columns(None, _START + 3)['t']) == 0
+
+def test_undated_fixes_are_skipped(history):
+    assert history.append(_fix(0))
+    assert not history.append(_fix(1, dated=False))
+    assert history.append(_fix(2, dated=False), t=_START + 2)
+
+    assert [t - _START for t in history.columns()['t']] == [0, 2]
+
+def test_history_uses_gps_time():
+    gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=qwiic_titan_gps.ReplayI2CDriver(b''))
+    history = gps.enable_history()
+    gps.parse_sentences([GGA, RMC, GGA])
+
+    expected = datetime.datetime(1994, 3, 23, 12, 35, 19, tzinfo=datetime.timezone.utc)
+    assert list(history.columns()['t']) == [qwiic_titan_gps._utc_timestamp(expected)]
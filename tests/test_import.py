@@ -0,0 +1,46 @@
+"""Importing the driver must stay cheap and free of side effects."""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules only needed once the GPS is actually used.
+DEFERRED = ('qwiic_i2c', 'pynmea2', 'smbus2', 'numpy', 'asyncio', 'concurrent',
+            'decimal', 'json', 'socket', 'ctypes')
+
+def _run(code, *options):
+    return subprocess.run([sys.executable] + list(options) + ['-c', code],
+                          cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          universal_newlines=True, check=True)
+
+def test_import_defers_heavy_modules():
+    result = _run('import qwiic_titan_gps', '-X', 'importtime')
+
+    imported = set()
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            name = line.rsplit('|', 1)[1].strip()
+            imported.add(name.split('.')[0])
+
+    assert 'qwiic_titan_gps' in imported
+    assert not imported.intersection(DEFERRED), sorted(imported.intersection(DEFERRED))
+
+def test_import_has_no_side_effects():
+    code = '''
+import builtins, io, sys
+opened = []
+real_open = builtins.open
+def recording_open(file, *args, **kwargs):
+    opened.append(file)
+    return real_open(file, *args, **kwargs)
+builtins.open = io.open = recording_open
+import qwiic_titan_gps
+gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=qwiic_titan_gps.ReplayI2CDriver(b''))
+print(repr(opened))
+print(sorted(name for name in ('qwiic_i2c', 'pynmea2') if name in sys.modules))
+'''
+    opened, modules = _run(code).stdout.splitlines()
+    assert opened == '[]'
+    assert modules == '[]'
@@ -0,0 +1,79 @@
+import pytest
+
+import qwiic_titan_gps
+from conftest import FakeDriver, GGA, sentence
+from test_read import _RdwrDriver
+
+BURST = GGA * 3
+
+def _gps(driver, rdwr=False):
+    gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=driver)
+    gps.use_rdwr = rdwr
+    return gps, gps.enable_metrics()
+
+def test_padding_bytes_with_read_block():
+    gps, metrics = _gps(FakeDriver([BURST]))
+    data = bytes(gps.read_raw_bytes())
+
+    assert data.startswith(BURST.encode())
+    assert metrics.padding_bytes == gps.bus_bytes_read - len(BURST)
+    assert metrics.reads == 1
+    assert metrics.bytes_read == len(data)
+
+def test_padding_bytes_with_rdwr():
+    pytest.importorskip('smbus2')
+    gps, metrics = _gps(_RdwrDriver([BURST]), rdwr=True)
+    gps.read_raw_bytes()
+
+    assert gps._rdwr
+    assert metrics.padding_bytes == gps.bus_bytes_read - len(BURST)
+
+def test_padding_only_read():
+    gps, metrics = _gps(FakeDriver())
+    gps.read_raw_bytes(64)
+
+    # The first newline may end a sentence from the last read.
+    assert metrics.padding_bytes == 31
+
+def test_counters_and_stages():
+    bad = GGA[:-4] + '00\r\n'
+    unknown = sentence('GPZZZ,1,2')
+    gps, metrics = _gps(FakeDriver([GGA + bad + unknown + GGA]))
+    gps.parse_sentences(gps.poll(wait=False))
+
+    snapshot = metrics.snapshot()
+    assert snapshot['sentences_parsed'] == 2
+    assert snapshot['parse_errors'] == 1
+    assert snapshot['checksum_failures'] == 1
+    assert snapshot['fragments_dropped'] == 0
+    for stage in ('read', 'frame', 'parse'):
+        assert snapshot[stage]['count'] >= 1
+        assert sum(snapshot[stage]['buckets'].values()) == snapshot[stage]['count']
+        assert 0 <= snapshot[stage]['mean'] <= snapshot[stage]['max']
+
+    metrics.reset()
+    snapshot = metrics.snapshot()
+    assert snapshot['reads'] == snapshot['checksum_failures'] == 0
+    assert snapshot['read']['count'] == 0
+
+def test_callback_interval():
+    reports = []
+    gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=FakeDriver())
+    gps.enable_metrics(reports.append, interval=0)
+    gps.parse_sentences([GGA])
+    gps.parse_sentences([GGA])
+    assert len(reports) == 2
+    assert reports[-1]['sentences_parsed'] == 2
+
+    gps.enable_metrics(reports.append, interval=60)
+    gps.parse_sentences([GGA])
+    assert len(reports) == 2
+
+def test_histogram_buckets():
+    histogram = qwiic_titan_gps._Histogram()
+    for seconds in (0.0000005, 0.000003, 0.000003, 100.0):
+        histogram.add(seconds)
+
+    snapshot = histogram.snapshot()
+    assert snapshot['buckets'] == {'<1us': 1, '<4us': 2, '<8388608us': 1}
+    assert snapshot['max'] == 100.0
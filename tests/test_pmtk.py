@@ -0,0 +1,77 @@
+import re
+import time
+
+import qwiic_titan_gps
+from conftest import FakeDriver, GGA, sentence
+
+_PMTK = re.compile(br'\$PMTK(\d{3})[^*]*\*[0-9A-F]{2}\r\n')
+
+class PmtkDevice(FakeDriver):
+
+    # Answers each complete PMTK command written to it with a PMTK001 in
+    # the read stream. flags maps a command number to the flag to answer
+    # with; None leaves the command unanswered.
+    def __init__(self, flags=None):
+        FakeDriver.__init__(self)
+        self.flags = flags or {}
+        self._pending = b''
+        self.commands = []
+
+    def writeBlock(self, address, commandCode, value):
+        FakeDriver.writeBlock(self, address, commandCode, value)
+        self._pending += self.written[-1]
+        for match in _PMTK.finditer(self._pending):
+            command = match.group(1).decode()
+            self.commands.append(match.group(0))
+            flag = self.flags.get(command, qwiic_titan_gps.PMTK_ACK_SUCCESS)
+            if flag is not None:
+                self.bursts.append(bytearray(
+                    (GGA + sentence('PMTK001,{},{}'.format(command, flag))).encode()))
+            self._pending = self._pending[match.end():]
+
+def test_command_framing():
+    assert qwiic_titan_gps.pmtk_sentence(220, (100,)) == b'$PMTK220,100*2F\r\n'
+
+def test_update_rate_acknowledged():
+    device = PmtkDevice()
+    gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=device)
+
+    assert gps.set_update_rate(10) == qwiic_titan_gps.PMTK_ACK_SUCCESS
+    assert gps.update_interval == 0.1
+    assert device.commands == [b'$PMTK220,100*2F\r\n']
+    # Writes are chunked to the I2C buffer size.
+    assert all(len(chunk) <= gps.MAX_I2C_BUFFER for chunk in device.written)
+    # Sentences read while waiting still update the fix.
+    assert gps.latest_fix['Sat_Number'] == '08'
+
+def test_unsupported_command():
+    gps = qwiic_titan_gps.QwiicTitanGps(
+        i2c_driver=PmtkDevice({'886' : qwiic_titan_gps.PMTK_ACK_UNSUPPORTED}))
+
+    assert gps.set_navigation_mode(1) == qwiic_titan_gps.PMTK_ACK_UNSUPPORTED
+
+def test_timeout():
+    gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=PmtkDevice({'220' : None}))
+    gps.update_interval = 0.01
+
+    started = time.monotonic()
+    assert gps.set_update_rate(5, timeout=0.2) is None
+    assert 0.2 <= time.monotonic() - started < 1.0
+    assert gps.update_interval == 0.01
+
+def test_preset_batch():
+    device = PmtkDevice()
+    gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=device)
+
+    assert gps.apply_pmtk_preset('gga_rmc_10hz')
+    assert len(device.commands) == len(qwiic_titan_gps.PMTK_PRESETS['gga_rmc_10hz'])
+
+def test_ack_through_background_reader():
+    device = PmtkDevice()
+    gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=device)
+    gps.update_interval = 0.01
+
+    with gps:
+        assert gps.set_update_rate(10) == qwiic_titan_gps.PMTK_ACK_SUCCESS
+        assert gps.running
+    assert not gps.running
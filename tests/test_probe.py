@@ -0,0 +1,94 @@
+import threading
+import time
+
+import pytest
+
+import qwiic_titan_gps
+from conftest import FakeDriver
+
+class ProbeDriver(FakeDriver):
+
+    # Answers at the given addresses, noting every probe and its thread.
+    def __init__(self, present=(), fail=False):
+        super(ProbeDriver, self).__init__()
+        self.present = set(present)
+        self.fail = fail
+        self.probes = []
+
+    def isDeviceConnected(self, devAddress):
+        self.probes.append((devAddress, threading.current_thread().name))
+        if self.fail:
+            raise OSError(121, 'Remote I/O error')
+        return devAddress in self.present
+
+class _NoQwiic(object):
+
+    def __getattr__(self, name):
+        raise AssertionError('qwiic_i2c.{} used'.format(name))
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    qwiic_titan_gps._probe_cache.clear()
+
+def test_answers_are_cached():
+    driver = ProbeDriver([0x10])
+
+    assert qwiic_titan_gps.probe_device(driver, 0x10)[0]
+    assert qwiic_titan_gps.probe_device(driver, 0x10)[0]
+    assert not qwiic_titan_gps.probe_device(driver, 0x11)[0]
+    assert len(driver.probes) == 2
+
+    # Another driver on the same address is probed on its own.
+    other = ProbeDriver()
+    assert not qwiic_titan_gps.probe_device(other, 0x10)[0]
+    assert len(other.probes) == 1
+
+def test_cache_expires():
+    driver = ProbeDriver([0x10])
+    qwiic_titan_gps.probe_device(driver, 0x10, ttl=0.05)
+    qwiic_titan_gps.probe_device(driver, 0x10, ttl=0.05)
+    assert len(driver.probes) == 1
+
+    time.sleep(0.06)
+    qwiic_titan_gps.probe_device(driver, 0x10, ttl=0.05)
+    assert len(driver.probes) == 2
+
+    qwiic_titan_gps.probe_device(driver, 0x10, ttl=0)
+    assert len(driver.probes) == 3
+
+def test_bus_errors_mean_not_connected():
+    connected, latency = qwiic_titan_gps.probe_device(ProbeDriver(fail=True), 0x10)
+    assert not connected
+    assert latency >= 0
+
+    assert qwiic_titan_gps.probe_device(None, 0x10) == (False, 0.0)
+
+def test_is_connected_uses_the_instance_driver(monkeypatch):
+    monkeypatch.setattr(qwiic_titan_gps, 'qwiic_i2c', _NoQwiic())
+    driver = ProbeDriver([0x10])
+    gps = qwiic_titan_gps.QwiicTitanGps(address=0x10, i2c_driver=driver)
+
+    assert gps.is_connected()
+    assert gps.connected
+    assert driver.probes == [(0x10, threading.current_thread().name)]
+
+def test_scan_several_buses():
+    buses = [ProbeDriver([0x10]), ProbeDriver([0x11, 0x12]), ProbeDriver(fail=True)]
+
+    results = qwiic_titan_gps.scan_devices(buses, [0x10, 0x11, 0x12])
+
+    answers = [dict((address, connected) for address, (connected, _) in result.items())
+               for result in results]
+    assert answers == [{0x10: True, 0x11: False, 0x12: False},
+                       {0x10: False, 0x11: True, 0x12: True},
+                       {0x10: False, 0x11: False, 0x12: False}]
+
+    # Each bus is scanned on a thread of its own.
+    threads = [set(name for _, name in bus.probes) for bus in buses]
+    assert all(len(names) == 1 for names in threads)
+    assert len(set.union(*threads)) == 3
+    assert threading.current_thread().name not in set.union(*threads)
+
+    # A second scan is answered from the cache.
+    qwiic_titan_gps.scan_devices(buses, [0x10, 0x11, 0x12])
+    assert [len(bus.probes) for bus in buses] == [3, 3, 3]
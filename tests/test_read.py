@@ -0,0 +1,62 @@
+import pytest
+
+import qwiic_titan_gps
+from conftest import FakeDriver, sentence
+
+def _gga(second):
+    return sentence('GPGGA,1235{:02d}.00,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,'.format(second))
+
+def _burst_ending_on_block(second):
+    # Pad the burst so its final '\n' is the first byte of a block.
+    body = _gga(second)
+    filler = sentence('GPTXT,01,01,02,' + 'X' * (32 * 3 + 1 - len(body) - 21))
+    burst = filler + body
+    assert len(burst) % 32 == 1
+    return burst
+
+def test_line_ending_in_padding_block_is_kept():
+    bursts = [_burst_ending_on_block(20), _gga(21)]
+    gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=FakeDriver(bursts))
+    gps.use_rdwr = False
+
+    sentences = gps.poll(wait=False) + gps.poll(wait=False)
+
+    assert [s for s in sentences if s[3:6] == 'GGA'] == [_gga(20).strip(), _gga(21).strip()]
+    assert gps._framer.fragments_dropped == 0
+
+def test_padding_only_read_counts_as_no_data():
+    gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=FakeDriver())
+    gps.use_rdwr = False
+
+    assert gps.read_block() == (0, [])
+    assert gps.poll(wait=False) == []
+    assert gps.fixes_read == 0
+
+class _RdwrDriver(FakeDriver):
+
+    # Exposes an smbus2 style bus, so reads go through one I2C_RDWR call.
+    @property
+    def i2cbus(self):
+        return self
+
+    def i2c_rdwr(self, *messages):
+        # One transfer never runs on into the next burst.
+        import ctypes
+        bursts = len(self.bursts)
+        for message in messages:
+            if len(self.bursts) < bursts:
+                block = b'\n' * message.len
+            else:
+                block = bytes(self.readBlock(message.addr, 0, message.len))
+            ctypes.memmove(message.buf, block, message.len)
+
+def test_line_ending_in_padding_block_is_kept_with_rdwr():
+    pytest.importorskip('smbus2')
+    bursts = [_burst_ending_on_block(20), _gga(21)]
+    gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=_RdwrDriver(bursts))
+
+    sentences = gps.poll(wait=False) + gps.poll(wait=False)
+
+    assert gps._rdwr
+    assert [s for s in sentences if s[3:6] == 'GGA'] == [_gga(20).strip(), _gga(21).strip()]
+    assert gps._framer.fragments_dropped == 0
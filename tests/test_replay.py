@@ -0,0 +1,28 @@
+import qwiic_titan_gps
+from conftest import FakeDriver
+from test_read import _burst_ending_on_block, _gga
+
+def _read_all(gps, polls):
+    sentences = []
+    for _ in range(polls):
+        sentences += gps.poll(wait=False)
+    return sentences
+
+def test_record_and_replay_match(tmp_path):
+    path = str(tmp_path / 'capture.bin')
+    bursts = [_burst_ending_on_block(20), _gga(21)]
+    recorder = qwiic_titan_gps.I2CRecorder(FakeDriver(bursts), path)
+    live = qwiic_titan_gps.QwiicTitanGps(i2c_driver=recorder)
+    live.use_rdwr = False
+    recorded = _read_all(live, 3)
+    recorder.close()
+
+    replay = qwiic_titan_gps.ReplayI2CDriver.from_file(path)
+    gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=replay)
+    gps.use_rdwr = False
+    replayed = _read_all(gps, 3)
+
+    assert [s[3:6] for s in recorded] == ['TXT', 'GGA', 'GGA']
+    assert replayed == recorded
+    assert replay.finished
+    assert gps._framer.fragments_dropped == 0
@@ -0,0 +1,123 @@
+import errno
+
+import pytest
+
+import qwiic_titan_gps
+from conftest import FakeDriver, GGA
+
+class FlakyDriver(FakeDriver):
+
+    # Raises OSError on the reads whose numbers (from 0) are in failures.
+    def __init__(self, bursts=(), failures=(), error=errno.EREMOTEIO):
+        super(FlakyDriver, self).__init__(bursts)
+        self.failures = set(failures)
+        self.error = error
+        self.calls = 0
+
+    def readBlock(self, address, commandCode, nBytes):
+        call = self.calls
+        self.calls += 1
+        if call in self.failures:
+            raise OSError(self.error, 'Remote I/O error')
+        return super(FlakyDriver, self).readBlock(address, commandCode, nBytes)
+
+def _gps(driver, retries=3):
+    gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=driver)
+    gps.use_rdwr = False
+    gps.retry_policy = qwiic_titan_gps.RetryPolicy(retries, backoff=0.001, seed=1) \
+        if retries else None
+    gps.enable_metrics()
+    return gps
+
+def test_retry_recovers_mid_read():
+    driver = FlakyDriver([GGA], failures=[1])
+    gps = _gps(driver)
+
+    data = bytes(gps.read_raw_bytes())
+
+    assert data.rstrip(b'\n') == GGA.encode().rstrip(b'\n')
+    assert gps.metrics.retries == 1
+    assert gps.metrics.bus_errors == 1
+    assert gps.metrics.error_seconds > 0
+    assert gps.metrics.failed_reads == 0
+    assert gps.last_bus_error is None
+    assert gps.breaker.failures == 0
+
+def test_partial_read_is_kept():
+    driver = FlakyDriver([GGA], failures=[2])
+    gps = _gps(driver, retries=0)
+
+    data = bytes(gps.read_raw_bytes())
+
+    assert data == GGA.encode()[:64]
+    assert isinstance(gps.last_bus_error, OSError)
+    assert gps.metrics.failed_reads == 1
+    assert gps.metrics.retries == 0
+    assert gps.breaker.failures == 1
+
+def test_nothing_read_raises_only_without_breaker():
+    gps = _gps(FlakyDriver([GGA], failures=[0, 1]), retries=0)
+    assert bytes(gps.read_raw_bytes()) == b''
+    assert gps.breaker.failures == 1
+
+    gps = _gps(FlakyDriver([GGA], failures=[0]), retries=0)
+    gps.breaker = None
+    with pytest.raises(OSError):
+        gps.read_raw_bytes()
+
+def test_permanent_errors_are_not_retried():
+    driver = FlakyDriver([GGA], failures=[0], error=errno.EINVAL)
+    gps = _gps(driver)
+
+    assert bytes(gps.read_raw_bytes()) == b''
+    assert driver.calls == 1
+    assert gps.metrics.retries == 0
+
+def test_retry_delay_backs_off():
+    policy = qwiic_titan_gps.RetryPolicy(backoff=0.001, max_backoff=0.004, jitter=0.5, seed=1)
+    delays = [policy.delay(attempt) for attempt in range(1, 6)]
+
+    for attempt, delay in enumerate(delays, 1):
+        ceiling = min(0.001 * 2 ** (attempt - 1), 0.004)
+        assert ceiling / 2 <= delay <= ceiling
+
+def test_breaker_opens_probes_and_closes():
+    driver = FlakyDriver([GGA], failures=range(0, 3))
+    gps = _gps(driver, retries=0)
+    breaker = gps.breaker = qwiic_titan_gps.CircuitBreaker(failure_threshold=3,
+                                                           reset_timeout=60.0)
+
+    for _ in range(3):
+        assert gps.poll(wait=False) == []
+    assert breaker.state == breaker.OPEN
+    assert breaker.trips == 1
+    # poll() leaves the device alone until the probe is due.
+    assert gps._next_epoch >= breaker.next_probe
+
+    calls = driver.calls
+    assert gps.poll(wait=False) == []
+    assert driver.calls == calls
+    assert gps.metrics.skipped_reads >= 1
+
+    # The probe is a single block, and closes the breaker when it works.
+    breaker.next_probe = 0
+    data = bytes(gps.read_raw_bytes())
+    assert data == GGA.encode()[:gps.MAX_I2C_BUFFER]
+    assert breaker.state == breaker.CLOSED
+    assert breaker.failures == 0
+
+def test_failed_probe_doubles_the_wait():
+    breaker = qwiic_titan_gps.CircuitBreaker(failure_threshold=1, reset_timeout=1.0,
+                                             max_timeout=3.0)
+    breaker.failure(10.0)
+    assert breaker.state == breaker.OPEN
+    assert breaker.next_probe == 11.0
+    assert not breaker.allow(10.5)
+
+    for now, wait in ((11.0, 2.0), (13.0, 3.0), (16.0, 3.0)):
+        assert breaker.allow(now)
+        assert breaker.state == breaker.HALF_OPEN
+        breaker.failure(now)
+        assert breaker.next_probe == now + wait
+
+    assert breaker.trips == 4
@@ -0,0 +1,85 @@
+import pytest
+
+import qwiic_titan_gps
+from conftest import sentence
+
+PART1 = sentence('GPGSV,2,1,06,01,40,083,46,02,17,308,41,12,07,344,39,14,22,228,45').strip()
+PART2 = sentence('GPGSV,2,2,06,15,10,010,,16,,020,30').strip()
+GLONASS = sentence('GLGSV,1,1,02,65,30,100,20,66,40,200,').strip()
+
+@pytest.fixture(params=[True, False], ids=['fast', 'pynmea2'])
+def parse(request):
+    if not request.param:
+        pytest.importorskip('pynmea2')
+    return lambda line: qwiic_titan_gps.parse_nmea(line, request.param)
+
+def test_parts_assemble_across_calls(parse):
+    table = qwiic_titan_gps.SatelliteTable()
+
+    assert not table.update(parse(PART1), 10)
+    assert table.snapshot == {}
+    assert table.update(parse(PART2), 20)
+
+    group = table.snapshot['GP']
+    assert list(group.prn) == [1, 2, 12, 14, 15, 16]
+    assert list(group.elevation) == [40, 17, 7, 22, 10, -1]
+    assert list(group.snr) == [46, 41, 39, 45, -1, 30]
+    assert group.in_view == 6
+    assert group.mean_snr == pytest.approx((46 + 41 + 39 + 45 + 30) / 5.0)
+    assert group.received_ns == 20
+    assert table.groups_completed == 1
+
+def test_missing_and_out_of_order_parts_are_dropped(parse):
+    table = qwiic_titan_gps.SatelliteTable()
+
+    # Part 1 twice: the first group never finished.
+    table.update(parse(PART1))
+    table.update(parse(PART1))
+    assert table.groups_dropped == 1
+
+    # Part 2 with no part 1 before it is skipped, not published.
+    table = qwiic_titan_gps.SatelliteTable()
+    assert not table.update(parse(PART2))
+    assert table.snapshot == {}
+    assert table.groups_dropped == 0
+
+    # Part 1, then part 3 of 3: part 2 went missing.
+    third = sentence('GPGSV,3,3,09,20,10,010,30').strip()
+    first = sentence('GPGSV,3,1,09,01,40,083,46').strip()
+    table.update(parse(first))
+    assert not table.update(parse(third))
+    assert table.groups_dropped == 1
+    assert table.snapshot == {}
+
+def test_tracking_nothing(parse):
+    table = qwiic_titan_gps.SatelliteTable()
+    table.update(parse(sentence('GPGSV,1,1,02,01,40,083,,02,17,308,').strip()))
+
+    group = table.snapshot['GP']
+    assert list(group.snr) == [-1, -1]
+    assert group.mean_snr is None
+
+def test_snapshot_is_immutable_across_publishes(parse):
+    table = qwiic_titan_gps.SatelliteTable()
+    table.update(parse(PART1))
+    table.update(parse(PART2))
+    before = table.snapshot
+    gps_group = before['GP']
+    prns = list(gps_group.prn)
+
+    table.update(parse(GLONASS))
+    table.update(parse(sentence('GPGSV,1,1,01,30,50,050,50').strip()))
+
+    assert before is not table.snapshot
+    assert list(before) == ['GP']
+    assert list(gps_group.prn) == prns
+    assert list(table.snapshot['GP'].prn) == [30]
+    assert list(table.snapshot['GL'].prn) == [65, 66]
+    with pytest.raises(TypeError):
+        before['GL'] = None
+
+def test_gsv_reaches_gnss_messages():
+    gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=qwiic_titan_gps.ReplayI2CDriver(b''))
+    gps.parse_sentences([PART1, PART2])
+
+    assert list(gps.latest_fix['Satellites']['GP'].prn) == [1, 2, 12, 14, 15, 16]
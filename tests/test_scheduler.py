@@ -0,0 +1,90 @@
+import time
+
+import pytest
+
+import qwiic_titan_gps
+from conftest import FakeDriver, GGA
+
+class LoggedDriver(FakeDriver):
+
+    # Notes each read in a log shared by every driver on the "bus".
+    def __init__(self, name, log, bursts=()):
+        super(LoggedDriver, self).__init__(bursts)
+        self.name = name
+        self.log = log
+
+    def readBlock(self, address, commandCode, nBytes):
+        self.log.append(self.name)
+        return super(LoggedDriver, self).readBlock(address, commandCode, nBytes)
+
+def _gps(driver, address=0x10):
+    gps = qwiic_titan_gps.QwiicTitanGps(address=address, i2c_driver=driver)
+    gps.use_rdwr = False
+    return gps
+
+def test_one_block_per_device_per_run():
+    log = []
+    first = _gps(LoggedDriver('a', log, [GGA * 3]), 0x10)
+    second = _gps(LoggedDriver('b', log, [GGA]), 0x11)
+    scheduler = qwiic_titan_gps.QwiicBusScheduler([first, second])
+
+    assert scheduler.run_once() == 2
+    assert scheduler.run_once() == 2
+    assert sorted(log) == ['a', 'a', 'b', 'b']
+
+    # Run until both bursts are done; the long one never blocks the other.
+    while scheduler.run_once():
+        pass
+    assert log[:6].count('a') == log[:6].count('b') == 3
+    assert first.fixes_read == 3
+    assert second.fixes_read == 1
+
+def test_rate_sets_the_interval():
+    fast = _gps(FakeDriver([GGA]), 0x10)
+    slow = _gps(FakeDriver([GGA]), 0x11)
+    fast.update_interval = slow.update_interval = 1.0
+    scheduler = qwiic_titan_gps.QwiicBusScheduler()
+    scheduler.add_device(fast, rate=20)
+    scheduler.add_device(slow)
+
+    started = time.monotonic()
+    while scheduler.run_once():
+        pass
+    fast_device, slow_device = scheduler._devices
+
+    assert fast_device.next_due - started == pytest.approx(0.05, abs=0.02)
+    assert slow_device.next_due - started == pytest.approx(1.0, abs=0.02)
+    assert scheduler.next_due() == fast_device.next_due
+
+def test_for_devices_groups_by_driver():
+    shared = FakeDriver()
+    devices = [_gps(shared, 0x10), _gps(FakeDriver(), 0x10), _gps(shared, 0x11)]
+
+    schedulers = qwiic_titan_gps.QwiicBusScheduler.for_devices(devices)
+
+    groups = sorted(([devices.index(gps) for gps in group] for group in
+                     ([device.gps for device in scheduler._devices] for scheduler in schedulers)))
+    assert groups == [[0, 2], [1]]
+
+def test_stats():
+    first = _gps(FakeDriver([GGA * 2]), 0x10)
+    second = _gps(FakeDriver([GGA]), 0x11)
+    scheduler = qwiic_titan_gps.QwiicBusScheduler([first, second])
+
+    with scheduler:
+        deadline = time.monotonic() + 2.0
+        while second.fixes_read < 1 or first.fixes_read < 2:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        stats = scheduler.stats()
+
+    devices = stats['devices']
+    assert devices[0x10]['fixes'] == 2
+    assert devices[0x11]['fixes'] == 1
+    assert devices[0x10]['bytes'] == first.bus_bytes_read
+    assert devices[0x10]['transactions'] >= 5
+    assert devices[0x10]['bursts'] >= 1
+    assert sum(device['bus_share'] for device in devices.values()) == pytest.approx(1.0)
+    assert sum(device['busy_time'] for device in devices.values()) == \
+        pytest.approx(stats['busy_time'])
+    assert 0.0 < stats['bus_utilization'] <= 1.0
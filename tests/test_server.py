@@ -0,0 +1,65 @@
+import asyncio
+import socket
+
+import qwiic_titan_gps
+from conftest import GGA, RMC
+
+async def _client(port, seconds, counts):
+
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    end = asyncio.get_event_loop().time() + seconds
+    while asyncio.get_event_loop().time() < end:
+        data = await reader.read(65536)
+        if not data:
+            break
+        counts.append(data.count(b'\n'))
+    writer.close()
+
+def _stalled_client(port):
+
+    # Connects and never reads, so the server's buffer for it fills up.
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    sock.connect(('127.0.0.1', port))
+    return sock
+
+async def _serve(clients, seconds):
+
+    driver = qwiic_titan_gps.ReplayI2CDriver(((GGA + RMC) * 20).encode(), loop=True)
+    gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver=driver)
+    gps.update_interval = 0
+    server = qwiic_titan_gps.NmeaServer(gps, tcp=('127.0.0.1', 0), queue_size=4)
+    await server.start()
+    port = server.addresses[0][1]
+
+    stalled = _stalled_client(port)
+    while not server._clients:
+        await asyncio.sleep(0.01)
+    # Keep the kernel from soaking up more than a little of its data.
+    for client in server._clients:
+        client.writer.get_extra_info('socket').setsockopt(
+            socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+
+    counts = [[] for _ in range(clients)]
+    try:
+        await asyncio.gather(*[_client(port, seconds, count) for count in counts])
+        stats = server.stats()
+        await asyncio.wait_for(server.close(), 5.0)
+    finally:
+        stalled.close()
+        server.gps.close()
+
+    return server, stats, counts
+
+def test_many_clients_and_a_stalled_one():
+    loop = asyncio.new_event_loop()
+    try:
+        server, stats, counts = loop.run_until_complete(_serve(20, 1.0))
+    finally:
+        loop.close()
+
+    assert all(sum(count) > 0 for count in counts)
+    assert server.payloads > 0
+    # The stalled client falls behind and loses data; the rest keep up.
+    assert max(client['dropped'] for client in stats) > 0
+    assert server.stats() == []
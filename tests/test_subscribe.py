@@ -0,0 +1,76 @@
+import asyncio
+import queue
+import time
+
+import qwiic_titan_gps
+from conftest import FakeDriver, GGA, sentence
+
+LATER = sentence('GPGGA,123520.00,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,')
+
+def _gps(bursts=()):
+    return qwiic_titan_gps.QwiicTitanGps(i2c_driver=FakeDriver(bursts))
+
+def test_full_queue_drops():
+    gps = _gps()
+    fixes = queue.Queue(1)
+    subscription = gps.subscribe(fixes, fields=('Time',))
+    gps.parse_sentences([GGA])
+    gps.parse_sentences([LATER])
+
+    assert fixes.qsize() == 1
+    assert subscription.dropped == 1
+
+def test_failing_handlers_are_counted():
+    gps = _gps()
+    def handler(fix, changes):
+        raise ValueError('handler')
+    failing = gps.subscribe(handler, fields=('Time',))
+    bad_key = gps.subscribe(lambda fix, changes: None, key=lambda fix: fix['Missing'])
+    seen = []
+    gps.subscribe(lambda fix, changes: seen.append(fix['Time']), fields=('Time',))
+
+    gps.parse_sentences([GGA])
+
+    assert failing.errors == 1
+    assert isinstance(failing.last_error, ValueError)
+    assert bad_key.errors == 1
+    assert len(seen) == 1
+
+def test_reader_survives_a_failing_handler():
+    # A padding only block ends each poll, so the epochs are read apart.
+    gps = _gps([GGA, '\n' * 32, LATER])
+    def handler(fix, changes):
+        raise ValueError('handler')
+    failing = gps.subscribe(handler, fields=('Time',))
+    gps.update_interval = 0.01
+
+    with gps:
+        deadline = time.monotonic() + 2.0
+        while failing.errors < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert gps.running
+
+    assert failing.errors == 2
+
+def test_full_asyncio_queue_drops():
+    gps = _gps()
+    loop = asyncio.new_event_loop()
+
+    async def _check():
+        fixes = asyncio.Queue(1)
+        subscription = gps.subscribe(fixes, fields=('Time',))
+        # Parse on another thread, as the background reader does.
+        await loop.run_in_executor(None, gps.parse_sentences, [GGA])
+        await loop.run_in_executor(None, gps.parse_sentences, [LATER])
+        await asyncio.sleep(0.01)
+        return fixes, subscription
+
+    try:
+        fixes, subscription = loop.run_until_complete(_check())
+    finally:
+        loop.close()
+
+    assert fixes.qsize() == 1
+    assert fixes.get_nowait()[0]['Time'].second == 19
+    assert subscription.dropped == 1
+    assert subscription.errors == 0